@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, List, Optional
 
-from ..content_blocks import BenefitsBlock, ComparisonBlock, IngredientsBlock, SafetyBlock, UsageBlock
-from ..core import Agent, Blackboard, Message
+from ..content_blocks import BaseContentBlock, BenefitsBlock, ComparisonBlock, IngredientsBlock, SafetyBlock, UsageBlock
+from ..core import Agent, Blackboard, ContentCache, Message
 from ..models import ContentBlock, ProductData
 
 
 class _BaseBlockAgent(Agent):
     block_type: str
+    parallel_safe = True
+
+    def __init__(self, block: BaseContentBlock, cache: Optional[ContentCache] = None):
+        self._block = block
+        self._cache = cache
+
+    def _process(self, product: ProductData, **kwargs: Any) -> ContentBlock:
+        if self._cache is None:
+            return self._block.process(product, **kwargs)
+        key = self._cache.key(f"block:{self._block.block_type}", self._block.version, self._block.get_rules(), product, kwargs)
+        return self._cache.get_or_compute(key, lambda: self._block.process(product, **kwargs))
 
     def _store(self, blackboard: Blackboard, block: ContentBlock, message: Message) -> List[Message]:
         blackboard.put(f"block:{self.block_type}", block, producer=self.name)
@@ -18,73 +29,78 @@ class _BaseBlockAgent(Agent):
 class BenefitsAgent(_BaseBlockAgent):
     name = "BenefitsAgent"
     block_type = "benefits"
+    subscriptions = ("generate_block:benefits",)
 
-    def __init__(self):
-        self._block = BenefitsBlock()
+    def __init__(self, cache: Optional[ContentCache] = None):
+        super().__init__(BenefitsBlock(), cache)
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type == "generate_block:benefits" and blackboard.has("product_data") and not blackboard.has("block:benefits")
 
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         product: ProductData = blackboard.get("product_data")
-        block = self._block.process(product)
+        block = self._process(product)
         return self._store(blackboard, block, message)
 
 
 class UsageAgent(_BaseBlockAgent):
     name = "UsageAgent"
     block_type = "usage"
+    subscriptions = ("generate_block:usage",)
 
-    def __init__(self):
-        self._block = UsageBlock()
+    def __init__(self, cache: Optional[ContentCache] = None):
+        super().__init__(UsageBlock(), cache)
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type == "generate_block:usage" and blackboard.has("product_data") and not blackboard.has("block:usage")
 
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         product: ProductData = blackboard.get("product_data")
-        block = self._block.process(product)
+        block = self._process(product)
         return self._store(blackboard, block, message)
 
 
 class IngredientsAgent(_BaseBlockAgent):
     name = "IngredientsAgent"
     block_type = "ingredients"
+    subscriptions = ("generate_block:ingredients",)
 
-    def __init__(self):
-        self._block = IngredientsBlock()
+    def __init__(self, cache: Optional[ContentCache] = None):
+        super().__init__(IngredientsBlock(), cache)
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type == "generate_block:ingredients" and blackboard.has("product_data") and not blackboard.has("block:ingredients")
 
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         product: ProductData = blackboard.get("product_data")
-        block = self._block.process(product)
+        block = self._process(product)
         return self._store(blackboard, block, message)
 
 
 class SafetyAgent(_BaseBlockAgent):
     name = "SafetyAgent"
     block_type = "safety"
+    subscriptions = ("generate_block:safety",)
 
-    def __init__(self):
-        self._block = SafetyBlock()
+    def __init__(self, cache: Optional[ContentCache] = None):
+        super().__init__(SafetyBlock(), cache)
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type == "generate_block:safety" and blackboard.has("product_data") and not blackboard.has("block:safety")
 
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         product: ProductData = blackboard.get("product_data")
-        block = self._block.process(product)
+        block = self._process(product)
         return self._store(blackboard, block, message)
 
 
 class ComparisonAgent(_BaseBlockAgent):
     name = "ComparisonAgent"
     block_type = "comparison"
+    subscriptions = ("generate_block:comparison",)
 
-    def __init__(self):
-        self._block = ComparisonBlock()
+    def __init__(self, cache: Optional[ContentCache] = None):
+        super().__init__(ComparisonBlock(), cache)
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return (
@@ -97,5 +113,5 @@ class ComparisonAgent(_BaseBlockAgent):
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         product: ProductData = blackboard.get("product_data")
         competitor = blackboard.get("competitor_product")
-        block = self._block.process(product, comparison_product=competitor)
+        block = self._process(product, comparison_product=competitor)
         return self._store(blackboard, block, message)
@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..core import Agent, Blackboard, Message
-from ..models import ContentBlock, ProductData, Question
+from ..core import Agent, Blackboard, CompiledPlan, ContentCache, Message
+from ..models import ContentBlock, GeneratedPage, ProductData, Question
 from ..templates import TemplateEngine
+from .planner_agent import PIPELINE_PLAN
 
 
 class PageRenderAgent(Agent):
     name = "PageRenderAgent"
+    subscriptions = ("render_page:*",)
+    parallel_safe = True
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ContentCache] = None, plan: CompiledPlan = PIPELINE_PLAN):
         self._engine = TemplateEngine()
+        self._cache = cache
+        # Block keys each page declares as inputs in the plan, in plan order;
+        # only those are built and passed to its template.
+        self._blocks: Dict[str, Tuple[str, ...]] = {
+            node.message_type.split(":", 1)[1]: tuple(key for key in node.inputs if key.startswith("block:"))
+            for node in plan.nodes
+            if node.message_type is not None and node.message_type.startswith("render_page:")
+        }
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         if not message.type.startswith("render_page:"):
@@ -24,28 +35,32 @@ class PageRenderAgent(Agent):
         page_type = message.type.split(":", 1)[1]
         product: ProductData = blackboard.get("product_data")
 
-        blocks: List[ContentBlock] = [
-            blackboard.get("block:benefits"),
-            blackboard.get("block:usage"),
-            blackboard.get("block:ingredients"),
-            blackboard.get("block:safety"),
-        ]
-
-        if page_type == "comparison":
-            blocks.append(blackboard.get("block:comparison"))
+        blocks: List[ContentBlock] = [blackboard.get(key) for key in self._blocks.get(page_type, ())]
 
         # Questions are only required for FAQ
         additional = {"product_data": product}
         if page_type == "faq":
             additional["questions"] = blackboard.get("questions", [])
+            if blackboard.has("faq_answers"):
+                # Seeded by incremental regeneration for categories whose inputs did not change.
+                additional["reuse_answers"] = blackboard.get("faq_answers")
 
-        page = self._engine.render_page(template_name=page_type, content_blocks=blocks, **additional)
+        page = self._render(page_type, blocks, additional)
 
         # Store exactly the JSON content schema under the output filename key
         output_key = self._output_key(page_type)
         blackboard.put(output_key, page.content, producer=self.name)
         return [Message(type="artifact_created", payload={"key": output_key}, source=self.name, trace_id=message.trace_id)]
 
+    def _render(self, page_type: str, blocks: List[ContentBlock], additional: Dict[str, Any]) -> GeneratedPage:
+        if self._cache is None:
+            return self._engine.render_page(template_name=page_type, content_blocks=blocks, **additional)
+        template = self._engine.get_template(page_type)
+        key = self._cache.key(f"template:{template.name}", template.version, blocks, additional)
+        return self._cache.get_or_compute(
+            key, lambda: self._engine.render_page(template_name=page_type, content_blocks=blocks, **additional)
+        )
+
     def _output_key(self, page_type: str) -> str:
         if page_type == "faq":
             return "faq.json"
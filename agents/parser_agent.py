@@ -1,37 +1,56 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Dict, List
 
 from ..core import Agent, Blackboard, Message
 from ..models import ProductData
 
 
+# ProductData field -> raw record column. List fields are comma separated.
+FIELD_MAP: Dict[str, str] = {
+    "name": "Product Name",
+    "concentration": "Concentration",
+    "skin_types": "Skin Type",
+    "key_ingredients": "Key Ingredients",
+    "benefits": "Benefits",
+    "usage_instructions": "How to Use",
+    "side_effects": "Side Effects",
+    "price": "Price",
+}
+LIST_FIELDS = frozenset({"skin_types", "key_ingredients", "benefits"})
+
+
+def _split_list(value: Any) -> List[str]:
+    # Skin types, ingredients and benefits repeat across a catalog; interning
+    # keeps one copy of each string however many products hold it.
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [sys.intern(str(v).strip()) for v in value if str(v).strip()]
+    return [sys.intern(v.strip()) for v in str(value).split(",") if v.strip()]
+
+
+def parse_product(raw: Dict[str, Any]) -> ProductData:
+    """Map a raw product record onto ProductData."""
+    values = {
+        attr: _split_list(raw.get(column, "")) if attr in LIST_FIELDS else str(raw.get(column, ""))
+        for attr, column in FIELD_MAP.items()
+    }
+    return ProductData(**values)
+
+
 class ParserAgent(Agent):
     name = "ParserAgent"
+    subscriptions = ("parse_product",)
+    parallel_safe = True
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type == "parse_product" and blackboard.has("raw_product_data") and not blackboard.has("product_data")
 
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         raw: Dict[str, Any] = blackboard.get("raw_product_data")
-
-        def _split_list(value: Any) -> List[str]:
-            if value is None:
-                return []
-            if isinstance(value, list):
-                return [str(v).strip() for v in value if str(v).strip()]
-            return [v.strip() for v in str(value).split(",") if v.strip()]
-
-        product = ProductData(
-            name=str(raw.get("Product Name", "")),
-            concentration=str(raw.get("Concentration", "")),
-            skin_types=_split_list(raw.get("Skin Type", "")),
-            key_ingredients=_split_list(raw.get("Key Ingredients", "")),
-            benefits=_split_list(raw.get("Benefits", "")),
-            usage_instructions=str(raw.get("How to Use", "")),
-            side_effects=str(raw.get("Side Effects", "")),
-            price=str(raw.get("Price", "")),
-        )
+        product = parse_product(raw)
 
         blackboard.put("product_data", product, producer=self.name)
         return [Message(type="artifact_created", payload={"key": "product_data"}, source=self.name, trace_id=message.trace_id)]
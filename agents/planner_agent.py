@@ -1,12 +1,81 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
-
-from ..core import Agent, Blackboard, Message
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+from ..core import Agent, ArtifactLifetimes, Blackboard, CompiledPlan, Message, PlanNode, to_jsonable
+
+_BASE_BLOCKS = ("benefits", "usage", "ingredients", "safety")
+_BASE_BLOCK_KEYS = tuple(f"block:{b}" for b in _BASE_BLOCKS)
+
+# parse -> blocks -> comparison -> questions -> pages -> graph, expressed as
+# data dependencies. Pages and the graph are sinks, and only what the
+# Blackboard.goals depend on is built: a faq.json-only run parses and asks
+# questions but builds no blocks. The graph is final so it sees the whole run.
+PIPELINE_PLAN = CompiledPlan(
+    [
+        PlanNode("parse", inputs=("raw_product_data",), outputs=("product_data",), message_type="parse_product"),
+        *(
+            PlanNode(f"block:{b}", inputs=("product_data",), outputs=(f"block:{b}",), message_type=f"generate_block:{b}")
+            for b in _BASE_BLOCKS
+        ),
+        PlanNode("competitor", outputs=("competitor_product",)),
+        PlanNode(
+            "block:comparison",
+            inputs=("product_data", "competitor_product"),
+            outputs=("block:comparison",),
+            message_type="generate_block:comparison",
+        ),
+        PlanNode("questions", inputs=("product_data",), outputs=("questions",), message_type="generate_questions"),
+        PlanNode(
+            "page:faq",
+            inputs=("product_data", "questions"),
+            outputs=("faq.json",),
+            message_type="render_page:faq",
+            sink=True,
+        ),
+        PlanNode(
+            "page:product",
+            inputs=("product_data", *_BASE_BLOCK_KEYS),
+            outputs=("product_page.json",),
+            message_type="render_page:product",
+            sink=True,
+        ),
+        PlanNode(
+            "page:comparison",
+            inputs=("product_data", "block:comparison"),
+            outputs=("comparison_page.json",),
+            message_type="render_page:comparison",
+            sink=True,
+        ),
+        PlanNode("graph", outputs=("graph.json",), message_type="build_graph", sink=True, final=True),
+    ]
+)
+
+
+@dataclass
+class _PlanState:
+    scheduled: Set[str] = field(default_factory=set)
+    # Dispatched nodes whose outputs have not all arrived yet.
+    outstanding: Set[str] = field(default_factory=set)
+    # Inputs still missing per node, and nodes whose count just reached zero.
+    missing: Dict[str, int] = field(default_factory=dict)
+    ready: List[str] = field(default_factory=list)
+    available: Set[str] = field(default_factory=set)
+    # Nodes whose outputs have all arrived.
+    done: Set[str] = field(default_factory=set)
+    # Nodes the board's goals depend on; nothing else is scheduled.
+    required: FrozenSet[str] = frozenset()
 
 
 class PlannerAgent(Agent):
     name = "PlannerAgent"
+    subscriptions = ("start", "plan", "artifact_created")
+
+    def __init__(self, plan: CompiledPlan = PIPELINE_PLAN, lifetimes: Optional[ArtifactLifetimes] = None):
+        self.plan = plan
+        # Release intermediates once consumed; off by default so boards keep every artifact.
+        self.lifetimes = lifetimes
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type in {"start", "plan", "artifact_created"}
@@ -26,62 +95,121 @@ class PlannerAgent(Agent):
             out.append(Message(type="plan", payload={}, source=self.name, trace_id=message.trace_id))
             return out
 
-        # On any update, re-plan what to do next
+        # Blackboard subscriptions keep per-node input counts current, so an
+        # update only has to release the nodes whose count just reached zero.
         # This is the core "dynamic coordination" behavior.
-        if not blackboard.has("product_data") and blackboard.has("raw_product_data"):
-            out.append(Message(type="parse_product", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
-
-        # Ensure base blocks exist
-        for block_type in ["benefits", "usage", "ingredients", "safety"]:
-            if not blackboard.has(f"block:{block_type}") and blackboard.has("product_data"):
-                out.append(Message(type=f"generate_block:{block_type}", payload={}, source=self.name, trace_id=message.trace_id))
-                return out
-
-        # Comparison block depends on competitor data; if none provided, planner requests a fictional competitor
-        if not blackboard.has("competitor_product"):
-            if blackboard.get("competitor_data"):
-                blackboard.put("competitor_product", blackboard.get("competitor_data"), producer=self.name)
-            else:
-                blackboard.put(
-                    "competitor_product",
-                    {
-                        "name": "CitraGlow Serum B",
-                        "concentration": "15% Vitamin C",
-                        "skin_types": ["Normal", "Dry"],
-                        "key_ingredients": ["Vitamin C", "Niacinamide"],
-                        "benefits": ["Brightening", "Evens skin tone"],
-                        "price": "₹899",
-                        "fictional": True,
-                    },
-                    producer=self.name,
+        state: Optional[_PlanState] = blackboard.agent_state.get(self.name)
+        if state is None:
+            state = self._track(blackboard)
+        return self._release(state, blackboard, message)
+
+    def _track(self, blackboard: Blackboard) -> _PlanState:
+        state = _PlanState(required=self.plan.required(blackboard.goals))
+        blackboard.agent_state[self.name] = state
+
+        keys: Set[str] = set()
+        for node in self.plan.nodes:
+            keys.update(node.inputs)
+            keys.update(node.outputs)
+        state.available = {key for key in keys if blackboard.has(key)}
+        state.done = {node.name for node in self.plan.nodes if all(key in state.available for key in node.outputs)}
+
+        for node in self.plan.nodes:
+            state.missing[node.name] = sum(1 for key in node.inputs if key not in state.available)
+            if state.missing[node.name] == 0 and not node.final:
+                state.ready.append(node.name)
+        for key in sorted(keys - state.available):
+            blackboard.subscribe(key, self._on_put)
+        return state
+
+    def _on_put(self, blackboard: Blackboard, key: str, value: Any) -> None:
+        state: _PlanState = blackboard.agent_state[self.name]
+        if value is None or key in state.available:
+            return
+        state.available.add(key)
+        blackboard.unsubscribe(key, self._on_put)
+
+        for node in self.plan.consumers(key):
+            state.missing[node.name] -= 1
+            if state.missing[node.name] == 0 and not node.final:
+                state.ready.append(node.name)
+        producer = self.plan.producer(key)
+        if producer is not None and all(k in state.available for k in producer.outputs):
+            state.outstanding.discard(producer.name)
+            state.done.add(producer.name)
+            if self.lifetimes is not None:
+                self._expire(producer, state, blackboard)
+
+    def _expire(self, node: PlanNode, state: _PlanState, blackboard: Blackboard) -> None:
+        # The keys node just read or wrote are the only ones whose last
+        # pending reader can have been node itself.
+        lifetimes = self.lifetimes
+        for key in node.inputs + node.outputs:
+            if key in blackboard.goals or key in lifetimes.pinned or key not in blackboard.artifacts:
+                continue
+            if any(self._pending(consumer, state) for consumer in self.plan.consumers(key)):
+                continue
+            value = blackboard.release(key, producer=self.name)
+            if lifetimes.spill is not None:
+                lifetimes.spill.write(
+                    {"event": "artifact_spilled", "key": key, "value": to_jsonable(value), "trace_id": blackboard.event_log.trace_id}
                 )
 
-        if not blackboard.has("block:comparison") and blackboard.has("product_data"):
-            out.append(Message(type="generate_block:comparison", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
-
-        # Ensure questions exist
-        if not blackboard.has("questions") and blackboard.has("product_data"):
-            out.append(Message(type="generate_questions", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
+    def _pending(self, node: PlanNode, state: _PlanState) -> bool:
+        # Will run, and has not produced its outputs yet.
+        return node.name in state.required and node.name not in state.done
 
-        # Render pages based on goals (schemas preserved)
-        # Each render will produce a page content dict stored under the output filename key.
-        if "faq.json" in blackboard.goals and not blackboard.has("faq.json"):
-            out.append(Message(type="render_page:faq", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
+    def _release(self, state: _PlanState, blackboard: Blackboard, message: Message) -> List[Message]:
+        out: List[Message] = []
+        while state.ready:
+            # Release each wave in declaration order so runs are reproducible.
+            wave = sorted({self.plan.node(name) for name in state.ready}, key=self.plan.index)
+            state.ready.clear()
+            for node in wave:
+                if not self._ready(node, state, blackboard):
+                    continue
+                state.scheduled.add(node.name)
+                if node.message_type is None:
+                    # Resolved in place; the puts feed state.ready via _on_put.
+                    self._resolve(node, blackboard)
+                else:
+                    state.outstanding.add(node.name)
+                    out.append(Message(type=node.message_type, payload={}, source=self.name, trace_id=message.trace_id))
+
+        if not state.outstanding:
+            for node in self.plan.final_nodes:
+                if self._ready(node, state, blackboard):
+                    state.scheduled.add(node.name)
+                    state.outstanding.add(node.name)
+                    out.append(Message(type=node.message_type, payload={}, source=self.name, trace_id=message.trace_id))
 
-        if "product_page.json" in blackboard.goals and not blackboard.has("product_page.json"):
-            out.append(Message(type="render_page:product", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
+        return out
 
-        if "comparison_page.json" in blackboard.goals and not blackboard.has("comparison_page.json"):
-            out.append(Message(type="render_page:comparison", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
+    def _ready(self, node: PlanNode, state: _PlanState, blackboard: Blackboard) -> bool:
+        if node.name in state.scheduled or state.missing[node.name]:
+            return False
+        if all(key in state.available for key in node.outputs):
+            return False
+        return node.name in state.required
 
-        if "graph.json" in blackboard.goals and not blackboard.has("graph.json"):
-            out.append(Message(type="build_graph", payload={}, source=self.name, trace_id=message.trace_id))
-            return out
+    def _resolve(self, node: PlanNode, blackboard: Blackboard) -> None:
+        if node.name != "competitor":
+            raise ValueError(f"No inline resolver for plan node: {node.name}")
 
-        return out
+        # Comparison block depends on competitor data; if none provided, planner requests a fictional competitor
+        if blackboard.get("competitor_data"):
+            blackboard.put("competitor_product", blackboard.get("competitor_data"), producer=self.name)
+        else:
+            blackboard.put(
+                "competitor_product",
+                {
+                    "name": "CitraGlow Serum B",
+                    "concentration": "15% Vitamin C",
+                    "skin_types": ["Normal", "Dry"],
+                    "key_ingredients": ["Vitamin C", "Niacinamide"],
+                    "benefits": ["Brightening", "Evens skin tone"],
+                    "price": "₹899",
+                    "fictional": True,
+                },
+                producer=self.name,
+            )
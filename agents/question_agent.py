@@ -1,31 +1,88 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..core import Agent, Blackboard, Message
 from ..models import ProductData, Question, QuestionCategory
 
+_PLACEHOLDER = "{product_name}"
+
 
 class QuestionAgent(Agent):
     name = "QuestionAgent"
+    subscriptions = ("generate_questions",)
+    parallel_safe = True
+    # ProductData fields the generated questions depend on.
+    reads = frozenset({"name"})
 
-    def __init__(self):
-        self.question_templates = self._initialize_templates()
+    def __init__(self, question_templates: Optional[Dict[QuestionCategory, List[str]]] = None, cache_size: int = 1024):
+        self.question_templates = question_templates or self._initialize_templates()
+        # Each template is split once around the placeholder, so a product's
+        # text is one join; templates without it become one shared Question.
+        self._compiled: List[Tuple[QuestionCategory, Optional[Tuple[str, ...]], Optional[Question]]] = [
+            (category, tuple(template.split(_PLACEHOLDER)), None)
+            if _PLACEHOLDER in template
+            else (category, None, Question(text=template, category=category, answer_template=""))
+            for category, templates in self.question_templates.items()
+            for template in templates
+        ]
+        # Question lists by product name, least recently used first. The
+        # lists are shared between products and must be treated as read-only.
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[Question]]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         return message.type == "generate_questions" and blackboard.has("product_data") and not blackboard.has("questions")
 
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         product: ProductData = blackboard.get("product_data")
+        blackboard.put("questions", self.questions_for(product.name), producer=self.name)
+        return [Message(type="artifact_created", payload={"key": "questions"}, source=self.name, trace_id=message.trace_id)]
 
-        questions: List[Question] = []
-        for category, templates in self.question_templates.items():
-            for template in templates:
-                text = template.replace("{product_name}", product.name)
-                questions.append(Question(text=text, category=category, answer_template=""))
+    def questions_for(self, product_name: str) -> List[Question]:
+        """The question set for one product, shared with earlier products of the same name."""
+        with self._lock:
+            questions = self._cache.get(product_name)
+            if questions is not None:
+                self._cache.move_to_end(product_name)
+                return questions
+        questions = self._build(product_name)
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[product_name] = questions
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return questions
 
-        blackboard.put("questions", questions, producer=self.name)
-        return [Message(type="artifact_created", payload={"key": "questions"}, source=self.name, trace_id=message.trace_id)]
+    def generate_batch(self, product_names: Iterable[str]) -> List[List[Question]]:
+        """Question sets for many products in one call; repeated names share one list."""
+        built: Dict[str, List[Question]] = {}
+        out: List[List[Question]] = []
+        for name in product_names:
+            questions = built.get(name)
+            if questions is None:
+                questions = built[name] = self.questions_for(name)
+            out.append(questions)
+        return out
+
+    def _build(self, product_name: str) -> List[Question]:
+        return [
+            shared if fragments is None else Question(product_name.join(fragments), category, "")
+            for category, fragments, shared in self._compiled
+        ]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Shipped to worker processes without the name cache or its lock.
+        state = self.__dict__.copy()
+        state.update(_cache=OrderedDict(), _lock=None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def _initialize_templates(self) -> Dict[QuestionCategory, List[str]]:
         return {
@@ -0,0 +1,83 @@
+"""Many product pipelines gathered on one AsyncEventLoopOrchestrator.
+
+BenefitsAgent is replaced by an AsyncAgent that awaits ``--delay`` seconds
+before building its block, standing in for an I/O-bound LLM call. All other
+agents are the regular sync agents going through the executor adapter. Run
+from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_async --pipelines 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+import time
+from typing import List
+
+from ..agents import BenefitsAgent
+from ..content_blocks import BenefitsBlock
+from ..core import AgentRegistry, AsyncAgent, AsyncEventLoopOrchestrator, Blackboard, Message
+from ..run_pipeline import build_registry
+
+
+class AsyncStubBenefitsAgent(AsyncAgent):
+    name = "BenefitsAgent"
+    subscriptions = ("generate_block:benefits",)
+
+    def __init__(self, delay: float, max_concurrency: int = 0):
+        self._block = BenefitsBlock()
+        self._delay = delay
+        self.max_concurrency = max_concurrency or None
+
+    def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
+        return message.type == "generate_block:benefits" and blackboard.has("product_data") and not blackboard.has("block:benefits")
+
+    async def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+        await asyncio.sleep(self._delay)
+        blackboard.put("block:benefits", self._block.process(blackboard.get("product_data")), producer=self.name)
+        return [Message(type="artifact_created", payload={"key": "block:benefits"}, source=self.name, trace_id=message.trace_id)]
+
+
+def _start(index: int) -> List[Message]:
+    raw = {
+        "Product Name": f"Serum {index}",
+        "Concentration": "10% Vitamin C",
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699",
+    }
+    return [Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=f"p{index}")]
+
+
+async def _run_all(orchestrator: AsyncEventLoopOrchestrator, count: int, goals: List[str]) -> List[Blackboard]:
+    return await asyncio.gather(*(orchestrator.run(_start(i), goals) for i in range(count)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pipelines", type=int, default=1000)
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds the stub LLM call takes")
+    parser.add_argument("--limit", type=int, default=0, help="max concurrent stub calls (0 = unbounded)")
+    args = parser.parse_args()
+
+    registry = AgentRegistry()
+    for agent in build_registry().agents:
+        registry.register(AsyncStubBenefitsAgent(args.delay, args.limit) if isinstance(agent, BenefitsAgent) else agent)
+    orchestrator = AsyncEventLoopOrchestrator(registry)
+
+    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+    start = time.perf_counter()
+    boards = asyncio.run(_run_all(orchestrator, args.pipelines, goals))
+    elapsed = time.perf_counter() - start
+
+    done = sum(1 for bb in boards if bb.goals_satisfied())
+    print(f"pipelines: {done}/{args.pipelines} complete in {elapsed:.2f}s ({done / elapsed:.0f}/s)")
+    print(f"serial stub time would be >= {args.pipelines * args.delay:.1f}s; threads alive: {threading.active_count()}")
+
+
+if __name__ == "__main__":
+    main()
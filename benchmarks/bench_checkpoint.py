@@ -0,0 +1,56 @@
+"""Checkpoint overhead of stream_catalog across checkpoint intervals.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_checkpoint --products 2000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..core import CheckpointStore, EventLoopOrchestrator, Message
+from ..run_pipeline import build_registry
+from .synthetic import synthetic_catalog
+
+
+def _run(products: int, max_in_flight: int, checkpoint: Optional[CheckpointStore]) -> float:
+    orchestrator = EventLoopOrchestrator(build_registry())
+    messages = (
+        Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+        for trace_id, raw in synthetic_catalog(products)
+    )
+    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+    start = time.perf_counter()
+    finished = sum(1 for _ in orchestrator.stream_catalog(messages, goals, max_in_flight, checkpoint))
+    elapsed = time.perf_counter() - start
+    assert finished == products
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--intervals", type=int, nargs="+", default=[500, 2000, 10000, 50000])
+    args = parser.parse_args()
+
+    baseline = _run(args.products, args.max_in_flight, None)
+    print(f"{'interval':>9} {'seconds':>8} {'saves':>6} {'KB/save':>8} {'ms/save':>8} {'overhead':>9}")
+    print(f"{'off':>9} {baseline:>8.2f} {0:>6} {'-':>8} {'-':>8} {'-':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for interval in args.intervals:
+            store = CheckpointStore(Path(tmp) / f"catalog-{interval}.ckpt", interval)
+            elapsed = _run(args.products, args.max_in_flight, store)
+            per_save = store.seconds / store.saves * 1e3 if store.saves else 0.0
+            print(
+                f"{interval:>9} {elapsed:>8.2f} {store.saves:>6} {store.last_bytes / 1e3:>8.1f} "
+                f"{per_save:>8.1f} {store.seconds / elapsed:>9.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
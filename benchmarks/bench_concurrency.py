@@ -0,0 +1,80 @@
+"""Sequential vs concurrent orchestration when block generation is slow.
+
+Each base block agent is wrapped so that handle() first waits ``--delay``
+seconds, standing in for an LLM call through a local stub. Run from the
+directory containing the package:
+
+    python -m <package>.benchmarks.bench_concurrency
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+from ..agents import BenefitsAgent, IngredientsAgent, SafetyAgent, UsageAgent
+from ..core import AgentRegistry, Blackboard, ConcurrentEventLoopOrchestrator, EventLoopOrchestrator, Message
+from ..run_pipeline import build_registry
+
+_DELAY = 0.05
+
+
+def _slow(agent_cls):
+    class _Slow(agent_cls):
+        def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+            time.sleep(_DELAY)
+            return super().handle(message, blackboard)
+
+    _Slow.__name__ = _Slow.__qualname__ = f"Slow{agent_cls.__name__}"
+    globals()[_Slow.__name__] = _Slow  # picklable for the process pool
+    return _Slow
+
+
+_SLOW_AGENTS = [_slow(cls) for cls in (BenefitsAgent, UsageAgent, IngredientsAgent, SafetyAgent)]
+
+
+def _registry() -> AgentRegistry:
+    base = build_registry()
+    registry = AgentRegistry()
+    slow_by_name = {cls.name: cls for cls in _SLOW_AGENTS}
+    for agent in base.agents:
+        registry.register(slow_by_name[agent.name]() if agent.name in slow_by_name else agent)
+    return registry
+
+
+def _start() -> List[Message]:
+    raw = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C",
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699",
+    }
+    return [Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id="bench")]
+
+
+def main() -> None:
+    global _DELAY
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=_DELAY, help="seconds each base block takes")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    _DELAY = args.delay
+
+    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+    runs = [
+        ("sequential", EventLoopOrchestrator(_registry())),
+        ("thread", ConcurrentEventLoopOrchestrator(_registry(), "thread", args.workers)),
+        ("process", ConcurrentEventLoopOrchestrator(_registry(), "process", args.workers)),
+    ]
+    for label, orchestrator in runs:
+        start = time.perf_counter()
+        orchestrator.run(_start(), goals)
+        print(f"{label:>10}: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
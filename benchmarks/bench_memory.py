@@ -0,0 +1,97 @@
+"""Bytes per product for a catalog held in memory: slotted models + interning vs plain dataclasses.
+
+Each product is its start Message, parsed ProductData and generated Questions.
+The "before" side rebuilds the same objects from unslotted copies of the
+model classes without interning the parsed list values.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_memory --products 100000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..agents import QuestionAgent
+from ..agents.parser_agent import FIELD_MAP, LIST_FIELDS, parse_product
+from ..core import Message
+from ..models import ProductData, Question
+from .synthetic import synthetic_catalog
+
+
+def _unslotted(cls: type, **options: Any) -> type:
+    spec = []
+    for f in fields(cls):
+        if f.default_factory is not MISSING:
+            spec.append((f.name, f.type, field(default_factory=f.default_factory)))
+        elif f.default is not MISSING:
+            spec.append((f.name, f.type, field(default=f.default)))
+        else:
+            spec.append((f.name, f.type))
+    return make_dataclass(cls.__name__, spec, **options)
+
+
+_PlainMessage = _unslotted(Message, frozen=True)
+_PlainProductData = _unslotted(ProductData)
+_PlainQuestion = _unslotted(Question)
+
+
+def _plain_parse(raw: Dict[str, Any]) -> Any:
+    # parse_product before interning: a fresh string per list value.
+    values = {
+        attr: [v.strip() for v in str(raw.get(column, "")).split(",") if v.strip()]
+        if attr in LIST_FIELDS
+        else str(raw.get(column, ""))
+        for attr, column in FIELD_MAP.items()
+    }
+    return _PlainProductData(**values)
+
+
+def _build(
+    products: int,
+    message_cls: type,
+    parse: Callable[[Dict[str, Any]], Any],
+    question_cls: type,
+    templates: List[Tuple[Any, str]],
+) -> List[Any]:
+    catalog = []
+    for trace_id, raw in synthetic_catalog(products):
+        message = message_cls(type="start", payload={"raw_product_data": raw}, source="User", trace_id=trace_id)
+        product = parse(raw)
+        questions = [question_cls(text.replace("{product_name}", product.name), category) for category, text in templates]
+        catalog.append((message, product, questions))
+    return catalog
+
+
+def _measure(build: Callable[[], List[Any]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    catalog = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=100000)
+    args = parser.parse_args()
+
+    templates = [(category, text) for category, texts in QuestionAgent().question_templates.items() for text in texts]
+    before = _measure(lambda: _build(args.products, _PlainMessage, _plain_parse, _PlainQuestion, templates))
+    after = _measure(lambda: _build(args.products, Message, parse_product, Question, templates))
+
+    print(f"{'models':<24} {'MB':>8} {'bytes/product':>14}")
+    print(f"{'plain dataclasses':<24} {before / 1e6:>8.1f} {before / args.products:>14.0f}")
+    print(f"{'slots + interning':<24} {after / 1e6:>8.1f} {after / args.products:>14.0f}")
+    print(f"saved {1 - after / before:.0%}")
+
+
+if __name__ == "__main__":
+    main()
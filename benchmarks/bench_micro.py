@@ -0,0 +1,250 @@
+"""Microbenchmark suite for content blocks, templates and the core runtime, with JSON baselines.
+
+Inputs come from seeded synthetic products whose list lengths and string
+sizes are adjustable, so a baseline is reproducible from its recorded
+parameters. ``run`` prints ns/op per benchmark and can save the results;
+``compare`` flags benchmarks slower than a baseline by more than the
+threshold and exits non-zero if any are.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_micro run --out baseline.json
+    python -m <package>.benchmarks.bench_micro run --out current.json
+    python -m <package>.benchmarks.bench_micro compare baseline.json current.json --threshold 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..agents import QuestionAgent
+from ..agents.parser_agent import parse_product
+from ..content_blocks import BenefitsBlock, ComparisonBlock, IngredientsBlock, SafetyBlock, UsageBlock
+from ..core import Blackboard, EventLoopOrchestrator, Message, encode_json, to_jsonable
+from ..models import QuestionCategory
+from ..run_pipeline import build_registry
+from ..templates import ComparisonTemplate, FAQTemplate, ProductTemplate
+from .synthetic import synthetic_catalog, synthetic_competitor
+
+GOALS = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+# Message types of one pipeline run, routed against a board holding parsed input.
+_ROUTED_TYPES = [
+    "start",
+    "plan",
+    "parse_product",
+    "generate_questions",
+    "generate_block:benefits",
+    "generate_block:usage",
+    "generate_block:ingredients",
+    "generate_block:safety",
+    "generate_block:comparison",
+    "artifact_created",
+    "render_page:faq",
+    "render_page:product",
+    "render_page:comparison",
+    "build_graph",
+]
+
+
+def _cycle(items: List[Any], fn: Callable[[Any], Any]) -> Callable[[], None]:
+    # One op per call, walking the inputs so no single product dominates.
+    state = {"i": 0}
+    n = len(items)
+
+    def op() -> None:
+        i = state["i"]
+        fn(items[i])
+        state["i"] = i + 1 if i + 1 < n else 0
+
+    return op
+
+
+def build_suite(products: int, seed: int, list_length: Optional[int], string_size: int) -> Dict[str, Callable[[], None]]:
+    """Benchmark name -> zero-argument op, over prepared synthetic inputs."""
+    rng = random.Random(seed)
+    raws = [raw for _, raw in synthetic_catalog(products, seed, list_length, string_size)]
+    competitors = [synthetic_competitor(rng, list_length) for _ in raws]
+
+    # Real artifacts for every product from one pipeline run each.
+    orchestrator = EventLoopOrchestrator(build_registry())
+    boards: List[Blackboard] = []
+    for i, (raw, competitor) in enumerate(zip(raws, competitors)):
+        start = Message(
+            type="start", payload={"raw_product_data": raw, "competitor_data": competitor}, source="User", trace_id=f"p{i}"
+        )
+        boards.append(orchestrator.run([start], GOALS))
+    parsed = [bb.get("product_data") for bb in boards]
+    base_blocks = [[bb.get(f"block:{t}") for t in ("benefits", "usage", "ingredients", "safety")] for bb in boards]
+    comparison_blocks = [blocks + [bb.get("block:comparison")] for blocks, bb in zip(base_blocks, boards)]
+    pages = [{key: bb.get(key) for key in GOALS} for bb in boards]
+
+    benefits, usage, ingredients, safety, comparison = BenefitsBlock(), UsageBlock(), IngredientsBlock(), SafetyBlock(), ComparisonBlock()
+    faq, product_page, comparison_page = FAQTemplate(), ProductTemplate(), ComparisonTemplate()
+    faq_inputs = [(blocks, bb.get("questions"), bb.get("product_data")) for blocks, bb in zip(base_blocks, boards)]
+
+    # Distinct names per op so the uncached benchmarks never hit the name cache.
+    unique_names = [f"{product.name} #{i}" for i in range(1000) for product in parsed]
+    uncached, cached = QuestionAgent(cache_size=0), QuestionAgent()
+    large_bank = QuestionAgent(
+        {category: [f"Question {i} about {{product_name}}?" for i in range(200)] for category in QuestionCategory}, cache_size=0
+    )
+
+    registry = build_registry()
+    route_inputs: List[Tuple[Message, Blackboard]] = []
+    for raw in raws:
+        board = Blackboard(goals=set(GOALS))
+        board.put("raw_product_data", raw, producer="User")
+        board.put("product_data", parse_product(raw), producer="ParserAgent")
+        route_inputs += [(Message(type=t, payload={"key": "product_data"}, source="bench"), board) for t in _ROUTED_TYPES]
+
+    run_registry = build_registry()
+    starts = [
+        Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id="run")
+        for raw in raws
+    ]
+
+    return {
+        "parse.product": _cycle(raws, parse_product),
+        "block.benefits": _cycle(parsed, benefits.process),
+        "block.usage": _cycle(parsed, usage.process),
+        "block.ingredients": _cycle(parsed, ingredients.process),
+        "block.safety": _cycle(parsed, safety.process),
+        "block.comparison": _cycle(
+            list(zip(parsed, competitors)), lambda pc: comparison.process(pc[0], comparison_product=pc[1])
+        ),
+        "questions.build": _cycle(unique_names, uncached.questions_for),
+        "questions.cached": _cycle([p.name for p in parsed], cached.questions_for),
+        "questions.batch": _cycle([[p.name for p in parsed]], uncached.generate_batch),
+        "questions.bank_1000": _cycle(unique_names, large_bank.questions_for),
+        "template.faq": _cycle(faq_inputs, lambda f: faq.render(f[0], questions=f[1], product_data=f[2])),
+        "template.product": _cycle(list(zip(base_blocks, parsed)), lambda bp: product_page.render(bp[0], product_data=bp[1])),
+        "template.comparison": _cycle(comparison_blocks, comparison_page.render),
+        "registry.route": _cycle(route_inputs, lambda mb: registry.route(mb[0], mb[1])),
+        "serialize.to_jsonable": _cycle(pages, to_jsonable),
+        "serialize.encode_json": _cycle(pages, lambda p: encode_json(p, indent=2)),
+        "orchestrator.run": _cycle(starts, lambda m: EventLoopOrchestrator(run_registry).run([m], GOALS)),
+    }
+
+
+def measure(op: Callable[[], None], min_time: float, repeat: int) -> Dict[str, float]:
+    """ns/op: calibrate a loop count that runs for ``min_time``, then time ``repeat`` loops."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 5:
+            break
+        number *= 10 if elapsed < min_time / 50 else 2
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        samples.append((time.perf_counter() - start) / number * 1e9)
+    return {"ns_per_op": min(samples), "median_ns": statistics.median(samples), "number": number, "repeat": repeat}
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    suite = build_suite(args.products, args.seed, args.list_length, args.string_size)
+    selected = {name: op for name, op in suite.items() if any(fnmatch.fnmatch(name, p) for p in args.filter)}
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'benchmark':<24} {'ns/op':>12} {'median':>12} {'loops':>8}")
+    for name, op in selected.items():
+        results[name] = measure(op, args.min_time, args.repeat)
+        r = results[name]
+        print(f"{name:<24} {r['ns_per_op']:>12,.0f} {r['median_ns']:>12,.0f} {r['number']:>8}")
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "products": args.products,
+            "seed": args.seed,
+            "list_length": args.list_length,
+            "string_size": args.string_size,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison table and return the names that regressed beyond ``threshold``."""
+    params = ("products", "seed", "list_length", "string_size")
+    mismatched = [p for p in params if baseline["meta"].get(p) != current["meta"].get(p)]
+    if mismatched:
+        print(f"warning: runs differ in {', '.join(mismatched)}; timings are not comparable")
+    regressions: List[str] = []
+    print(f"{'benchmark':<24} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, base in baseline["results"].items():
+        cur = current["results"].get(name)
+        if cur is None:
+            print(f"{name:<24} {base['ns_per_op']:>12,.0f} {'missing':>12}")
+            continue
+        change = cur["ns_per_op"] / base["ns_per_op"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:<24} {base['ns_per_op']:>12,.0f} {cur['ns_per_op']:>12,.0f} {change:>+8.1%}{flag}")
+    for name in current["results"].keys() - baseline["results"].keys():
+        print(f"{name:<24} {'new':>12} {current['results'][name]['ns_per_op']:>12,.0f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--products", type=int, default=20, help="synthetic products the inputs cycle through")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--list-length", type=int, help="items per list field (skin types, ingredients, benefits)")
+    run_parser.add_argument("--string-size", type=int, default=0, help="pad free-text fields to this many characters")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed loop")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--filter", nargs="+", default=["*"], help="glob patterns of benchmark names")
+    run_parser.add_argument("--out", type=Path, help="save results as a JSON baseline")
+    run_parser.add_argument("--compare", type=Path, help="baseline to compare the results against")
+    run_parser.add_argument("--threshold", type=float, default=0.10)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown, as a fraction")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        current = run(args)
+        if args.out:
+            args.out.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+            print(f"\nSaved {args.out}")
+        if not args.compare:
+            return
+        print()
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    else:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        current = json.loads(args.current.read_text(encoding="utf-8"))
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Routing cost of AgentRegistry as the number of registered agents grows.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_routing
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List
+
+from ..core import Agent, AgentRegistry, Blackboard, Message
+
+
+class _TaskAgent(Agent):
+    def __init__(self, index: int):
+        self.name = f"TaskAgent{index}"
+        self.subscriptions = (f"task:{index}",)
+        self._type = f"task:{index}"
+
+    def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
+        return message.type == self._type
+
+    def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+        return []
+
+
+def _linear_route(registry: AgentRegistry, message: Message, blackboard: Blackboard) -> List[Agent]:
+    # Pre-index behaviour: every agent's guard is evaluated for every message.
+    return [a for a in registry.agents if a.can_handle(message, blackboard)]
+
+
+def _time(fn, messages: List[Message], registry: AgentRegistry, blackboard: Blackboard) -> float:
+    start = time.perf_counter()
+    for msg in messages:
+        fn(registry, msg, blackboard)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[10, 50, 100, 500, 1000])
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    blackboard = Blackboard()
+    print(f"{'agents':>8} {'linear us/msg':>14} {'indexed us/msg':>15} {'speedup':>8}")
+    for count in args.agents:
+        registry = AgentRegistry()
+        for i in range(count):
+            registry.register(_TaskAgent(i))
+        messages = [Message(type=f"task:{i % count}") for i in range(args.messages)]
+
+        indexed_route = lambda reg, msg, bb: reg.route(msg, bb)  # noqa: E731
+        linear = _time(_linear_route, messages, registry, blackboard)
+        indexed = _time(indexed_route, messages, registry, blackboard)
+        per_msg = 1e6 / args.messages
+        print(f"{count:>8} {linear * per_msg:>14.2f} {indexed * per_msg:>15.2f} {linear / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
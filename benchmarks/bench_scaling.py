@@ -0,0 +1,153 @@
+"""End-to-end scaling of catalog runs across catalog size and worker count.
+
+Every configuration runs the full goal set on a seeded synthetic catalog in
+a fresh interpreter, so peak RSS is its own. One worker is the in-process
+catalog event loop (``stream_catalog``); more workers shard the catalog
+across a process pool (``iter_sharded``). Per-product latency runs from the
+product being pulled off the catalog to its pages being handed to the
+writer, so for sharded runs it includes waiting for the rest of the chunk.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_scaling --sizes 1 100 10000 100000 --workers 1 2 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..core import EventLoopOrchestrator, Message, encode_json
+from ..output_writer import OutputWriter, shard_dir
+from ..run_pipeline import build_registry
+from ..sharded_runner import iter_sharded
+from .synthetic import synthetic_catalog
+
+GOALS = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _timed(products: Iterator[Tuple[str, Dict[str, Any]]], pulled: Dict[str, float]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for trace_id, raw in products:
+        pulled[trace_id] = time.perf_counter()
+        yield trace_id, raw
+
+
+def run_one(size: int, workers: int, output_dir: Optional[Path], chunk_size: int, max_in_flight: int, seed: int) -> Dict[str, Any]:
+    """One configuration in this process; returns its measurements."""
+    pulled: Dict[str, float] = {}
+    latencies: List[float] = []
+    products = _timed(synthetic_catalog(size, seed), pulled)
+    writer = OutputWriter() if output_dir is not None else None
+    encoded_bytes = 0
+    completed = 0
+
+    def emit(trace_id: str, pages: Dict[str, bytes]) -> None:
+        nonlocal encoded_bytes, completed
+        completed += 1
+        latencies.append(time.perf_counter() - pulled.pop(trace_id))
+        if writer is not None:
+            product_dir = shard_dir(output_dir, trace_id, 2)
+            for filename, content in pages.items():
+                writer.write(product_dir / filename, content)
+        encoded_bytes += sum(len(content) for content in pages.values())
+
+    start = time.perf_counter()
+    if workers == 1:
+        orchestrator = EventLoopOrchestrator(build_registry())
+        messages = (
+            Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+            for trace_id, raw in products
+        )
+        for trace_id, bb in orchestrator.stream_catalog(messages, GOALS, max_in_flight=max_in_flight):
+            if bb.goals_satisfied():
+                emit(trace_id, {goal: encode_json(bb.get(goal), indent=2) for goal in GOALS})
+    else:
+        for result in iter_sharded(products, GOALS, workers=workers, chunk_size=chunk_size):
+            for trace_id, pages in result.pages.items():
+                emit(trace_id, pages)
+    if writer is not None:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {
+        "size": size,
+        "workers": workers,
+        "completed": completed,
+        "seconds": elapsed,
+        "products_per_second": completed / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1e3,
+        "p95_ms": _percentile(latencies, 0.95) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+        # ru_maxrss is in KiB on Linux.
+        "peak_rss_mb": self_rss / 1024,
+        "worker_peak_rss_mb": child_rss / 1024 if workers > 1 else 0.0,
+        "bytes_per_product": encoded_bytes / completed if completed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000, 100000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="1 runs the in-process event loop")
+    parser.add_argument("--chunk-size", type=int, default=100, help="products per shard task when workers > 1")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="products admitted at once when workers == 1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-write", action="store_true", help="encode pages but do not write them to disk")
+    parser.add_argument("--out", type=Path, help="save all results as JSON")
+    parser.add_argument("--one", type=int, nargs=2, metavar=("SIZE", "WORKERS"), help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.one:
+        # Child mode: one configuration, result as the last line of stdout.
+        size, workers = args.one
+        result = run_one(size, workers, args.output_dir, args.chunk_size, args.max_in_flight, args.seed)
+        print(json.dumps(result))
+        return
+
+    results: List[Dict[str, Any]] = []
+    print(f"{os.cpu_count()} CPUs, pages {'encoded only' if args.no_write else 'written'}, seed {args.seed}")
+    print(
+        f"{'products':>9} {'workers':>7} {'seconds':>8} {'prod/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'RSS MB':>7} {'wkr MB':>7} {'B/prod':>7}"
+    )
+    for size in args.sizes:
+        for workers in args.workers:
+            with tempfile.TemporaryDirectory() as tmp:
+                command = [
+                    sys.executable, "-m", __spec__.name, "--one", str(size), str(workers),
+                    "--chunk-size", str(args.chunk_size), "--max-in-flight", str(args.max_in_flight), "--seed", str(args.seed),
+                ]
+                if not args.no_write:
+                    command += ["--output-dir", tmp]
+                out = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            results.append(r)
+            print(
+                f"{size:>9} {workers:>7} {r['seconds']:>8.2f} {r['products_per_second']:>8.1f} {r['p50_ms']:>8.1f} "
+                f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['peak_rss_mb']:>7.0f} {r['worker_peak_rss_mb']:>7.0f} "
+                f"{r['bytes_per_product']:>7.0f}"
+            )
+    if args.out:
+        args.out.write_text(json.dumps({"cpus": os.cpu_count(), "seed": args.seed, "results": results}, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
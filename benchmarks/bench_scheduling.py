@@ -0,0 +1,71 @@
+"""Time to first completed product and makespan of a catalog run per scheduling policy.
+
+Every ``--sla-every``-th product gets a deadline (its position in the catalog,
+in products), which only EDF looks at; the SLA column is the mean finish time
+of those products.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_scheduling --products 2000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from functools import partial
+from statistics import mean
+from typing import Dict, List
+
+from ..agents.planner_agent import PIPELINE_PLAN
+from ..core import EventLoopOrchestrator, Message, make_policy
+from ..run_pipeline import build_registry
+from .synthetic import synthetic_catalog
+
+POLICIES = ["round-robin", "fifo", "priority", "goal-distance", "edf"]
+
+
+def _run(policy: str, products: int, max_in_flight: int, max_queue_size: int, sla_every: int) -> Dict[str, float]:
+    orchestrator = EventLoopOrchestrator(
+        build_registry(), partial(make_policy, policy, PIPELINE_PLAN), max_queue_size=max_queue_size or None
+    )
+    sla = set()
+    messages: List[Message] = []
+    for i, (trace_id, raw) in enumerate(synthetic_catalog(products)):
+        payload = {"raw_product_data": raw, "competitor_data": None}
+        if sla_every and i % sla_every == 0:
+            payload["deadline"] = i
+            sla.add(trace_id)
+        messages.append(Message(type="start", payload=payload, source="User", trace_id=trace_id))
+
+    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+    finished: Dict[str, float] = {}
+    start = time.perf_counter()
+    for trace_id, bb in orchestrator.stream_catalog(messages, goals, max_in_flight=max_in_flight or None):
+        assert bb.goals_satisfied()
+        finished[trace_id] = time.perf_counter() - start
+    assert len(finished) == products
+    return {
+        "first": min(finished.values()),
+        "makespan": max(finished.values()),
+        "mean": mean(finished.values()),
+        "sla": mean(finished[t] for t in sla) if sla else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--max-in-flight", type=int, default=0, help="0 admits the whole catalog at once")
+    parser.add_argument("--max-queue-size", type=int, default=0, help="0 disables queue backpressure")
+    parser.add_argument("--sla-every", type=int, default=10)
+    parser.add_argument("--policies", nargs="+", default=POLICIES, choices=POLICIES)
+    args = parser.parse_args()
+
+    print(f"{'policy':<14} {'first ms':>9} {'mean s':>7} {'SLA mean s':>11} {'makespan s':>11}")
+    for policy in args.policies:
+        r = _run(policy, args.products, args.max_in_flight, args.max_queue_size, args.sla_every)
+        print(f"{policy:<14} {r['first'] * 1e3:>9.1f} {r['mean']:>7.2f} {r['sla']:>11.2f} {r['makespan']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
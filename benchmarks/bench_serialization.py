@@ -0,0 +1,120 @@
+"""encode_json/to_jsonable against the asdict-based _to_jsonable + json.dumps path.
+
+Inputs are the real artifacts of synthetic products run through the pipeline:
+ProductData, Questions, ContentBlocks and GeneratedPages of full page size.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_serialization --products 200
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from typing import Any, Callable, List
+
+from ..core import EventLoopOrchestrator, Message, encode_json, to_jsonable
+from ..models import GeneratedPage
+from ..run_pipeline import build_registry
+from .synthetic import synthetic_catalog
+
+_PAGES = {"faq.json": "faq", "product_page.json": "product", "comparison_page.json": "comparison"}
+
+
+def _legacy_to_jsonable(obj: Any) -> Any:
+    # core.orchestrator._to_jsonable before the per-dataclass encoders.
+    if obj is None:
+        return None
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj):
+        return {k: _legacy_to_jsonable(v) for k, v in asdict(obj).items()}
+    if isinstance(obj, dict):
+        return {str(k): _legacy_to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_legacy_to_jsonable(v) for v in obj]
+    return str(obj)
+
+
+def _legacy_hash(obj: Any) -> str:
+    canonical = json.dumps(_legacy_to_jsonable(obj), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _hash(obj: Any) -> str:
+    return hashlib.sha256(encode_json(obj, sort_keys=True)).hexdigest()
+
+
+def _artifacts(products: int, seed: int) -> List[Any]:
+    orchestrator = EventLoopOrchestrator(build_registry())
+    messages = (
+        Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+        for trace_id, raw in synthetic_catalog(products, seed)
+    )
+    artifacts: List[Any] = []
+    for _, bb in orchestrator.stream_catalog(messages, list(_PAGES)):
+        product = bb.get("product_data")
+        blocks = [bb.get(key) for key in bb.artifacts if key.startswith("block:")]
+        pages = [GeneratedPage(page_type, product.name, bb.get(key)) for key, page_type in _PAGES.items()]
+        artifacts.append([product, bb.get("questions"), blocks, pages])
+    return artifacts
+
+
+def _time(fn: Callable[[Any], Any], items: List[Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    artifacts = _artifacts(args.products, args.seed)
+    contents = [page.content for item in artifacts for page in item[3]]
+
+    cases = [
+        ("to_jsonable", _legacy_to_jsonable, to_jsonable, artifacts),
+        ("stable_hash", _legacy_hash, _hash, artifacts),
+        (
+            "page json indent=2",
+            lambda c: json.dumps(c, ensure_ascii=False, indent=2).encode("utf-8"),
+            lambda c: encode_json(c, indent=2),
+            contents,
+        ),
+        (
+            "page json compact",
+            lambda c: json.dumps(_legacy_to_jsonable(c), ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            encode_json,
+            contents,
+        ),
+    ]
+
+    print(f"{'case':<20} {'items':>7} {'legacy ms':>10} {'new ms':>8} {'speedup':>8}")
+    for name, legacy, new, items in cases:
+        assert all(
+            json.dumps(legacy(item), ensure_ascii=False) == json.dumps(new(item), ensure_ascii=False)
+            if name == "to_jsonable"
+            else legacy(item) == new(item)
+            for item in items
+        ), f"{name}: output differs"
+        legacy_s = _time(legacy, items, args.repeat)
+        new_s = _time(new, items, args.repeat)
+        print(f"{name:<20} {len(items):>7} {legacy_s * 1e3:>10.1f} {new_s * 1e3:>8.1f} {legacy_s / new_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Speedup of the sharded catalog runner across worker counts.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_sharding --products 20000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+
+from ..sharded_runner import run_sharded
+from .synthetic import synthetic_catalog
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=250)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>9} {'products/s':>11} {'speedup':>8} {'efficiency':>11}")
+    for workers in args.workers:
+        report = run_sharded(synthetic_catalog(args.products, args.seed), goals, workers=workers, chunk_size=args.chunk_size)
+        assert not report.failed and report.products == args.products
+        if baseline is None:
+            # Summed worker compute time approximates a single-core run.
+            baseline = report.elapsed if workers == 1 else report.busy_seconds
+        speedup = baseline / report.elapsed
+        print(f"{workers:>8} {report.elapsed:>9.2f} {report.products_per_second:>11.0f} {speedup:>7.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Cost of tracing spans on a catalog run: tracer off vs on, and trace export time.
+
+Run from the directory containing the package:
+
+    python -m <package>.benchmarks.bench_tracing --products 2000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..core import EventLoopOrchestrator, Message, Tracer
+from ..run_pipeline import build_registry
+from .synthetic import synthetic_catalog
+
+
+def _run(products: int, tracer: Optional[Tracer]) -> float:
+    orchestrator = EventLoopOrchestrator(build_registry(), tracer=tracer)
+    messages = (
+        Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+        for trace_id, raw in synthetic_catalog(products)
+    )
+    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
+    start = time.perf_counter()
+    finished = sum(1 for _ in orchestrator.stream_catalog(messages, goals, max_in_flight=256))
+    elapsed = time.perf_counter() - start
+    assert finished == products
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    off = min(_run(args.products, None) for _ in range(args.repeat))
+    on = float("inf")
+    for _ in range(args.repeat):
+        tracer = Tracer()
+        on = min(on, _run(args.products, tracer))
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        tracer.write(Path(tmp) / "trace.json")
+        export = time.perf_counter() - start
+
+    print(f"tracing off: {off:.3f}s")
+    print(f"tracing on:  {on:.3f}s ({on / off - 1:+.1%}), {len(tracer.spans)} spans")
+    print(f"export:      {export:.3f}s")
+    print(f"\n{'agent':<20} {'calls':>7} {'total ms':>9} {'mean ms':>8}")
+    for row in tracer.summary():
+        print(f"{row['agent']:<20} {row['calls']:>7} {row['total'] * 1e3:>9.1f} {row['mean'] * 1e3:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
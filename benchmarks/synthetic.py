@@ -0,0 +1,84 @@
+"""Seeded generators for synthetic products in the raw_product_data shape.
+
+``list_length`` and ``string_size`` scale the inputs for benchmarks; left
+at their defaults, a seed yields the same catalog as it always has.
+"""
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_SKIN_TYPES = ["Oily", "Combination", "Dry", "Normal", "Sensitive"]
+_INGREDIENTS = ["Vitamin C", "Hyaluronic Acid", "Niacinamide", "Retinol", "Ferulic Acid", "Vitamin E", "Peptides", "Ceramides"]
+_BENEFITS = ["Brightening", "Fades dark spots", "Hydration", "Evens skin tone", "Reduces fine lines", "Firming"]
+_TIMES = ["morning", "evening", "night"]
+_FILLER = ["gentle", "lightweight", "daily", "serum", "formula", "with", "clinically", "tested", "for", "radiant", "skin"]
+
+
+def _items(rng: random.Random, vocabulary: List[str], count: int) -> List[str]:
+    # Beyond the vocabulary, numbered variants keep the items distinct.
+    picked = rng.sample(vocabulary, min(count, len(vocabulary)))
+    picked += [f"{rng.choice(vocabulary)} {i}" for i in range(len(vocabulary), count)]
+    return picked
+
+
+def _pad(rng: random.Random, text: str, size: int) -> str:
+    words = [text]
+    length = len(text)
+    while length < size:
+        word = rng.choice(_FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def synthetic_product(
+    rng: random.Random, index: int, list_length: Optional[int] = None, string_size: int = 0
+) -> Dict[str, Any]:
+    """One raw product. ``list_length`` fixes the size of the list fields and
+    ``string_size`` pads the free-text fields to at least that many characters."""
+    if list_length is not None or string_size:
+        n = list_length if list_length is not None else 3
+        return {
+            "Product Name": _pad(rng, f"Serum {index:06d}", string_size),
+            "Concentration": f"{rng.randint(5, 20)}% Vitamin C",
+            "Skin Type": ", ".join(_items(rng, _SKIN_TYPES, n)),
+            "Key Ingredients": ", ".join(_items(rng, _INGREDIENTS, n)),
+            "Benefits": ", ".join(_items(rng, _BENEFITS, n)),
+            "How to Use": _pad(rng, f"Apply {rng.randint(1, 3)} drops in the {rng.choice(_TIMES)}", string_size),
+            "Side Effects": _pad(rng, "Mild tingling for sensitive skin", string_size),
+            "Price": f"₹{rng.randint(299, 1999)}",
+        }
+    return {
+        "Product Name": f"Serum {index:06d}",
+        "Concentration": f"{rng.randint(5, 20)}% Vitamin C",
+        "Skin Type": ", ".join(rng.sample(_SKIN_TYPES, rng.randint(1, 3))),
+        "Key Ingredients": ", ".join(rng.sample(_INGREDIENTS, rng.randint(1, 4))),
+        "Benefits": ", ".join(rng.sample(_BENEFITS, rng.randint(1, 3))),
+        "How to Use": f"Apply {rng.randint(1, 3)}–{rng.randint(3, 5)} drops in the {rng.choice(_TIMES)} before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": f"₹{rng.randint(299, 1999)}",
+    }
+
+
+def synthetic_catalog(
+    count: int, seed: int = 0, list_length: Optional[int] = None, string_size: int = 0
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(trace_id, raw_product_data)`` pairs; the same seed gives the same catalog."""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield f"product-{i}", synthetic_product(rng, i, list_length, string_size)
+
+
+def synthetic_competitor(rng: random.Random, list_length: Optional[int] = None) -> Dict[str, Any]:
+    """A competitor in the shape the comparison block expects (``competitor_data``)."""
+    n = list_length if list_length is not None else 2
+    return {
+        "name": f"Competitor {rng.randint(0, 9999):04d}",
+        "concentration": f"{rng.randint(5, 20)}% Vitamin C",
+        "skin_types": _items(rng, _SKIN_TYPES, n),
+        "key_ingredients": _items(rng, _INGREDIENTS, n),
+        "benefits": _items(rng, _BENEFITS, n),
+        "price": f"₹{rng.randint(299, 1999)}",
+        "fictional": True,
+    }
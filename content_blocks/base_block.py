@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet
 
 
 class BaseContentBlock(ABC):
+    # Bump when process() output changes for the same input; part of cache keys.
+    version = "1"
+    # ProductData fields process() reads; drives incremental regeneration.
+    reads: FrozenSet[str] = frozenset()
+
     def __init__(self, block_type: str):
         self.block_type = block_type
 
@@ -5,6 +5,8 @@ from .base_block import BaseContentBlock
 
 
 class BenefitsBlock(BaseContentBlock):
+    reads = frozenset({"benefits"})
+
     def __init__(self):
         super().__init__("benefits")
 
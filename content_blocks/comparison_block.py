@@ -5,6 +5,8 @@ from .base_block import BaseContentBlock
 
 
 class ComparisonBlock(BaseContentBlock):
+    reads = frozenset({"name", "concentration", "skin_types", "key_ingredients", "benefits", "price"})
+
     def __init__(self):
         super().__init__("comparison")
 
@@ -5,6 +5,8 @@ from .base_block import BaseContentBlock
 
 
 class IngredientsBlock(BaseContentBlock):
+    reads = frozenset({"key_ingredients", "concentration"})
+
     def __init__(self):
         super().__init__("ingredients")
 
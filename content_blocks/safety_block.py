@@ -5,6 +5,8 @@ from .base_block import BaseContentBlock
 
 
 class SafetyBlock(BaseContentBlock):
+    reads = frozenset({"side_effects"})
+
     def __init__(self):
         super().__init__("safety")
 
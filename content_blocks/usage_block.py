@@ -5,6 +5,8 @@ from .base_block import BaseContentBlock
 
 
 class UsageBlock(BaseContentBlock):
+    reads = frozenset({"usage_instructions"})
+
     def __init__(self):
         super().__init__("usage")
 
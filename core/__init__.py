@@ -1,13 +1,64 @@
-from .agent import Agent
+from .agent import Agent, AsyncAgent
+from .async_orchestrator import AsyncEventLoopOrchestrator
 from .blackboard import Blackboard
+from .cache import ContentCache, stable_hash
+from .checkpoint import CatalogState, CheckpointStore
+from .event_log import EventLog, EventLogConfig, EventSpill
+from .memory import MemoryAccountant, MemoryReport
+from .message_graph import MessageGraph
 from .messages import Message
-from .orchestrator import EventLoopOrchestrator
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry, cache_collector
+from .orchestrator import ConcurrentEventLoopOrchestrator, EventLoopOrchestrator
+from .plan import ArtifactLifetimes, CompiledPlan, PlanNode
 from .registry import AgentRegistry
+from .scheduling import (
+    EDFPolicy,
+    FIFOPolicy,
+    GoalDistancePriority,
+    PriorityPolicy,
+    RoundRobinPolicy,
+    SchedulingPolicy,
+    make_policy,
+)
+from .serialization import encode_json, to_jsonable
+from .tracing import Span, Tracer
 
 __all__ = [
     "Agent",
+    "AsyncAgent",
     "Blackboard",
     "Message",
     "EventLoopOrchestrator",
+    "ConcurrentEventLoopOrchestrator",
+    "AsyncEventLoopOrchestrator",
     "AgentRegistry",
+    "PlanNode",
+    "CompiledPlan",
+    "ArtifactLifetimes",
+    "ContentCache",
+    "stable_hash",
+    "CheckpointStore",
+    "CatalogState",
+    "EventLog",
+    "EventLogConfig",
+    "EventSpill",
+    "MessageGraph",
+    "SchedulingPolicy",
+    "FIFOPolicy",
+    "RoundRobinPolicy",
+    "PriorityPolicy",
+    "EDFPolicy",
+    "GoalDistancePriority",
+    "make_policy",
+    "encode_json",
+    "to_jsonable",
+    "Span",
+    "Tracer",
+    "MetricsRegistry",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "cache_collector",
+    "MemoryAccountant",
+    "MemoryReport",
 ]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 
 from .blackboard import Blackboard
 from .messages import Message
@@ -10,6 +10,15 @@ from .messages import Message
 class Agent(ABC):
     name: str
 
+    # Message types this agent wants to see. Entries are exact types
+    # ("parse_product") or prefixes ending in "*" ("render_page:*").
+    # Agents that declare nothing are offered every message.
+    subscriptions: Tuple[str, ...] = ()
+
+    # True when handle() only touches the blackboard through has/get/put, so
+    # the concurrent orchestrator may run it on a worker against staged writes.
+    parallel_safe: bool = False
+
     @abstractmethod
     def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
         raise NotImplementedError
@@ -17,3 +26,19 @@ class Agent(ABC):
     @abstractmethod
     def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
         raise NotImplementedError
+
+
+class AsyncAgent(Agent):
+    """Agent whose handle() is a coroutine.
+
+    Only ``AsyncEventLoopOrchestrator`` awaits async agents; the synchronous
+    orchestrators expect plain ``Agent`` instances.
+    """
+
+    # Upper bound on concurrent handle() calls across all runs sharing an
+    # orchestrator. None means unbounded.
+    max_concurrency: Optional[int] = None
+
+    @abstractmethod
+    async def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+        raise NotImplementedError
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Set
+
+from .agent import Agent, AsyncAgent
+from .blackboard import Blackboard, BlackboardTransaction
+from .messages import Message
+from .metrics import MetricsRegistry
+from .registry import AgentRegistry
+from .tracing import Tracer
+
+
+class AsyncEventLoopOrchestrator:
+    """Drives the message queue on asyncio.
+
+    Every message is processed in its own task, so I/O-bound ``AsyncAgent``
+    handlers wait concurrently. Sync agents that are ``parallel_safe`` run on
+    ``executor`` (the loop's default executor when None) against staged
+    writes; other sync agents run inline on the loop. Per-agent limits come
+    from ``agent_limits`` or the agent's ``max_concurrency`` and are shared
+    by all runs awaiting this orchestrator, so many pipelines can be gathered
+    in one process without a thread each.
+    """
+
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        executor: Optional[Executor] = None,
+        agent_limits: Optional[Dict[str, int]] = None,
+        tracer: Optional[Tracer] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.registry = registry
+        self.executor = executor
+        self.agent_limits = dict(agent_limits or {})
+        self.tracer = tracer
+        if metrics is not None and registry.metrics is None:
+            registry.attach_metrics(metrics)
+        self.metrics = metrics if metrics is not None else registry.metrics
+        self._handle_seconds: Optional[Dict[str, Any]] = None
+        if self.metrics is not None:
+            self._handle_seconds = self.metrics.histogram(
+                "pipeline_agent_handle_seconds", "Duration of agent handle calls.", ("agent",)
+            ).by_label
+        self._semaphores: Dict[str, Optional[asyncio.Semaphore]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(self, initial_messages: List[Message], goals: List[str], artifacts: Optional[Dict[str, Any]] = None) -> Blackboard:
+        bb = Blackboard(goals=set(goals), metrics=self.metrics)
+        for key, value in (artifacts or {}).items():
+            bb.put(key, value, producer="PreviousRun")
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Semaphores are bound to the loop that first uses them.
+            self._loop = loop
+            self._semaphores = {}
+
+        order: Dict[asyncio.Task, int] = {}
+        pending: Set[asyncio.Task] = set()
+
+        def schedule(msg: Message) -> None:
+            if self.tracer is not None:
+                self.tracer.enqueued(msg)
+            task = asyncio.ensure_future(self._process(msg, bb))
+            order[task] = len(order)
+            pending.add(task)
+
+        for msg in initial_messages:
+            schedule(msg)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=order.pop):
+                    for out in task.result():
+                        schedule(out)
+
+                if self._goals_satisfied(bb):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return bb
+
+    async def _process(self, msg: Message, bb: Blackboard) -> List[Message]:
+        bb.event_log.log("message", msg.type, msg.source)
+        bb.message_graph.record(msg.source, msg.type, msg.trace_id)
+        queued_at = self.tracer.dequeued(msg) if self.tracer is not None else 0.0
+
+        handlers = self.registry.route(msg, bb)
+        if not handlers:
+            bb.event_log.log("unhandled", msg.type)
+            return []
+
+        out_messages: List[Message] = []
+        for agent in handlers:
+            semaphore = self._semaphore(agent)
+            if semaphore is None:
+                out_messages.extend(await self._timed(agent, msg, bb, queued_at))
+            else:
+                async with semaphore:
+                    out_messages.extend(await self._timed(agent, msg, bb, queued_at))
+        return out_messages
+
+    async def _timed(self, agent: Agent, msg: Message, bb: Blackboard, queued_at: float) -> List[Message]:
+        tracer = self.tracer
+        if tracer is None and self.metrics is None:
+            return await self._handle(agent, msg, bb)
+        # Handlers overlap on the loop thread, so each span gets its own lane;
+        # the duration includes time spent waiting on the executor.
+        lane = tracer.acquire_lane() if tracer is not None else 0
+        start = time.perf_counter()
+        try:
+            return await self._handle(agent, msg, bb)
+        finally:
+            end = time.perf_counter()
+            if tracer is not None:
+                tracer.record(agent.name, msg, queued_at, start, end, tid=lane)
+                tracer.release_lane(lane)
+            if self._handle_seconds is not None:
+                self._handle_seconds[agent.name].observe(end - start)
+
+    async def _handle(self, agent: Agent, msg: Message, bb: Blackboard) -> List[Message]:
+        if isinstance(agent, AsyncAgent):
+            return await agent.handle(msg, bb)
+        if not agent.parallel_safe:
+            return agent.handle(msg, bb)
+
+        # Executor adapter: the worker only reads artifacts; its writes are
+        # applied back on the loop thread once it finishes.
+        txn = BlackboardTransaction(bb.artifacts, bb.goals)
+        loop = asyncio.get_running_loop()
+        out_messages = await loop.run_in_executor(self.executor, agent.handle, msg, txn)
+        txn.commit(bb)
+        return out_messages
+
+    def _semaphore(self, agent: Agent) -> Optional[asyncio.Semaphore]:
+        if agent.name not in self._semaphores:
+            limit = self.agent_limits.get(agent.name, getattr(agent, "max_concurrency", None))
+            self._semaphores[agent.name] = asyncio.Semaphore(limit) if limit else None
+        return self._semaphores[agent.name]
+
+    def _goals_satisfied(self, bb: Blackboard) -> bool:
+        return bb.goals_satisfied()
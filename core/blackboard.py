@@ -1,14 +1,48 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .event_log import EventLog
+from .message_graph import MessageGraph
+from .metrics import MetricsRegistry
+
+
+# Called as callback(blackboard, key, value) after every put of a subscribed key.
+Subscriber = Callable[["Blackboard", str, Any], None]
 
 
 @dataclass
 class Blackboard:
     artifacts: Dict[str, Any] = field(default_factory=dict)
     goals: Set[str] = field(default_factory=set)
-    event_log: List[Dict[str, Any]] = field(default_factory=list)
+    event_log: EventLog = field(default_factory=EventLog)
+    # Aggregated message flow; may be shared by every board of a run.
+    message_graph: MessageGraph = field(default_factory=MessageGraph, repr=False, compare=False)
+    # Per-product child boards for catalog runs, keyed by trace_id.
+    scopes: Dict[str, "Blackboard"] = field(default_factory=dict)
+    # Private bookkeeping agents keep per run; not artifacts, never logged.
+    agent_state: Dict[str, Any] = field(default_factory=dict)
+    # Counts artifacts per producer when set; not pickled with the board.
+    metrics: Optional[MetricsRegistry] = field(default=None, repr=False, compare=False)
+
+    _unmet_goals: int = field(default=0, init=False, repr=False, compare=False)
+    # pipeline_artifacts_total children by producer, resolved from metrics.
+    _artifact_counts: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _subscribers: Dict[str, List[Subscriber]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.set_goals(self.goals)
+        self.attach_metrics(self.metrics)
+
+    def attach_metrics(self, metrics: Optional[MetricsRegistry]) -> None:
+        """Set ``metrics`` and resolve the artifact counter once for every later put."""
+        self.metrics = metrics
+        self._artifact_counts = (
+            metrics.counter("pipeline_artifacts_total", "Artifacts written, by producer.", ("producer",)).by_label
+            if metrics is not None
+            else None
+        )
 
     def has(self, key: str) -> bool:
         return key in self.artifacts and self.artifacts[key] is not None
@@ -17,5 +51,83 @@ class Blackboard:
         return self.artifacts.get(key, default)
 
     def put(self, key: str, value: Any, producer: str) -> None:
+        if key in self.goals:
+            self._unmet_goals += self.has(key) - (value is not None)
         self.artifacts[key] = value
-        self.event_log.append({"event": "artifact_created", "key": key, "producer": producer})
+        self.event_log.log("artifact_created", key, producer)
+        if self._artifact_counts is not None:
+            self._artifact_counts[producer].inc()
+        for callback in self._subscribers.get(key, ()):
+            callback(self, key, value)
+
+    def release(self, key: str, producer: str) -> Any:
+        """Drop ``key`` from the artifacts and return its value; goals are never released."""
+        if key in self.goals or key not in self.artifacts:
+            return None
+        value = self.artifacts.pop(key)
+        self.event_log.log("artifact_released", key, producer)
+        return value
+
+    def set_goals(self, goals: Iterable[str]) -> None:
+        """Replace the goal set and recount unmet goals.
+
+        Assign goals through this method (or the constructor) so
+        ``goals_satisfied()`` stays in sync.
+        """
+        self.goals = set(goals)
+        self._unmet_goals = sum(1 for goal in self.goals if not self.has(goal))
+
+    def goals_satisfied(self) -> bool:
+        """O(1) check that every goal has a value; False when there are no goals."""
+        return bool(self.goals) and self._unmet_goals == 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return dict(self.__dict__, metrics=None, _artifact_counts=None)
+
+    def subscribe(self, key: str, callback: Subscriber) -> None:
+        """Call ``callback`` after every put of ``key``.
+
+        Subscribers travel with the blackboard (e.g. into checkpoints), so
+        prefer picklable callables such as bound methods of agents.
+        """
+        self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key: str, callback: Subscriber) -> None:
+        callbacks = self._subscribers.get(key)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._subscribers[key]
+
+
+class BlackboardTransaction:
+    """Read-through view of blackboard artifacts that buffers writes.
+
+    Used to run agents off the main loop: reads see the base artifacts plus
+    this transaction's own writes, and the buffered writes are applied to
+    the real blackboard later, in a deterministic order.
+    """
+
+    def __init__(self, artifacts: Dict[str, Any], goals: Set[str]):
+        self.artifacts = artifacts
+        self.goals = goals
+        self.writes: List[Tuple[str, Any, str]] = []
+        self._staged: Dict[str, Any] = {}
+
+    def has(self, key: str) -> bool:
+        if key in self._staged:
+            return self._staged[key] is not None
+        return key in self.artifacts and self.artifacts[key] is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._staged:
+            return self._staged[key]
+        return self.artifacts.get(key, default)
+
+    def put(self, key: str, value: Any, producer: str) -> None:
+        self._staged[key] = value
+        self.writes.append((key, value, producer))
+
+    def commit(self, blackboard: Blackboard) -> None:
+        for key, value, producer in self.writes:
+            blackboard.put(key, value, producer=producer)
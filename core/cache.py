@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from .serialization import encode_json
+
+T = TypeVar("T")
+
+
+def stable_hash(*parts: Any) -> str:
+    """SHA-256 over a canonical JSON encoding of ``parts``.
+
+    Dataclasses, enums, dicts and lists hash by value, and dict key order does
+    not matter, so equal inputs give equal keys across runs and processes.
+    """
+    return hashlib.sha256(encode_json(list(parts), sort_keys=True)).hexdigest()
+
+
+class ContentCache:
+    """Content-addressed cache with an in-memory LRU tier and an optional SQLite tier.
+
+    Entries are keyed by ``stable_hash(kind, version, inputs...)``, so a
+    changed input, block/template rules or version bump simply misses.
+    Cached values are shared between callers and must be treated as
+    read-only. A copy pickled into a worker process starts with an empty
+    memory tier and zeroed counts, so there only the SQLite tier is shared;
+    the worker's counts are merged back with ``merge_counts``.
+    """
+
+    def __init__(self, max_entries: int = 4096, path: Optional[Union[str, Path]] = None):
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def key(self, kind: str, version: str, *inputs: Any) -> str:
+        return stable_hash(kind, version, *inputs)
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+            value = self._load(key)
+            if value is not None:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            self._remember(key, value)
+            self._store(key, value)
+        return value
+
+    def counts(self) -> Tuple[int, int, int, int]:
+        """(memory hits, disk hits, misses, evictions), for ``merge_counts``."""
+        return self.memory_hits, self.disk_hits, self.misses, self.evictions
+
+    def merge_counts(self, counts: Tuple[int, int, int, int]) -> None:
+        """Add lookup counts recorded by a copy of this cache in another process."""
+        memory_hits, disk_hits, misses, evictions = counts
+        with self._lock:
+            self.memory_hits += memory_hits
+            self.disk_hits += disk_hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._memory),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS content_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        return self._db
+
+    def _load(self, key: str) -> Any:
+        db = self._connection()
+        if db is None:
+            return None
+        row = db.execute("SELECT value FROM content_cache WHERE key = ?", (key,)).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def _store(self, key: str, value: Any) -> None:
+        db = self._connection()
+        if db is not None:
+            db.execute(
+                "INSERT OR REPLACE INTO content_cache (key, value) VALUES (?, ?)",
+                (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Shipped to worker processes without the connection or memory tier;
+        # each process reopens the SQLite file on first use.
+        state = self.__dict__.copy()
+        state.update(_memory=OrderedDict(), _lock=None, _db=None, memory_hits=0, disk_hits=0, misses=0, evictions=0)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import copyreg
+import io
+import os
+import pickle
+import time
+import zlib
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+from .agent import Agent
+from .blackboard import Blackboard
+from .message_graph import MessageGraph
+from .registry import AgentRegistry
+from .scheduling import SchedulingPolicy
+
+
+@dataclass
+class CatalogState:
+    """Everything ``stream_catalog`` needs to pick up where it stopped."""
+
+    # Shared message queue, with the policy that orders it.
+    queue: SchedulingPolicy
+    # Initial messages already pulled from the source.
+    consumed: int = 0
+    boards: Dict[str, Blackboard] = field(default_factory=dict)
+    # Queued messages per in-flight product.
+    outstanding: Dict[str, int] = field(default_factory=dict)
+    # Products already yielded to the consumer; later messages for them are dropped.
+    completed: Set[str] = field(default_factory=set)
+    # Whole-run message graph the boards share, if the orchestrator keeps one.
+    graph: Optional[MessageGraph] = None
+
+
+class CheckpointStore:
+    """Periodic, atomic snapshots of a catalog run in one zlib-compressed pickle.
+
+    ``stream_catalog`` saves after every ``interval`` processed messages.
+    Agents are stored by name and resolved against the live registry on
+    load, so subscriptions (bound methods of agents) reattach to the running
+    agents rather than to pickled copies. ``on_save`` runs before each save,
+    e.g. to flush pages of products about to be recorded as completed.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        interval: int = 10000,
+        compression: int = 1,
+        on_save: Optional[Callable[[], Any]] = None,
+    ):
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.path = Path(path)
+        self.interval = interval
+        self.compression = compression
+        self.on_save = on_save
+        self.saves = 0
+        self.last_bytes = 0
+        self.seconds = 0.0
+
+    def save(self, state: CatalogState, registry: AgentRegistry) -> None:
+        start = time.perf_counter()
+        if self.on_save is not None:
+            self.on_save()
+        data = zlib.compress(_dump(state, registry), self.compression)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+        self.saves += 1
+        self.last_bytes = len(data)
+        self.seconds += time.perf_counter() - start
+
+    def load(self, registry: AgentRegistry) -> Optional[CatalogState]:
+        if not self.path.exists():
+            return None
+        return _load(zlib.decompress(self.path.read_bytes()), registry)
+
+    def clear(self) -> None:
+        """Drop the checkpoint once the run has finished."""
+        self.path.unlink(missing_ok=True)
+
+
+# Agent lookup for the load in progress; see _registered_agent.
+_LOADING: ContextVar[Dict[str, Agent]] = ContextVar("_LOADING")
+
+
+def _registered_agent(name: str) -> Agent:
+    try:
+        return _LOADING.get()[name]
+    except KeyError:
+        raise pickle.UnpicklingError(f"checkpoint refers to unregistered agent {name!r}") from None
+
+
+def _dump(state: CatalogState, registry: AgentRegistry) -> bytes:
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    # A per-type reducer keeps the C pickler on its fast path, unlike
+    # persistent_id, which is called back for every object.
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    for agent_type in {type(agent) for agent in registry.agents}:
+        pickler.dispatch_table[agent_type] = _reduce_agent
+    pickler.dump(state)
+    return buffer.getvalue()
+
+
+def _reduce_agent(agent: Agent) -> Tuple[Callable[[str], Agent], Tuple[str]]:
+    return _registered_agent, (agent.name,)
+
+
+def _load(data: bytes, registry: AgentRegistry) -> CatalogState:
+    token = _LOADING.set({agent.name: agent for agent in registry.agents})
+    try:
+        return pickle.loads(data)
+    finally:
+        _LOADING.reset(token)
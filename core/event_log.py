@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import json
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+# Verbosity levels: an event is kept when its level is <= the log's level.
+OFF, WARNING, INFO, DEBUG = 0, 1, 2, 3
+LEVELS: Dict[str, int] = {"off": OFF, "warning": WARNING, "info": INFO, "debug": DEBUG}
+EVENT_LEVELS: Dict[str, int] = {"unhandled": WARNING, "artifact_created": INFO, "artifact_released": INFO, "message": DEBUG}
+
+# Field names per event, in the order their values are stored; events first
+# seen through append() register their own.
+_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "message": ("type", "source"),
+    "artifact_created": ("key", "producer"),
+    "artifact_released": ("key", "producer"),
+    "unhandled": ("type",),
+}
+
+# Process-wide string table. Code 0 is None; codes never leave the process
+# (pickling and spill files use the strings).
+_SYMBOLS: List[Optional[str]] = [None]
+_CODES: Dict[Optional[str], int] = {None: 0}
+_LOCK = threading.Lock()
+
+
+def _code(value: Optional[str]) -> int:
+    code = _CODES.get(value)
+    if code is None:
+        with _LOCK:
+            code = _CODES.get(value)
+            if code is None:
+                code = _CODES[value] = len(_SYMBOLS)
+                _SYMBOLS.append(value)
+    return code
+
+
+class EventSpill:
+    """NDJSON file shared by the event logs of one run.
+
+    The file is truncated on the first write unless ``append`` is set (e.g.
+    when resuming from a checkpoint), so it only holds this run. Lines carry
+    the log's ``trace_id`` so per-product traces can be read back; the
+    offsets of each trace's lines are indexed as the file is read, so every
+    line is scanned once however many traces are read.
+    """
+
+    def __init__(self, path: Union[str, Path], append: bool = False):
+        self.path = Path(path)
+        self.append = append
+        self._fh: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
+        # trace_id -> byte offsets of its lines, for the file up to _indexed.
+        self._index: Dict[Optional[str], array] = {}
+        self._indexed = 0
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(self.path, "ab" if self.append else "wb")
+                self.append = True
+            self._fh.write(line)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def read(self, trace_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Entries in write order, optionally only those of one trace."""
+        self.flush()
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as fh:
+            for line in fh:
+                entry = json.loads(line)
+                if trace_id is None or entry.pop("trace_id", None) == trace_id:
+                    yield entry
+
+    def read_trace(self, trace_id: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """Entries of exactly ``trace_id`` (``None`` for untraced logs), in write order."""
+        self.flush()
+        if not self.path.exists():
+            return
+        with self._lock:
+            self._update_index()
+            offsets = list(self._index.get(trace_id, ()))
+        with open(self.path, "rb") as fh:
+            for offset in offsets:
+                fh.seek(offset)
+                entry = json.loads(fh.readline())
+                entry.pop("trace_id", None)
+                yield entry
+
+    def _update_index(self) -> None:
+        with open(self.path, "rb") as fh:
+            fh.seek(self._indexed)
+            offset = self._indexed
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # partially written; indexed on the next read
+                trace_id = json.loads(line).get("trace_id")
+                offsets = self._index.get(trace_id)
+                if offsets is None:
+                    offsets = self._index[trace_id] = array("Q")
+                offsets.append(offset)
+                offset += len(line)
+            self._indexed = offset
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self.flush()
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # A restored spill continues the file rather than truncating it.
+        self.__init__(state["path"], append=True)
+
+
+class EventLog:
+    """Blackboard event log stored as interned codes in compact arrays.
+
+    Iterating yields the same dicts the list-based log held, e.g.
+    ``{"event": "message", "type": ..., "source": ...}``. Events above
+    ``level`` are not recorded. With ``max_entries`` only the newest entries
+    stay in memory. With ``spill`` every recorded entry is also streamed to
+    an NDJSON file, and iteration reads the full trace back from it once
+    entries have been evicted from memory.
+    """
+
+    def __init__(
+        self,
+        level: int = DEBUG,
+        max_entries: Optional[int] = None,
+        spill: Optional[EventSpill] = None,
+        trace_id: Optional[str] = None,
+    ):
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.level = level
+        self.max_entries = max_entries
+        self.spill = spill
+        self.trace_id = trace_id
+        self.dropped = 0
+        self._events = array("I")
+        self._first = array("I")
+        self._second = array("I")
+        # Ring start once max_entries is reached.
+        self._head = 0
+        # Entries that do not fit the two-field layout, by absolute position.
+        self._extra: Dict[int, Dict[str, Any]] = {}
+
+    def log(self, event: str, first: Optional[str] = None, second: Optional[str] = None) -> None:
+        """Record ``event`` with its field values in ``_FIELDS`` order."""
+        if EVENT_LEVELS.get(event, INFO) > self.level:
+            return
+        if self.spill is not None:
+            self.spill.write(self._entry(event, first, second, self.trace_id))
+        self._store(_code(event), _code(first), _code(second))
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Record an entry given as a dict (``{"event": ..., **fields}``)."""
+        event = entry.get("event")
+        if EVENT_LEVELS.get(event, INFO) > self.level:
+            return
+        fields = tuple(k for k in entry if k != "event")
+        if isinstance(event, str) and len(fields) <= 2:
+            _FIELDS.setdefault(event, fields)
+        if self.spill is not None:
+            self.spill.write(dict(entry, trace_id=self.trace_id) if self.trace_id is not None else dict(entry))
+        self._restore(dict(entry))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self.dropped and self.spill is not None:
+            return self.spill.read_trace(self.trace_id)
+        return self._iter_memory()
+
+    def _iter_memory(self) -> Iterator[Dict[str, Any]]:
+        size = len(self._events)
+        for i in range(size):
+            extra = self._extra.get(self.dropped + i)
+            if extra is not None:
+                yield dict(extra)
+                continue
+            slot = (self._head + i) % size
+            yield self._entry(_SYMBOLS[self._events[slot]], _SYMBOLS[self._first[slot]], _SYMBOLS[self._second[slot]])
+
+    def count(self, event: str) -> int:
+        """Entries of ``event`` currently held in memory."""
+        code = _CODES.get(event)
+        return 0 if code is None else self._events.count(code)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EventLog(entries={len(self)}, dropped={self.dropped}, level={self.level})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Strings rather than codes: the symbol table is per process.
+        return {
+            "level": self.level,
+            "max_entries": self.max_entries,
+            "spill": self.spill,
+            "trace_id": self.trace_id,
+            "dropped": self.dropped,
+            "entries": list(self._iter_memory()),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["level"], state["max_entries"], state["spill"], state["trace_id"])
+        for entry in state["entries"]:
+            self._restore(entry)
+        self.dropped = state["dropped"]
+        self._extra = {self.dropped + i: e for i, e in self._extra.items()}
+
+    def _restore(self, entry: Dict[str, Any]) -> None:
+        fields = tuple(k for k in entry if k != "event")
+        values = [entry[k] for k in fields]
+        if _FIELDS.get(entry["event"]) == fields and all(v is None or isinstance(v, str) for v in values):
+            self._store(_code(entry["event"]), *(_code(v) for v in values), *([0] * (2 - len(values))))
+            return
+        position = self.dropped + len(self)
+        self._store(0, 0, 0)
+        if self.max_entries != 0:
+            self._extra[position] = entry
+
+    def _store(self, event: int, first: int, second: int) -> None:
+        if self.max_entries is None or len(self._events) < self.max_entries:
+            self._events.append(event)
+            self._first.append(first)
+            self._second.append(second)
+            return
+        if self.max_entries == 0:
+            self.dropped += 1
+            return
+        slot = self._head
+        self._extra.pop(self.dropped, None)
+        self._events[slot] = event
+        self._first[slot] = first
+        self._second[slot] = second
+        self._head = (slot + 1) % self.max_entries
+        self.dropped += 1
+
+    @staticmethod
+    def _entry(event: Optional[str], first: Optional[str], second: Optional[str], trace_id: Optional[str] = None) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"event": event}
+        names = _FIELDS.get(event, ())
+        if len(names) > 0:
+            entry[names[0]] = first
+        if len(names) > 1:
+            entry[names[1]] = second
+        if trace_id is not None:
+            entry["trace_id"] = trace_id
+        return entry
+
+
+class EventLogConfig:
+    """Builds the event log of each blackboard an orchestrator creates.
+
+    ``level`` is a name from ``LEVELS``. With ``spill_path`` all boards of a
+    run stream into one shared NDJSON file, replaced at the start of the run
+    unless ``spill_append`` is set.
+    """
+
+    def __init__(
+        self,
+        level: str = "debug",
+        max_entries: Optional[int] = None,
+        spill_path: Optional[Union[str, Path]] = None,
+        spill_append: bool = False,
+    ):
+        if level not in LEVELS:
+            raise ValueError(f"Unknown event log level: {level}")
+        self.level = LEVELS[level]
+        self.max_entries = max_entries
+        self.spill = EventSpill(spill_path, spill_append) if spill_path is not None else None
+
+    def __call__(self, trace_id: Optional[str] = None) -> EventLog:
+        return EventLog(self.level, self.max_entries, self.spill, trace_id)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+import types
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .blackboard import Blackboard
+
+# Shared program structure, not data held by a board.
+_SKIP = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.CodeType)
+
+
+@dataclass(slots=True)
+class AgentMemory:
+    calls: int = 0
+    # Sum of traced memory still allocated when handle returned.
+    net_bytes: int = 0
+    # Largest rise in traced memory during one handle call.
+    peak_bytes: int = 0
+
+
+@dataclass(slots=True)
+class KeyMemory:
+    writes: int = 0
+    # Net allocations of the handle calls that wrote the key, split between
+    # the keys each call wrote.
+    allocated_bytes: int = 0
+    # Reachable size when the board was accounted, summed over boards.
+    retained_bytes: int = 0
+    max_retained_bytes: int = 0
+    boards: int = 0
+
+
+@dataclass
+class MemoryReport:
+    agents: Dict[str, AgentMemory] = field(default_factory=dict)
+    keys: Dict[str, KeyMemory] = field(default_factory=dict)
+    peak_bytes: int = 0
+    boards: int = 0
+
+    def top_keys(self, n: int = 10) -> List[Tuple[str, KeyMemory]]:
+        return sorted(self.keys.items(), key=lambda item: item[1].retained_bytes, reverse=True)[:n]
+
+    def format(self, top: int = 15) -> str:
+        lines = [f"Peak traced memory: {self.peak_bytes / 1e6:.1f} MB over {self.boards} blackboard(s)", ""]
+        lines.append(f"{'agent':<20} {'calls':>7} {'net KB':>10} {'peak KB':>9}")
+        for name, agent in sorted(self.agents.items(), key=lambda item: item[1].net_bytes, reverse=True):
+            lines.append(f"{name:<20} {agent.calls:>7} {agent.net_bytes / 1e3:>10.1f} {agent.peak_bytes / 1e3:>9.1f}")
+        lines += ["", f"{'blackboard key':<28} {'retained KB':>12} {'max/board KB':>13} {'allocated KB':>13}"]
+        for key, memory in self.top_keys(top):
+            lines.append(
+                f"{key:<28} {memory.retained_bytes / 1e3:>12.1f} {memory.max_retained_bytes / 1e3:>13.1f} "
+                f"{memory.allocated_bytes / 1e3:>13.1f}"
+            )
+        return "\n".join(lines)
+
+
+class MemoryAccountant:
+    """Optional per-agent and per-key memory accounting for an orchestrator.
+
+    Every sequentially handled call is bracketed with ``tracemalloc``
+    readings: what it left allocated is charged to the agent and to the keys
+    it wrote, and the peak during the call to the agent. When a board
+    finishes (end of ``run``, or each product of a catalog run) the objects
+    reachable from each artifact, its event log, message graph and agent
+    state are sized, each object once, to show which keys hold the memory.
+    Pseudo-keys are ``<event_log>``, ``<message_graph>`` and
+    ``<agent_state:NAME>``. Tracing slows the run down considerably;
+    handlers run in concurrent waves are not attributed to agents.
+    """
+
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self.report = MemoryReport()
+        self._started = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+
+    def stop(self) -> None:
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def begin(self) -> int:
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def end(self, agent: str, before: int, written: Iterable[str]) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        report = self.report
+        report.peak_bytes = max(report.peak_bytes, peak)
+        memory = report.agents.get(agent)
+        if memory is None:
+            memory = report.agents[agent] = AgentMemory()
+        memory.calls += 1
+        memory.net_bytes += current - before
+        memory.peak_bytes = max(memory.peak_bytes, peak - before)
+
+        written = list(written)
+        for key in written:
+            key_memory = self._key(key)
+            key_memory.writes += 1
+            key_memory.allocated_bytes += (current - before) // len(written)
+
+    def account_board(self, bb: Blackboard) -> None:
+        """Size what ``bb`` holds and add it to the per-key totals."""
+        self.report.boards += 1
+        self.report.peak_bytes = max(self.report.peak_bytes, tracemalloc.get_traced_memory()[1])
+        seen: Set[int] = set()
+        holders: List[Tuple[str, Any]] = list(bb.artifacts.items())
+        holders.append(("<event_log>", bb.event_log))
+        holders.append(("<message_graph>", bb.message_graph))
+        holders += [(f"<agent_state:{name}>", state) for name, state in bb.agent_state.items()]
+        for key, value in holders:
+            size = _reachable_size(value, seen)
+            key_memory = self._key(key)
+            key_memory.retained_bytes += size
+            key_memory.max_retained_bytes = max(key_memory.max_retained_bytes, size)
+            key_memory.boards += 1
+
+    def _key(self, key: str) -> KeyMemory:
+        memory = self.report.keys.get(key)
+        if memory is None:
+            memory = self.report.keys[key] = KeyMemory()
+        return memory
+
+
+def _reachable_size(obj: Any, seen: Set[int]) -> int:
+    """``sys.getsizeof`` over everything reachable from ``obj`` not yet in ``seen``."""
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIP):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        stack.extend(gc.get_referents(item))
+    return total
+
+
+def written_keys(before: Dict[str, Any], after: Dict[str, Any]) -> List[str]:
+    """Keys whose value was added or replaced between two artifact snapshots."""
+    return [key for key, value in after.items() if before.get(key, _MISSING) is not value]
+
+
+_MISSING = object()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _EdgeStats:
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, latency: float) -> None:
+        self.count += 1
+        self.total += latency
+        if latency < self.min:
+            self.min = latency
+        if latency > self.max:
+            self.max = latency
+
+    def __getstate__(self) -> Tuple[int, float, float, float]:
+        return self.count, self.total, self.min, self.max
+
+    def __setstate__(self, state: Tuple[int, float, float, float]) -> None:
+        self.count, self.total, self.min, self.max = state
+
+
+class MessageGraph:
+    """Message-flow graph maintained as the event loop processes messages.
+
+    Nodes are ``source:message_type``. An edge joins consecutive messages
+    from the same source within one trace; repeats are aggregated into a
+    count plus the latency between the two messages. Memory and
+    ``to_json`` cost depend on the number of distinct nodes and edges, not on
+    how many messages were processed. One graph per blackboard gives a
+    per-trace view; sharing one graph between blackboards gives a whole-run
+    view.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.node_counts: Dict[str, int] = {}
+        self.edges: Dict[Tuple[str, str], _EdgeStats] = {}
+        # trace_id -> source -> (last node id, when it was processed)
+        self._last: Dict[Optional[str], Dict[str, Tuple[str, float]]] = {}
+
+    def record(self, source: str, message_type: str, trace_id: Optional[str] = None) -> None:
+        now = time.perf_counter()
+        node_id = f"{source}:{message_type}"
+        if node_id in self.nodes:
+            self.node_counts[node_id] += 1
+        else:
+            self.nodes[node_id] = {"id": node_id, "agent": source, "message_type": message_type}
+            self.node_counts[node_id] = 1
+
+        sources = self._last.get(trace_id)
+        if sources is None:
+            sources = self._last[trace_id] = {}
+        last = sources.get(source)
+        if last is not None and last[0] != node_id:
+            stats = self.edges.get((last[0], node_id))
+            if stats is None:
+                stats = self.edges[(last[0], node_id)] = _EdgeStats()
+            stats.add(now - last[1])
+        sources[source] = (node_id, now)
+
+    def finish_trace(self, trace_id: Optional[str]) -> None:
+        """Forget a finished trace's position so the graph does not grow with traces."""
+        self._last.pop(trace_id, None)
+
+    def to_json(self, counts: bool = True, latency: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Graph as ``{"nodes": [...], "edges": [...]}`` in first-seen order.
+
+        ``counts`` adds how often each node and edge occurred; ``latency``
+        adds per-edge mean/min/max milliseconds, which vary between runs.
+        """
+        nodes = [dict(node, count=self.node_counts[node_id]) if counts else dict(node) for node_id, node in self.nodes.items()]
+        edges: List[Dict[str, Any]] = []
+        for (src, dst), stats in self.edges.items():
+            edge: Dict[str, Any] = {"from": src, "to": dst}
+            if counts:
+                edge["count"] = stats.count
+            if latency:
+                edge["latency_ms"] = {
+                    "mean": round(stats.total / stats.count * 1e3, 3),
+                    "min": round(stats.min * 1e3, 3),
+                    "max": round(stats.max * 1e3, 3),
+                }
+            edges.append(edge)
+        return {"nodes": nodes, "edges": edges}
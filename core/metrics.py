@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Handle latencies here are micro- to milliseconds, so the buckets start lower
+# than Prometheus' defaults.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# A collector yields (name, type, help, [(labels, value), ...]) at exposition time.
+Sample = Tuple[Dict[str, str], float]
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Buckets:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _ByLabel(dict):
+    """Label value -> child of a single-label metric; ``by_label[value]`` is one dict lookup once created."""
+
+    def __init__(self, metric: "_Metric"):
+        super().__init__()
+        self.metric = metric
+
+    def __missing__(self, value: str):
+        child = self[value] = self.metric.labels(value)
+        return child
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._default = self.labels()
+        # Hot paths resolve the metric once and keep this handle.
+        self.by_label = _ByLabel(self)
+
+    def labels(self, *values: str):
+        """The child for these label values, created on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self):
+        return _Value()
+
+    def _label_dict(self, values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(self.name, self._label_dict(values), child.value) for values, child in list(self._children.items())]
+
+
+class Counter(_Metric):
+    """Monotonic count. ``inc()`` directly on unlabelled counters, else ``labels(...).inc()``."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+
+class Histogram(_Metric):
+    """Bucketed observations with Prometheus' cumulative ``_bucket``/``_sum``/``_count`` series."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self):
+        return _Buckets(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        out: List[Tuple[str, Dict[str, str], float]] = []
+        for values, child in list(self._children.items()):
+            labels = self._label_dict(values)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), list(child.counts)):
+                cumulative += count
+                out.append((f"{self.name}_bucket", dict(labels, le=_format_value(bound)), cumulative))
+            out.append((f"{self.name}_sum", labels, child.sum))
+            out.append((f"{self.name}_count", labels, child.count))
+        return out
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms rendered in Prometheus text format.
+
+    ``counter``/``gauge``/``histogram`` return the existing metric for a
+    name, so components can look theirs up independently; per-update code
+    should look up once and keep the metric (or its ``by_label``). Updates are plain
+    attribute arithmetic without locking: make them from the event loop
+    thread, and expose state owned by other threads (e.g. cache hit counts)
+    through ``register_collector``, which runs only at exposition time.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = Histogram(name, help, labelnames, buckets)
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"Metric {name} is a {metric.kind}, not a histogram")
+        return metric
+
+    def register_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(_family(metric.name, metric.kind, metric.help, metric.samples()))
+        for collector in self._collectors:
+            for name, kind, help, samples in collector():
+                lines.extend(_family(name, kind, help, [(name, labels, value) for labels, value in samples]))
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Union[str, Path]) -> None:
+        """Atomically replace ``path`` with the current exposition (e.g. for node_exporter's textfile collector)."""
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(self.exposition())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def serve(self, port: int = 0, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve ``GET /metrics`` from a daemon thread; ``server.server_address`` has the bound port.
+
+        Call ``shutdown()`` on the returned server to stop it.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.exposition().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+    def _get(self, cls, name: str, help: str, labelnames: Sequence[str]):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, help, labelnames)
+        if type(metric) is not cls:
+            raise ValueError(f"Metric {name} is a {metric.kind}, not a {cls.kind}")
+        return metric
+
+
+def cache_collector(cache, name: str = "pipeline_cache") -> Collector:
+    """Collector exposing a ``ContentCache``'s lookup counts and hit ratio."""
+
+    def collect() -> Iterable[Tuple[str, str, str, List[Sample]]]:
+        stats = cache.stats()
+        yield (
+            f"{name}_lookups_total",
+            "counter",
+            "Content cache lookups by result.",
+            [
+                ({"result": "memory_hit"}, stats["memory_hits"]),
+                ({"result": "disk_hit"}, stats["disk_hits"]),
+                ({"result": "miss"}, stats["misses"]),
+            ],
+        )
+        yield f"{name}_evictions_total", "counter", "Entries evicted from the in-memory cache.", [({}, stats["evictions"])]
+        yield f"{name}_entries", "gauge", "Entries held in the in-memory cache.", [({}, stats["entries"])]
+        yield f"{name}_hit_ratio", "gauge", "Share of lookups served from memory or disk.", [({}, stats["hit_rate"])]
+
+    return collect
+
+
+def _family(name: str, kind: str, help: str, samples: List[Tuple[str, Dict[str, str], float]]) -> List[str]:
+    lines = [f"# HELP {name} {_escape(help, quotes=False)}", f"# TYPE {name} {kind}"]
+    for sample_name, labels, value in samples:
+        if labels:
+            rendered = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+            lines.append(f"{sample_name}{{{rendered}}} {_format_value(value)}")
+        else:
+            lines.append(f"{sample_name} {_format_value(value)}")
+    return lines
+
+
+def _escape(text: str, quotes: bool = True) -> str:
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quotes else text
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
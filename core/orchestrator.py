@@ -1,64 +1,448 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
 from collections import deque
-from dataclasses import asdict, is_dataclass
-from enum import Enum
-from typing import Any, Deque, Dict, List
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from .blackboard import Blackboard
+from .agent import Agent
+from .blackboard import Blackboard, BlackboardTransaction
+from .cache import ContentCache
+from .checkpoint import CatalogState, CheckpointStore
+from .event_log import EventLogConfig
+from .memory import MemoryAccountant, written_keys
+from .message_graph import MessageGraph
 from .messages import Message
+from .metrics import MetricsRegistry
 from .registry import AgentRegistry
+from .scheduling import FIFOPolicy, RoundRobinPolicy, SchedulingPolicy
+from .serialization import to_jsonable
+from .tracing import Tracer
 
 
-def _to_jsonable(obj: Any) -> Any:
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-    if isinstance(obj, Enum):
-        return obj.value
-    if is_dataclass(obj):
-        return {k: _to_jsonable(v) for k, v in asdict(obj).items()}
-    if isinstance(obj, dict):
-        return {str(k): _to_jsonable(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_to_jsonable(v) for v in obj]
-    return str(obj)
+class EventLoopOrchestrator:
+    """Sequential event loop over a pluggable message queue.
 
+    ``scheduler`` builds the queue for each run (``run`` defaults to
+    ``FIFOPolicy``, catalog runs to ``RoundRobinPolicy``).
+    ``max_queue_size`` applies backpressure in catalog runs: no new product
+    is admitted while that many messages are queued. ``event_log`` sets the
+    level, in-memory cap and spill file of every blackboard's event log.
+    ``graph_view`` is ``"trace"`` for a message graph per blackboard or
+    ``"run"`` for one graph, ``self.graph``, shared by every board this
+    orchestrator creates. With a ``tracer`` every ``handle`` call is
+    recorded as a span. ``metrics`` (defaulting to the registry's) gets
+    handle latency histograms, queue depth and product counts, and is also
+    handed to the agent registry and blackboards for routing and artifact
+    counts. With ``memory`` each handle call and finished board is charged
+    to a ``MemoryAccountant`` (see ``core.memory``).
+    """
 
-class EventLoopOrchestrator:
-    def __init__(self, registry: AgentRegistry):
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        scheduler: Optional[Callable[[], SchedulingPolicy]] = None,
+        max_queue_size: Optional[int] = None,
+        event_log: Optional[EventLogConfig] = None,
+        graph_view: str = "trace",
+        tracer: Optional[Tracer] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        memory: Optional[MemoryAccountant] = None,
+    ):
+        if graph_view not in {"trace", "run"}:
+            raise ValueError(f"Unknown graph view: {graph_view}")
         self.registry = registry
+        self.scheduler = scheduler
+        self.max_queue_size = max_queue_size
+        self.event_log = event_log or EventLogConfig()
+        self.graph: Optional[MessageGraph] = MessageGraph() if graph_view == "run" else None
+        self.tracer = tracer
+        self.memory = memory
+        if metrics is not None and registry.metrics is None:
+            registry.attach_metrics(metrics)
+        self.metrics = metrics if metrics is not None else registry.metrics
+        self._handle_seconds: Optional[Dict[str, Any]] = None
+        if self.metrics is not None:
+            self._handle_seconds = self.metrics.histogram(
+                "pipeline_agent_handle_seconds", "Duration of agent handle calls.", ("agent",)
+            ).by_label
+            self._queue_depth = self.metrics.gauge("pipeline_queue_depth", "Messages waiting in the event loop queue.")
 
-    def run(self, initial_messages: List[Message], goals: List[str]) -> Blackboard:
-        bb = Blackboard(goals=set(goals))
-        queue: Deque[Message] = deque(initial_messages)
+    def run(self, initial_messages: List[Message], goals: List[str], artifacts: Optional[Dict[str, Any]] = None) -> Blackboard:
+        if self.memory is not None:
+            self.memory.start()
+        bb = self._new_blackboard(goals, artifacts)
+        queue = self.scheduler() if self.scheduler is not None else FIFOPolicy()
+        push = self._traced(queue.push)
+        for msg in initial_messages:
+            push(msg)
 
         while queue:
-            msg = queue.popleft()
-            bb.event_log.append({"event": "message", "type": msg.type, "source": msg.source})
-
-            handlers = self.registry.route(msg, bb)
-            if not handlers:
-                bb.event_log.append({"event": "unhandled", "type": msg.type})
-                continue
-
-            for agent in handlers:
-                out_messages = agent.handle(msg, bb)
-                for out in out_messages:
-                    queue.append(out)
+            msg = queue.pop()
+            if self.metrics is not None:
+                self._queue_depth.set(len(queue))
+            self._process(msg, bb, push)
 
             if self._goals_satisfied(bb):
                 break
 
+        if self.memory is not None:
+            self.memory.account_board(bb)
+        return bb
+
+    def run_catalog(self, initial_messages: Iterable[Message], goals: List[str]) -> Blackboard:
+        """Run many products interleaved in one event loop.
+
+        The returned root board holds the per-product boards in ``scopes``.
+        See ``stream_catalog`` for scheduling.
+        """
+        root = Blackboard(goals=set(goals))
+        for trace_id, bb in self.stream_catalog(initial_messages, goals):
+            root.scopes[trace_id] = bb
+        return root
+
+    def stream_catalog(
+        self,
+        initial_messages: Iterable[Message],
+        goals: List[str],
+        max_in_flight: Optional[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+    ) -> Iterator[Tuple[str, Blackboard]]:
+        """Run products interleaved and yield ``(trace_id, board)`` as each finishes.
+
+        Each ``trace_id`` works on its own blackboard and all products share
+        one queue, ordered by the scheduling policy (round-robin by default,
+        so a product with a long tail of work cannot stall the others). A
+        product finishes when its goals are met or it has nothing queued.
+        Input is pulled lazily and at most ``max_in_flight`` products (and,
+        with ``max_queue_size``, that many queued messages) are admitted at a
+        time, so with a lazy source and a consumer that drops finished
+        boards, memory does not grow with the catalog.
+
+        With ``checkpoint`` the run is snapshotted every
+        ``checkpoint.interval`` messages and resumes from an existing
+        snapshot: in-flight boards and their pending messages are restored,
+        already-pulled input is skipped (the source must yield the same
+        messages in the same order) and finished products are not rerun.
+        """
+        state = checkpoint.load(self.registry) if checkpoint is not None else None
+        state = state or CatalogState(self.scheduler() if self.scheduler is not None else RoundRobinPolicy(), graph=self.graph)
+        if self.graph is not None and state.graph is not None:
+            self.graph = state.graph  # the restored boards share the checkpointed graph
+        for bb in state.boards.values():
+            bb.attach_metrics(self.metrics)
+            if self.event_log.spill is not None:
+                bb.event_log.spill = self.event_log.spill  # one handle on the run's spill file
+        if self.memory is not None:
+            self.memory.start()
+        if self.metrics is not None:
+            in_flight = self.metrics.gauge("pipeline_products_in_flight", "Catalog products admitted and not yet finished.")
+            finished = self.metrics.counter("pipeline_products_finished_total", "Catalog products finished.")
+        source = islice(initial_messages, state.consumed, None)
+        exhausted = False
+        queue, boards, outstanding = state.queue, state.boards, state.outstanding
+        since_save = 0
+
+        while True:
+            while (
+                not exhausted
+                and (max_in_flight is None or len(boards) < max_in_flight)
+                and (self.max_queue_size is None or len(queue) < self.max_queue_size)
+            ):
+                msg = next(source, None)
+                if msg is None:
+                    exhausted = True
+                    break
+                state.consumed += 1
+                if msg.trace_id is None:
+                    raise ValueError("catalog runs need a trace_id on every initial message")
+                if msg.trace_id in state.completed:
+                    continue
+                if msg.trace_id not in boards:
+                    boards[msg.trace_id] = Blackboard(
+                        goals=set(goals),
+                        event_log=self.event_log(msg.trace_id),
+                        message_graph=self._message_graph(),
+                        metrics=self.metrics,
+                    )
+                    outstanding[msg.trace_id] = 0
+                queue.push(msg)
+                outstanding[msg.trace_id] += 1
+                if self.tracer is not None:
+                    self.tracer.enqueued(msg)
+
+            if not queue:
+                if checkpoint is not None:
+                    checkpoint.clear()
+                return
+
+            msg = queue.pop()
+            if self.metrics is not None:
+                self._queue_depth.set(len(queue))
+                in_flight.set(len(boards))
+            trace_id = msg.trace_id
+            bb = boards.get(trace_id)
+            if bb is None:
+                continue  # queued before its product finished
+
+            def emit(out: Message) -> None:
+                if out.trace_id != trace_id:
+                    out = replace(out, trace_id=trace_id)
+                queue.push(out)
+                outstanding[trace_id] += 1
+                if self.tracer is not None:
+                    self.tracer.enqueued(out)
+
+            self._process(msg, bb, emit)
+            outstanding[trace_id] -= 1
+
+            if outstanding[trace_id] == 0 or self._goals_satisfied(bb):
+                del outstanding[trace_id]
+                queue.drop(trace_id)
+                bb.message_graph.finish_trace(trace_id)
+                if self.tracer is not None:
+                    self.tracer.finish_trace(trace_id)
+                if self.metrics is not None:
+                    finished.inc()
+                if checkpoint is not None:
+                    state.completed.add(trace_id)
+                if self.memory is not None:
+                    self.memory.account_board(bb)
+                yield trace_id, boards.pop(trace_id)
+
+            if checkpoint is not None:
+                since_save += 1
+                if since_save >= checkpoint.interval:
+                    # Saved after the consumer has handled any board just yielded.
+                    checkpoint.save(state, self.registry)
+                    since_save = 0
+
+    def _new_blackboard(self, goals: List[str], artifacts: Optional[Dict[str, Any]]) -> Blackboard:
+        # Artifacts carried over from an earlier run are logged like any
+        # other write; the planner then skips nodes whose outputs exist.
+        bb = Blackboard(
+            goals=set(goals), event_log=self.event_log(), message_graph=self._message_graph(), metrics=self.metrics
+        )
+        for key, value in (artifacts or {}).items():
+            bb.put(key, value, producer="PreviousRun")
         return bb
 
+    def _message_graph(self) -> MessageGraph:
+        return self.graph if self.graph is not None else MessageGraph()
+
+    def _traced(self, push: Callable[[Message], None]) -> Callable[[Message], None]:
+        """``push``, noting the enqueue time of each message when tracing."""
+        tracer = self.tracer
+        if tracer is None:
+            return push
+
+        def traced_push(msg: Message) -> None:
+            tracer.enqueued(msg)
+            push(msg)
+
+        return traced_push
+
+    def _process(self, msg: Message, bb: Blackboard, emit: Callable[[Message], None]) -> None:
+        bb.event_log.log("message", msg.type, msg.source)
+        bb.message_graph.record(msg.source, msg.type, msg.trace_id)
+        tracer = self.tracer
+        queued_at = tracer.dequeued(msg) if tracer is not None else 0.0
+
+        handlers = self.registry.route(msg, bb)
+        if not handlers:
+            bb.event_log.log("unhandled", msg.type)
+            return
+
+        for agent in handlers:
+            if tracer is None and self._handle_seconds is None and self.memory is None:
+                for out in agent.handle(msg, bb):
+                    emit(out)
+                continue
+            for out in self._handle_observed(agent, msg, bb, queued_at):
+                emit(out)
+
+    def _handle_observed(self, agent: Agent, msg: Message, bb: Blackboard, queued_at: float) -> List[Message]:
+        """``agent.handle`` bracketed by timing and, if enabled, memory accounting."""
+        memory = self.memory
+        if memory is not None:
+            artifacts = dict(bb.artifacts)
+            before = memory.begin()
+        start = time.perf_counter()
+        out_messages = list(agent.handle(msg, bb))
+        end = time.perf_counter()
+        if memory is not None:
+            memory.end(agent.name, before, written_keys(artifacts, bb.artifacts))
+        self._observe(agent, msg, queued_at, start, end)
+        return out_messages
+
+    def _observe(
+        self, agent: Agent, msg: Message, queued_at: float, start: float, end: float, pid: Optional[int] = None, tid: Optional[int] = None
+    ) -> None:
+        # One timed handle call, reported to the tracer and the latency histogram.
+        if self.tracer is not None:
+            self.tracer.record(agent.name, msg, queued_at, start, end, pid, tid)
+        if self._handle_seconds is not None:
+            self._handle_seconds[agent.name].observe(end - start)
+
     def _goals_satisfied(self, bb: Blackboard) -> bool:
-        if not bb.goals:
-            return False
-        return all(bb.has(goal) for goal in bb.goals)
+        return bb.goals_satisfied()
+
+
+def _handle_staged(agent: Agent, message: Message, txn: BlackboardTransaction) -> Tuple[List[Tuple[str, Any, str]], List[Message]]:
+    # Module level so it can be shipped to a process pool.
+    out_messages = agent.handle(message, txn)
+    return txn.writes, out_messages
+
+
+def _handle_staged_timed(
+    agent: Agent, message: Message, txn: BlackboardTransaction
+) -> Tuple[List[Tuple[str, Any, str]], List[Message], float, float, int, int]:
+    # _handle_staged plus the timing of the call where it ran; perf_counter
+    # is system-wide, so worker processes report comparable times.
+    start = time.perf_counter()
+    out_messages = agent.handle(message, txn)
+    return txn.writes, out_messages, start, time.perf_counter(), os.getpid(), threading.get_native_id()
+
+
+def _handle_in_process(handle: Callable[..., Tuple[Any, ...]], agent: Agent, message: Message, txn: BlackboardTransaction):
+    # ``handle`` on a pickled copy of the agent, plus the lookup counts of
+    # its content caches so the parent's copies can report them.
+    result = handle(agent, message, txn)
+    return result, _cache_counts(agent)
+
+
+def _agent_caches(agent: Agent) -> Dict[str, ContentCache]:
+    return {name: value for name, value in vars(agent).items() if isinstance(value, ContentCache)}
+
+
+def _cache_counts(agent: Agent) -> Dict[str, Tuple[int, int, int, int]]:
+    return {name: cache.counts() for name, cache in _agent_caches(agent).items()}
+
+
+class ConcurrentEventLoopOrchestrator(EventLoopOrchestrator):
+    """Event loop that runs ready, independent handlers on a worker pool.
+
+    Consecutive queued messages whose handlers are all ``parallel_safe`` and
+    belong to distinct agents form a wave. A wave runs on the pool against
+    staged writes; the writes and emitted messages are then applied in queue
+    order, so ``event_log`` is identical from run to run. Everything else is
+    handled inline exactly as in ``EventLoopOrchestrator``. Waves are formed
+    from a FIFO queue; scheduling policies apply to the sequential loop.
+    """
+
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        event_log: Optional[EventLogConfig] = None,
+        graph_view: str = "trace",
+        tracer: Optional[Tracer] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        memory: Optional[MemoryAccountant] = None,
+    ):
+        super().__init__(registry, event_log=event_log, graph_view=graph_view, tracer=tracer, metrics=metrics, memory=memory)
+        if executor not in {"thread", "process"}:
+            raise ValueError(f"Unknown executor: {executor}")
+        self.executor = executor
+        self.max_workers = max_workers
+
+    def run(self, initial_messages: List[Message], goals: List[str], artifacts: Optional[Dict[str, Any]] = None) -> Blackboard:
+        if self.memory is not None:
+            self.memory.start()
+        bb = self._new_blackboard(goals, artifacts)
+        queue: Deque[Message] = deque()
+        push = self._traced(queue.append)
+        for msg in initial_messages:
+            push(msg)
+
+        with self._make_executor() as pool:
+            while queue:
+                if self.metrics is not None:
+                    self._queue_depth.set(len(queue))
+                wave = self._collect_wave(queue, bb)
+                if len(wave) > 1:
+                    self._run_wave(pool, wave, bb, push)
+                elif wave:
+                    msg, handlers = wave[0]
+                    queued_at = self.tracer.dequeued(msg) if self.tracer is not None else 0.0
+                    for agent in handlers:
+                        for out in self._handle_observed(agent, msg, bb, queued_at):
+                            push(out)
+                else:
+                    self._process(queue.popleft(), bb, push)
+
+                if self._goals_satisfied(bb):
+                    break
+
+        if self.memory is not None:
+            self.memory.account_board(bb)
+        return bb
+
+    def _make_executor(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _collect_wave(self, queue: Deque[Message], bb: Blackboard) -> List[Tuple[Message, List[Agent]]]:
+        wave: List[Tuple[Message, List[Agent]]] = []
+        busy: Set[str] = set()
+        while queue:
+            msg = queue[0]
+            handlers = self.registry.match(msg, bb)
+            if not handlers or not all(a.parallel_safe for a in handlers):
+                break
+            names = {a.name for a in handlers}
+            if len(names) < len(handlers) or names & busy:
+                break
+            queue.popleft()
+            self.registry.record_route(msg, handlers)
+            bb.event_log.log("message", msg.type, msg.source)
+            bb.message_graph.record(msg.source, msg.type, msg.trace_id)
+            wave.append((msg, handlers))
+            busy |= names
+        return wave
+
+    def _run_wave(
+        self, pool: Executor, wave: List[Tuple[Message, List[Agent]]], bb: Blackboard, push: Callable[[Message], None]
+    ) -> None:
+        # Threads share the artifacts dict read-only for the duration of the
+        # wave (every result is collected before any write is applied);
+        # processes get their own pickled copy either way.
+        tracer = self.tracer
+        timed = tracer is not None or self._handle_seconds is not None
+        handle = _handle_staged_timed if timed else _handle_staged
+        in_process = self.executor == "process"
+        futures = []
+        for msg, handlers in wave:
+            queued_at = tracer.dequeued(msg) if tracer is not None else 0.0
+            for agent in handlers:
+                txn = BlackboardTransaction(bb.artifacts, bb.goals)
+                if in_process:
+                    future = pool.submit(_handle_in_process, handle, agent, msg, txn)
+                else:
+                    future = pool.submit(handle, agent, msg, txn)
+                futures.append((agent, msg, queued_at, future))
+        results = [future.result() for _, _, _, future in futures]
+        for (agent, msg, queued_at, _), result in zip(futures, results):
+            if in_process:
+                result, counts = result
+                caches = _agent_caches(agent)
+                for name, task_counts in counts.items():
+                    caches[name].merge_counts(task_counts)
+            writes, out_messages, *timing = result
+            if timed:
+                self._observe(agent, msg, queued_at, *timing)
+            for key, value, producer in writes:
+                bb.put(key, value, producer=producer)
+            for out in out_messages:
+                push(out)
 
 
 def blackboard_to_artifacts(bb: Blackboard) -> Dict[str, Any]:
-    artifacts = bb.get("artifacts", {})
-    return _to_jsonable(artifacts)
+    """The board's artifacts as JSON-compatible values (via ``to_jsonable``)."""
+    return to_jsonable(bb.artifacts)
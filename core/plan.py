@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .event_log import EventSpill
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """One step of a declarative plan.
+
+    A node is ready once every key in ``inputs`` is on the blackboard and at
+    least one of its ``outputs`` is still missing. Nodes with a
+    ``message_type`` are dispatched as messages; nodes without one are
+    resolved by the planner itself. Only nodes some goal depends on are
+    built (see ``CompiledPlan.required``); ``sink`` marks nodes whose
+    outputs are end products, and ``final`` nodes wait until every other
+    dispatched node has produced its outputs.
+    """
+
+    name: str
+    outputs: Tuple[str, ...]
+    inputs: Tuple[str, ...] = ()
+    message_type: Optional[str] = None
+    sink: bool = False
+    final: bool = False
+
+
+@dataclass(frozen=True)
+class ArtifactLifetimes:
+    """When a planner may release intermediate artifacts from the blackboard.
+
+    A plan key lives until every node that reads it and will still run has
+    produced its outputs; nodes declare their reads as ``inputs``, and sink
+    nodes whose outputs are not goals will not run. Goals and ``pinned``
+    keys are always kept, as are keys the plan does not mention. With
+    ``spill`` each released value is appended to that file (as
+    ``{"event": "artifact_spilled", "key": ..., "value": ...}`` lines)
+    instead of being discarded.
+    """
+
+    pinned: FrozenSet[str] = frozenset()
+    spill: Optional[EventSpill] = None
+
+
+class CompiledPlan:
+    """Dependency graph over plan nodes, indexed once for incremental scheduling."""
+
+    def __init__(self, nodes: Iterable[PlanNode]):
+        self.nodes: Tuple[PlanNode, ...] = tuple(nodes)
+        self._index: Dict[str, int] = {}
+        self._producers: Dict[str, PlanNode] = {}
+        consumers: Dict[str, List[PlanNode]] = {}
+
+        for position, node in enumerate(self.nodes):
+            if node.name in self._index:
+                raise ValueError(f"Duplicate plan node: {node.name}")
+            self._index[node.name] = position
+            for key in node.outputs:
+                if key in self._producers:
+                    raise ValueError(f"{key} is produced by both {self._producers[key].name} and {node.name}")
+                self._producers[key] = node
+            for key in node.inputs:
+                consumers.setdefault(key, []).append(node)
+
+        self._consumers: Dict[str, Tuple[PlanNode, ...]] = {k: tuple(v) for k, v in consumers.items()}
+        self.final_nodes: Tuple[PlanNode, ...] = tuple(n for n in self.nodes if n.final)
+        self._required: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        self._check_acyclic()
+
+    def node(self, name: str) -> PlanNode:
+        return self.nodes[self._index[name]]
+
+    def index(self, node: PlanNode) -> int:
+        return self._index[node.name]
+
+    def producer(self, key: str) -> Optional[PlanNode]:
+        return self._producers.get(key)
+
+    def consumers(self, key: str) -> Tuple[PlanNode, ...]:
+        return self._consumers.get(key, ())
+
+    def required(self, goals: Iterable[str]) -> FrozenSet[str]:
+        """Names of the nodes ``goals`` transitively depend on, i.e. all that needs to run."""
+        goals = frozenset(goals)
+        required = self._required.get(goals)
+        if required is None:
+            names: Set[str] = set()
+            stack = [self._producers[key] for key in goals if key in self._producers]
+            while stack:
+                node = stack.pop()
+                if node.name in names:
+                    continue
+                names.add(node.name)
+                stack.extend(self._producers[key] for key in node.inputs if key in self._producers)
+            required = self._required[goals] = frozenset(names)
+        return required
+
+    def _check_acyclic(self) -> None:
+        visiting: Set[str] = set()
+        done: Set[str] = set()
+
+        def visit(node: PlanNode) -> None:
+            if node.name in done:
+                return
+            if node.name in visiting:
+                raise ValueError(f"Plan has a cycle through {node.name}")
+            visiting.add(node.name)
+            for key in node.inputs:
+                upstream = self._producers.get(key)
+                if upstream is not None:
+                    visit(upstream)
+            visiting.discard(node.name)
+            done.add(node.name)
+
+        for node in self.nodes:
+            visit(node)
@@ -1,19 +1,103 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 from .agent import Agent
 from .blackboard import Blackboard
 from .messages import Message
+from .metrics import MetricsRegistry
 
 
 @dataclass
 class AgentRegistry:
     agents: List[Agent] = field(default_factory=list)
+    # Counts routed, unhandled and delivered messages when set.
+    metrics: Optional[MetricsRegistry] = None
+
+    # Subscription index: exact type -> agents, prefix -> agents, plus agents
+    # without subscriptions that must see everything. Entries keep the
+    # registration position so routing order matches registration order.
+    _exact: Dict[str, List[Tuple[int, Agent]]] = field(default_factory=dict, init=False, repr=False)
+    _prefixes: List[Tuple[str, int, Agent]] = field(default_factory=list, init=False, repr=False)
+    _unindexed: List[Tuple[int, Agent]] = field(default_factory=list, init=False, repr=False)
+    _candidates: Dict[str, List[Agent]] = field(default_factory=dict, init=False, repr=False)
+    # Counter children by message type / agent name, resolved from metrics.
+    _routed: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _unhandled: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _delivered: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        agents, self.agents = self.agents, []
+        for agent in agents:
+            self.register(agent)
+        self.attach_metrics(self.metrics)
+
+    def attach_metrics(self, metrics: Optional[MetricsRegistry]) -> None:
+        """Set ``metrics`` and resolve the routing counters once."""
+        self.metrics = metrics
+        if metrics is None:
+            self._routed = self._unhandled = self._delivered = None
+            return
+        self._routed = metrics.counter("pipeline_messages_routed_total", "Messages routed, by type.", ("type",)).by_label
+        self._unhandled = metrics.counter(
+            "pipeline_messages_unhandled_total", "Messages no agent handled, by type.", ("type",)
+        ).by_label
+        self._delivered = metrics.counter(
+            "pipeline_messages_delivered_total", "Messages delivered to each agent.", ("agent",)
+        ).by_label
 
     def register(self, agent: Agent) -> None:
+        position = len(self.agents)
         self.agents.append(agent)
 
+        subscriptions = getattr(agent, "subscriptions", ())
+        if not subscriptions or "*" in subscriptions:
+            self._unindexed.append((position, agent))
+        else:
+            for pattern in subscriptions:
+                if pattern.endswith("*"):
+                    self._prefixes.append((pattern[:-1], position, agent))
+                else:
+                    self._exact.setdefault(pattern, []).append((position, agent))
+        self._candidates.clear()
+
+    def candidates(self, message_type: str) -> List[Agent]:
+        """Agents subscribed to ``message_type``, in registration order."""
+        cached = self._candidates.get(message_type)
+        if cached is not None:
+            return cached
+
+        matched: Dict[int, Agent] = dict(self._unindexed)
+        for position, agent in self._exact.get(message_type, ()):
+            matched[position] = agent
+        for prefix, position, agent in self._prefixes:
+            if message_type.startswith(prefix):
+                matched[position] = agent
+
+        resolved = [matched[position] for position in sorted(matched)]
+        self._candidates[message_type] = resolved
+        return resolved
+
     def route(self, message: Message, blackboard: Blackboard) -> List[Agent]:
-        return [a for a in self.agents if a.can_handle(message, blackboard)]
+        handlers = self.match(message, blackboard)
+        if self.metrics is not None:
+            self.record_route(message, handlers)
+        return handlers
+
+    def match(self, message: Message, blackboard: Blackboard) -> List[Agent]:
+        """``route`` without counting, for callers that may look at a message more than once."""
+        return [a for a in self.candidates(message.type) if a.can_handle(message, blackboard)]
+
+    def record_route(self, message: Message, handlers: List[Agent]) -> None:
+        if self._routed is None:
+            if self.metrics is None:
+                return
+            self.attach_metrics(self.metrics)  # metrics assigned after construction
+        self._routed[message.type].inc()
+        if not handlers:
+            self._unhandled[message.type].inc()
+            return
+        delivered = self._delivered
+        for agent in handlers:
+            delivered[agent.name].inc()
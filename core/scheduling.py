@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+from .messages import Message
+from .plan import CompiledPlan, PlanNode
+
+# Default PriorityPolicy ordering (lower runs first): work that unblocks the
+# most downstream nodes ahead of rendering and bookkeeping.
+MESSAGE_TYPE_PRIORITIES: Dict[str, float] = {
+    "start": 0,
+    "plan": 0,
+    "parse_product": 1,
+    "generate_questions": 2,
+    "generate_block:*": 2,
+    "artifact_created": 3,
+    "render_page:*": 4,
+    "build_graph": 5,
+}
+
+
+class SchedulingPolicy:
+    """Order in which the event loop takes queued messages.
+
+    ``pop`` may return a message of a product that already finished; the
+    loop skips those. Policies travel inside catalog checkpoints, so keep
+    them (and any priority functions they hold) picklable.
+    """
+
+    def push(self, message: Message) -> None:
+        raise NotImplementedError
+
+    def pop(self) -> Message:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def drop(self, trace_id: Optional[str]) -> None:
+        """Forget queued messages of a finished product, where that is cheap."""
+
+
+class FIFOPolicy(SchedulingPolicy):
+    def __init__(self) -> None:
+        self._queue: Deque[Message] = deque()
+
+    def push(self, message: Message) -> None:
+        self._queue.append(message)
+
+    def pop(self) -> Message:
+        return self._queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+class RoundRobinPolicy(SchedulingPolicy):
+    """FIFO per product, taking one message from each product in turn.
+
+    A product with a long tail of work cannot stall the others. This is the
+    default for catalog runs.
+    """
+
+    def __init__(self) -> None:
+        self._queues: Dict[Optional[str], Deque[Message]] = {}
+        self._ring: Deque[Optional[str]] = deque()
+        self._size = 0
+
+    def push(self, message: Message) -> None:
+        queue = self._queues.get(message.trace_id)
+        if queue is None:
+            queue = self._queues[message.trace_id] = deque()
+            self._ring.append(message.trace_id)
+        queue.append(message)
+        self._size += 1
+
+    def pop(self) -> Message:
+        trace_id = self._ring.popleft()
+        queue = self._queues[trace_id]
+        message = queue.popleft()
+        if queue:
+            self._ring.append(trace_id)
+        else:
+            del self._queues[trace_id]
+        self._size -= 1
+        return message
+
+    def __len__(self) -> int:
+        return self._size
+
+    def drop(self, trace_id: Optional[str]) -> None:
+        queue = self._queues.pop(trace_id, None)
+        if queue is not None:
+            self._ring.remove(trace_id)
+            self._size -= len(queue)
+
+
+class PriorityPolicy(SchedulingPolicy):
+    """Lowest ``priority(message)`` first; FIFO among equal priorities.
+
+    ``priority`` is a callable or a mapping from message type (or
+    ``"prefix*"`` pattern) to priority, as in ``MESSAGE_TYPE_PRIORITIES``.
+    ``drop`` marks a product's queued entries dead; ``pop`` skips them and
+    the heap is compacted once they make up half of it.
+    """
+
+    def __init__(self, priority: Union[Mapping[str, float], Callable[[Message], float], None] = None):
+        if priority is None or isinstance(priority, Mapping):
+            priority = MessageTypePriority(priority if priority is not None else MESSAGE_TYPE_PRIORITIES)
+        self.priority = priority
+        self._heap: List[Tuple[float, int, Message]] = []
+        self._seq = 0
+        # Live entries per product; entries of a dropped product pushed
+        # before ``_dropped[trace_id]`` (a sequence number) are dead.
+        self._live: Dict[Optional[str], int] = {}
+        self._dropped: Dict[Optional[str], int] = {}
+        self._size = 0
+
+    def push(self, message: Message) -> None:
+        heapq.heappush(self._heap, (self.priority(message), self._seq, message))
+        self._seq += 1
+        self._live[message.trace_id] = self._live.get(message.trace_id, 0) + 1
+        self._size += 1
+
+    def pop(self) -> Message:
+        while True:
+            _, seq, message = heapq.heappop(self._heap)
+            if seq >= self._dropped.get(message.trace_id, -1):
+                break
+        live = self._live[message.trace_id] - 1
+        if live:
+            self._live[message.trace_id] = live
+        else:
+            del self._live[message.trace_id]
+        self._size -= 1
+        if not self._size:
+            self._heap.clear()
+            self._dropped.clear()
+        return message
+
+    def __len__(self) -> int:
+        return self._size
+
+    def drop(self, trace_id: Optional[str]) -> None:
+        live = self._live.pop(trace_id, 0)
+        if not live:
+            return
+        self._size -= live
+        self._dropped[trace_id] = self._seq
+        if len(self._heap) > 2 * self._size:
+            self._heap = [e for e in self._heap if e[1] >= self._dropped.get(e[2].trace_id, -1)]
+            heapq.heapify(self._heap)
+            self._dropped.clear()
+
+
+class EDFPolicy(PriorityPolicy):
+    """Earliest deadline first across products.
+
+    A product's deadline comes from ``deadlines[trace_id]`` or from the
+    ``"deadline"`` payload field of its first message (any comparable
+    number, e.g. seconds since the run started). Products without one run
+    after every product that has one.
+    """
+
+    def __init__(self, deadlines: Optional[Mapping[str, float]] = None):
+        self.deadlines: Dict[Optional[str], float] = dict(deadlines or {})
+        super().__init__(self._deadline)
+
+    def _deadline(self, message: Message) -> float:
+        deadline = self.deadlines.get(message.trace_id)
+        if deadline is None:
+            deadline = message.payload.get("deadline", math.inf)
+            self.deadlines[message.trace_id] = deadline
+        return deadline
+
+    def drop(self, trace_id: Optional[str]) -> None:
+        super().drop(trace_id)
+        self.deadlines.pop(trace_id, None)
+
+
+class MessageTypePriority:
+    """Priority by message type; ``"prefix*"`` keys match by prefix."""
+
+    def __init__(self, priorities: Mapping[str, float], default: float = math.inf):
+        self.exact = {k: v for k, v in priorities.items() if not k.endswith("*")}
+        self.prefixes = [(k[:-1], v) for k, v in priorities.items() if k.endswith("*")]
+        self.default = default
+
+    def __call__(self, message: Message) -> float:
+        priority = self.exact.get(message.type)
+        if priority is not None:
+            return priority
+        for prefix, priority in self.prefixes:
+            if message.type.startswith(prefix):
+                return priority
+        return self.default
+
+
+class GoalDistancePriority:
+    """Priority by how many plan steps a message is from producing a goal.
+
+    Sink nodes are 0 and every other node is one more than its nearest
+    consumer, so work closest to finishing a page runs first and products
+    complete sooner. ``artifact_created`` takes the distance of the node
+    that produced the announced key; anything outside the plan (``start``,
+    ``plan``) comes last.
+    """
+
+    def __init__(self, plan: CompiledPlan):
+        distances: Dict[str, float] = {}
+
+        def distance(node: PlanNode) -> float:
+            if node.name not in distances:
+                consumers = (distance(c) for key in node.outputs for c in plan.consumers(key))
+                distances[node.name] = 0 if node.sink else 1 + min(consumers, default=math.inf)
+            return distances[node.name]
+
+        for node in plan.nodes:
+            distance(node)
+        finite = [d for d in distances.values() if d != math.inf]
+        self.outside = max(finite, default=0) + 1
+        self.by_type = {n.message_type: distances[n.name] for n in plan.nodes if n.message_type}
+        self.by_key = {key: distances[n.name] for n in plan.nodes for key in n.outputs}
+
+    def __call__(self, message: Message) -> float:
+        if message.type == "artifact_created":
+            return self.by_key.get(message.payload.get("key"), self.outside)
+        return self.by_type.get(message.type, self.outside)
+
+
+def make_policy(name: str, plan: Optional[CompiledPlan] = None, **options: Any) -> SchedulingPolicy:
+    """Policy by name: fifo, round-robin, priority, goal-distance (needs ``plan``) or edf."""
+    if name == "fifo":
+        return FIFOPolicy()
+    if name == "round-robin":
+        return RoundRobinPolicy()
+    if name == "priority":
+        return PriorityPolicy(options.get("priorities"))
+    if name == "goal-distance":
+        if plan is None:
+            raise ValueError("goal-distance scheduling needs a plan")
+        return PriorityPolicy(GoalDistancePriority(plan))
+    if name == "edf":
+        return EDFPolicy(options.get("deadlines"))
+    raise ValueError(f"Unknown scheduling policy: {name}")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import copy
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from _json import encode_basestring as _encode_str
+except ImportError:  # pure-Python json fallback
+    from json.encoder import py_encode_basestring as _encode_str
+
+# Per-dataclass encoders, generated on first use: one dict display with the
+# fields unrolled instead of asdict's deep copy plus a second walk.
+_ENCODERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_COMPACT: Dict[bool, json.JSONEncoder] = {}
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Plain dicts/lists/scalars for ``obj``; dataclasses become dicts and enums their values."""
+    return _convert(obj, False)
+
+
+def encode_json(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> bytes:
+    """UTF-8 JSON for ``obj``, byte-identical to ``json.dumps(to_jsonable(obj), ensure_ascii=False, ...)``.
+
+    Without ``indent`` the output is compact (``","``/``":"`` separators) and
+    goes through the C encoder; with ``indent`` it matches ``json.dumps``'s
+    pretty layout while converting and formatting in a single walk.
+    """
+    if indent is None:
+        encoder = _COMPACT.get(sort_keys)
+        if encoder is None:
+            encoder = _COMPACT[sort_keys] = json.JSONEncoder(
+                ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+            )
+        return encoder.encode(_convert(obj, False)).encode("utf-8")
+    parts: List[str] = []
+    _Pretty(" " * indent, sort_keys, parts.append).write(obj, "\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _convert(obj: Any, nested: bool) -> Any:
+    # nested: inside a dataclass, where asdict used to copy tuples' contents
+    # before they were stringified.
+    t = type(obj)
+    if t is str or t is int or t is float or t is bool or obj is None:
+        return obj
+    if t is dict:
+        return {str(k): _convert(v, nested) for k, v in obj.items()}
+    if t is list:
+        return [_convert(v, nested) for v in obj]
+    encode = _ENCODERS.get(t)
+    if encode is not None:
+        return encode(obj)
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _encoder(t)(obj)
+    if isinstance(obj, dict):
+        return {str(k): _convert(v, nested) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_convert(v, nested) for v in obj]
+    if nested and isinstance(obj, tuple):
+        return str(_copied(obj))
+    return str(obj)
+
+
+def _encoder(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    encode = _ENCODERS.get(cls)
+    if encode is None:
+        items = []
+        for f in fields(cls):
+            if isinstance(f.type, type) and issubclass(f.type, Enum):
+                items.append(f"{f.name!r}: _enum(o.{f.name})")
+            else:
+                items.append(f"{f.name!r}: _convert(o.{f.name}, True)")
+        namespace: Dict[str, Any] = {"_convert": _convert, "_enum": _enum_value}
+        exec(f"def encode(o):\n    return {{{', '.join(items)}}}\n", namespace)
+        encode = _ENCODERS[cls] = namespace["encode"]
+    return encode
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else _convert(value, True)
+
+
+def _copied(obj: Any) -> Any:
+    # What asdict leaves inside a tuple field.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _copied(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return type(obj)(*[_copied(v) for v in obj])
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_copied(v) for v in obj)
+    if isinstance(obj, dict):
+        return type(obj)((_copied(k), _copied(v)) for k, v in obj.items())
+    return copy.deepcopy(obj)
+
+
+class _Pretty:
+    """``json.dumps(to_jsonable(obj), ensure_ascii=False, indent=...)`` in one pass."""
+
+    def __init__(self, indent: str, sort_keys: bool, emit: Callable[[str], Any]):
+        self.indent = indent
+        self.sort_keys = sort_keys
+        self.emit = emit
+
+    def write(self, obj: Any, newline: str) -> None:
+        t = type(obj)
+        if t is str:
+            self.emit(_encode_str(obj))
+        elif t is dict:
+            self._dict(obj, newline)
+        elif t is list:
+            self._list(obj, newline)
+        elif t is int:
+            self.emit(int.__repr__(obj))
+        elif obj is None:
+            self.emit("null")
+        elif t is bool:
+            self.emit("true" if obj else "false")
+        elif t is float:
+            self.emit(_float(obj))
+        else:
+            value = _convert(obj, False)
+            if isinstance(value, str):
+                self.emit(_encode_str(value))
+            elif isinstance(value, bool):
+                self.emit("true" if value else "false")
+            elif isinstance(value, int):
+                self.emit(int.__repr__(value))
+            elif isinstance(value, float):
+                self.emit(_float(value))
+            else:
+                self.write(value, newline)
+
+    def _dict(self, obj: Dict[Any, Any], newline: str) -> None:
+        if not obj:
+            self.emit("{}")
+            return
+        inner = newline + self.indent
+        items: Any = obj.items()
+        if self.sort_keys:
+            items = sorted(((str(k), v) for k, v in items), key=lambda item: item[0])
+        separator = "{" + inner
+        for key, value in items:
+            self.emit(separator)
+            self.emit(_encode_str(key if type(key) is str else str(key)))
+            self.emit(": ")
+            self.write(value, inner)
+            separator = "," + inner
+        self.emit(newline + "}")
+
+    def _list(self, obj: List[Any], newline: str) -> None:
+        if not obj:
+            self.emit("[]")
+            return
+        inner = newline + self.indent
+        separator = "[" + inner
+        for value in obj:
+            self.emit(separator)
+            self.write(value, inner)
+            separator = "," + inner
+        self.emit(newline + "]")
+
+
+def _float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .messages import Message
+
+
+@dataclass(slots=True)
+class Span:
+    """One ``handle`` call. Times are ``time.perf_counter()`` seconds."""
+
+    agent: str
+    message_type: str
+    trace_id: Optional[str]
+    start: float
+    duration: float
+    queue_wait: float
+    pid: int
+    tid: int
+
+
+class Tracer:
+    """Collects a span per agent ``handle`` call of the orchestrators it is given to.
+
+    Queue wait is the time from a message being queued to its handler
+    starting. Orchestrators only touch the tracer when one is set, so runs
+    without one pay nothing beyond a ``None`` check per message. Spans are
+    recorded on the loop thread; handlers that ran on a worker report their
+    own pid/tid and timings.
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        # trace_id -> id(message) -> (message, when queued); the message is
+        # kept so its id cannot be reused while the entry exists.
+        self._queued: Dict[Optional[str], Dict[int, Tuple[Message, float]]] = {}
+        self._free_lanes: List[int] = []
+        self._lanes = 0
+
+    def enqueued(self, message: Message) -> None:
+        queued = self._queued.get(message.trace_id)
+        if queued is None:
+            queued = self._queued[message.trace_id] = {}
+        queued[id(message)] = (message, time.perf_counter())
+
+    def dequeued(self, message: Message) -> float:
+        """When ``message`` was queued (now, if it never was)."""
+        queued = self._queued.get(message.trace_id)
+        entry = queued.pop(id(message), None) if queued is not None else None
+        return entry[1] if entry is not None else time.perf_counter()
+
+    def finish_trace(self, trace_id: Optional[str]) -> None:
+        """Forget messages of a finished product that will never be handled."""
+        self._queued.pop(trace_id, None)
+
+    def acquire_lane(self) -> int:
+        """Smallest free track id for a span that may overlap others on one thread.
+
+        Perfetto expects complete events on a track to nest, so concurrent
+        coroutines each take a lane for the duration of their span.
+        """
+        if self._free_lanes:
+            return heapq.heappop(self._free_lanes)
+        self._lanes += 1
+        return self._lanes
+
+    def release_lane(self, lane: int) -> None:
+        heapq.heappush(self._free_lanes, lane)
+
+    def record(
+        self,
+        agent: str,
+        message: Message,
+        queued_at: float,
+        start: float,
+        end: float,
+        pid: Optional[int] = None,
+        tid: Optional[int] = None,
+    ) -> None:
+        self.spans.append(
+            Span(
+                agent,
+                message.type,
+                message.trace_id,
+                start,
+                end - start,
+                max(start - queued_at, 0.0),
+                self.pid if pid is None else pid,
+                threading.get_native_id() if tid is None else tid,
+            )
+        )
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-agent call count and total/mean/max duration and queue wait, slowest total first."""
+        by_agent: Dict[str, List[Span]] = {}
+        for span in self.spans:
+            by_agent.setdefault(span.agent, []).append(span)
+        rows = [
+            {
+                "agent": agent,
+                "calls": len(spans),
+                "total": sum(s.duration for s in spans),
+                "mean": sum(s.duration for s in spans) / len(spans),
+                "max": max(s.duration for s in spans),
+                "queue_wait": sum(s.queue_wait for s in spans) / len(spans),
+            }
+            for agent, spans in by_agent.items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def events(self) -> Iterator[Dict[str, Any]]:
+        """Spans as Chrome Trace Event complete (``"X"``) events, then process names."""
+        for span in self.spans:
+            yield {
+                "name": span.agent,
+                "cat": span.message_type,
+                "ph": "X",
+                "ts": round((span.start - self.origin) * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": span.pid,
+                "tid": span.tid,
+                "args": {
+                    "message_type": span.message_type,
+                    "trace_id": span.trace_id,
+                    "queue_wait_us": round(span.queue_wait * 1e6, 3),
+                },
+            }
+        for pid in sorted({span.pid for span in self.spans}):
+            name = "orchestrator" if pid == self.pid else f"worker {pid}"
+            yield {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}}
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome Trace Event JSON object, as loaded by Perfetto and chrome://tracing."""
+        return {"traceEvents": list(self.events()), "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, Path]) -> None:
+        """Write ``to_chrome_trace()`` one event per line without building it in memory."""
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+            for i, event in enumerate(self.events()):
+                fh.write(",\n" if i else "")
+                fh.write(encode(event))
+            fh.write("\n]}\n")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from .agents import QuestionAgent
+from .agents.parser_agent import parse_product
+from .agents.planner_agent import PIPELINE_PLAN
+from .content_blocks import BenefitsBlock, ComparisonBlock, IngredientsBlock, SafetyBlock, UsageBlock
+from .core import Blackboard, CompiledPlan, EventLoopOrchestrator, Message
+from .models import ProductData
+from .templates import ComparisonTemplate, FAQTemplate, ProductTemplate
+from .templates.faq_template import ANSWER_READS
+
+# ProductData fields each reusable artifact reads directly. Dependencies on
+# other artifacts (a page on its blocks) come from the plan.
+ARTIFACT_READS: Dict[str, FrozenSet[str]] = {
+    "block:benefits": BenefitsBlock.reads,
+    "block:usage": UsageBlock.reads,
+    "block:ingredients": IngredientsBlock.reads,
+    "block:safety": SafetyBlock.reads,
+    "block:comparison": ComparisonBlock.reads,
+    "questions": QuestionAgent.reads,
+    "faq.json": FAQTemplate.reads,
+    "product_page.json": ProductTemplate.reads,
+    "comparison_page.json": ComparisonTemplate.reads,
+}
+
+# Inputs that are rebuilt for every run; their effect is covered by field reads.
+_PER_RUN_INPUTS = frozenset({"raw_product_data", "product_data"})
+
+
+@dataclass
+class RegenerationReport:
+    changed_fields: List[str] = field(default_factory=list)
+    recomputed: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+    # FAQ answer categories carried over into a re-rendered faq.json.
+    reused_faq_answers: List[str] = field(default_factory=list)
+
+
+def changed_fields(old: ProductData, new: ProductData) -> Set[str]:
+    return {f.name for f in fields(ProductData) if getattr(old, f.name) != getattr(new, f.name)}
+
+
+def dirty_artifacts(changed: Set[str], competitor_changed: bool = False, plan: CompiledPlan = PIPELINE_PLAN) -> Set[str]:
+    """Reusable artifacts that must be rebuilt for the given field changes."""
+    memo: Dict[str, bool] = {}
+
+    def is_dirty(key: str) -> bool:
+        if key in memo:
+            return memo[key]
+        if key == "competitor_product":
+            memo[key] = competitor_changed
+            return competitor_changed
+        memo[key] = bool(ARTIFACT_READS.get(key, frozenset()) & changed)
+        producer = plan.producer(key)
+        if producer is not None and not memo[key]:
+            memo[key] = any(is_dirty(k) for k in producer.inputs if k not in _PER_RUN_INPUTS)
+        return memo[key]
+
+    return {key for key in ARTIFACT_READS if is_dirty(key)}
+
+
+def regenerate(
+    orchestrator: EventLoopOrchestrator,
+    previous: Mapping[str, Any],
+    raw_product_data: Dict[str, Any],
+    goals: List[str],
+    competitor_data: Optional[Dict[str, Any]] = None,
+    trace_id: str = "run-1",
+) -> Tuple[Blackboard, RegenerationReport]:
+    """Rebuild a product's pages from ``previous`` run artifacts.
+
+    Blocks, questions and pages whose inputs did not change are carried over;
+    a re-rendered FAQ keeps the answers of categories whose fields did not
+    change. ``graph.json`` always reflects the new run.
+    """
+    old_product: ProductData = previous["product_data"]
+    changed = changed_fields(old_product, parse_product(raw_product_data))
+    dirty = dirty_artifacts(changed, competitor_changed=previous.get("competitor_data") != competitor_data)
+
+    seed = {key: previous[key] for key in ARTIFACT_READS if key not in dirty and previous.get(key) is not None}
+    report = RegenerationReport(changed_fields=sorted(changed), reused=sorted(seed))
+
+    if "faq.json" in dirty and "questions" not in dirty and previous.get("faq.json") is not None:
+        categories = sorted(c for c, reads in ANSWER_READS.items() if not reads & changed)
+        seed["faq_answers"] = {
+            (item["category"], item["question"]): item["answer"]
+            for item in previous["faq.json"]["faq_items"]
+            if item["category"] in categories
+        }
+        report.reused_faq_answers = categories
+
+    start = Message(
+        type="start",
+        payload={"raw_product_data": raw_product_data, "competitor_data": competitor_data},
+        source="User",
+        trace_id=trace_id,
+    )
+    bb = orchestrator.run([start], goals, artifacts=seed)
+
+    report.recomputed = [
+        entry["key"]
+        for entry in bb.event_log
+        if entry.get("event") == "artifact_created" and entry["key"] in ARTIFACT_READS and entry["producer"] != "PreviousRun"
+    ]
+    return bb, report
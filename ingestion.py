@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .agents.parser_agent import FIELD_MAP, LIST_FIELDS
+
+# Raw record columns, in ParserAgent's field order.
+RECORD_COLUMNS: Tuple[str, ...] = tuple(FIELD_MAP.values())
+_LIST_COLUMNS = frozenset(FIELD_MAP[attr] for attr in LIST_FIELDS)
+
+
+@dataclass
+class SkippedRecord:
+    line: int
+    reason: str
+
+
+@dataclass
+class IngestionReport:
+    read: int = 0
+    accepted: int = 0
+    skipped: int = 0
+    # Only the first max_errors skips are kept so the report stays bounded.
+    errors: List[SkippedRecord] = field(default_factory=list)
+    max_errors: int = 100
+
+    def skip(self, line: int, reason: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(SkippedRecord(line, reason))
+
+
+def validate_record(record: Any) -> Optional[str]:
+    """Why ``record`` cannot be parsed as a product, or None when it can."""
+    if not isinstance(record, dict):
+        return f"expected an object, got {type(record).__name__}"
+    if None in record:
+        return "row has more fields than the header"
+    name = record.get("Product Name")
+    if not isinstance(name, str) or not name.strip():
+        return "missing Product Name"
+    for column in RECORD_COLUMNS:
+        value = record.get(column)
+        if value is None:
+            continue
+        if isinstance(value, list) and column in _LIST_COLUMNS:
+            continue
+        if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+            return f"unexpected {type(value).__name__} for {column}"
+    return None
+
+
+def iter_jsonl(path: Union[str, Path], report: Optional[IngestionReport] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Lazily yield ``(trace_id, record)`` pairs from a JSON Lines catalog."""
+    report = report if report is not None else IngestionReport()
+    with open(path, encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            report.read += 1
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                report.skip(line_no, f"invalid JSON: {exc.msg}")
+                continue
+            reason = validate_record(record)
+            if reason:
+                report.skip(line_no, reason)
+                continue
+            report.accepted += 1
+            yield f"product-{line_no}", record
+
+
+def iter_csv(path: Union[str, Path], report: Optional[IngestionReport] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Lazily yield ``(trace_id, record)`` pairs from a CSV catalog with a header row."""
+    report = report if report is not None else IngestionReport()
+    with open(path, encoding="utf-8", newline="") as fh:
+        reader = csv.DictReader(fh)
+        for record in reader:
+            report.read += 1
+            reason = validate_record(record)
+            if reason:
+                report.skip(reader.line_num, reason)
+                continue
+            report.accepted += 1
+            yield f"product-{reader.line_num}", record
+
+
+def iter_json_array(path: Union[str, Path], report: Optional[IngestionReport] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(trace_id, record)`` pairs from a catalog holding one JSON array.
+
+    The array is parsed whole, so memory is not bounded as for JSON Lines;
+    records are validated the same way and "line" in the report is the
+    record's 1-based position in the array.
+    """
+    report = report if report is not None else IngestionReport()
+    with open(path, encoding="utf-8") as fh:
+        records = json.load(fh)
+    if not isinstance(records, list):
+        raise ValueError(f"{path}: expected a JSON array of products, got {type(records).__name__}")
+    for index, record in enumerate(records, 1):
+        report.read += 1
+        reason = validate_record(record)
+        if reason:
+            report.skip(index, reason)
+            continue
+        report.accepted += 1
+        yield f"product-{index}", record
+
+
+def iter_catalog(path: Union[str, Path], report: Optional[IngestionReport] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Read a ``.json`` array, or stream a ``.jsonl``/``.ndjson`` or ``.csv`` catalog, picked by file suffix."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".json":
+        return iter_json_array(path, report)
+    if suffix in {".jsonl", ".ndjson"}:
+        return iter_jsonl(path, report)
+    if suffix == ".csv":
+        return iter_csv(path, report)
+    raise ValueError(f"Unsupported catalog format: {suffix}")
@@ -11,7 +11,7 @@ class QuestionCategory(str, Enum):
     COMPARISON = "comparison"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductData:
     name: str
     concentration: str
@@ -23,14 +23,14 @@ class ProductData:
     price: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     text: str
     category: QuestionCategory
     answer_template: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     block_type: str
     content: Dict[str, Any]
@@ -46,7 +46,7 @@ class Template:
     dependencies: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedPage:
     page_type: str
     title: str
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .core import encode_json
+
+_STOP = object()
+# Data-only sync where the platform has it; metadata is covered by the
+# directory fsync after the renames.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def shard_dir(root: Path, trace_id: str, width: int = 2) -> Path:
+    """Directory for ``trace_id`` under ``root``, fanned out by a hash prefix.
+
+    With ``width`` hex characters there are ``16 ** width`` subdirectories, so
+    a catalog of hundreds of thousands of products never puts them all in one
+    directory. ``width=0`` disables sharding.
+    """
+    if width <= 0:
+        return root / trace_id
+    prefix = hashlib.sha1(trace_id.encode("utf-8")).hexdigest()[:width]
+    return root / prefix / trace_id
+
+
+@dataclass
+class WriterStats:
+    files: int = 0
+    bytes: int = 0
+    batches: int = 0
+    fsyncs: int = 0
+    # Time the writer thread spent writing, and the wall time it was open.
+    busy_seconds: float = 0.0
+    elapsed: float = 0.0
+    max_queue_depth: int = 0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / self.elapsed / 1e6 if self.elapsed else 0.0
+
+
+class OutputWriter:
+    """Writes pages on a background thread fed by a bounded queue.
+
+    ``write``/``write_json`` block once ``max_queue`` files are waiting, so a
+    slow disk applies backpressure to the run instead of buffering pages.
+    Each file goes to a temp file in its target directory and is renamed
+    into place, so readers never see a partial page. The writer drains up to
+    ``batch_size`` files at a time. When ``durable`` is set, the whole batch
+    is written first and its files are then synced in one pass before any
+    rename (one data sync per file, but no file waits on the disk while
+    others are still being written), followed by one fsync per touched
+    directory.
+    """
+
+    def __init__(self, max_queue: int = 1024, batch_size: int = 64, durable: bool = False) -> None:
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.durable = durable
+        self.stats = WriterStats()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._error: Optional[BaseException] = None
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="OutputWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, path: Union[str, Path], content: Union[str, bytes]) -> None:
+        self._check()
+        self._queue.put((Path(path), content))
+        depth = self._queue.qsize()
+        if depth > self.stats.max_queue_depth:
+            self.stats.max_queue_depth = depth
+
+    def write_json(self, path: Union[str, Path], obj: Any) -> None:
+        # Serialized on the writer thread; obj must not change after this call.
+        self.write(path, _Json(obj))
+
+    def flush(self) -> None:
+        """Block until every file queued so far is on disk."""
+        self._queue.join()
+        self._check()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def close(self) -> WriterStats:
+        """Flush everything queued, stop the thread and return the stats."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+            self.stats.elapsed = time.perf_counter() - self._started
+        self._check()
+        return self.stats
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("output writer failed") from self._error
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                batch.pop()
+                stopping = True
+            if batch and self._error is None:
+                start = time.perf_counter()
+                try:
+                    self._write_batch(batch)
+                except BaseException as exc:  # surfaced to the producer on its next call
+                    self._error = exc
+                self.stats.busy_seconds += time.perf_counter() - start
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[Path, Any]]) -> None:
+        staged: List[Tuple[str, Path]] = []
+        dirs: Dict[Path, None] = {}
+        # Durable batches keep their files open until the sync pass.
+        unsynced: List[Any] = []
+        try:
+            for path, content in batch:
+                data = _encode(content)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+                staged.append((tmp, path))
+                fh = os.fdopen(fd, "wb")
+                if self.durable:
+                    unsynced.append(fh)
+                    fh.write(data)
+                else:
+                    with fh:
+                        fh.write(data)
+                self.stats.bytes += len(data)
+                dirs[path.parent] = None
+            for fh in unsynced:
+                fh.flush()
+            for fh in unsynced:
+                _datasync(fh.fileno())
+                self.stats.fsyncs += 1
+            while unsynced:
+                unsynced.pop().close()
+            for tmp, path in staged:
+                os.replace(tmp, path)
+            staged = []
+        finally:
+            for fh in unsynced:
+                fh.close()
+            for tmp, _ in staged:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+        if self.durable:
+            for directory in dirs:
+                _fsync_dir(directory)
+                self.stats.fsyncs += 1
+        self.stats.files += len(batch)
+        self.stats.batches += 1
+
+
+class _Json:
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+
+def _encode(content: Any) -> bytes:
+    if isinstance(content, _Json):
+        return encode_json(content.obj, indent=2)
+    if isinstance(content, str):
+        return content.encode("utf-8")
+    return content
+
+
+def _fsync_dir(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # e.g. directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
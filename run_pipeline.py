@@ -1,5 +1,9 @@
-import json
+import argparse
+import asyncio
+import time
+from functools import partial
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .agents import (
     BenefitsAgent,
@@ -13,10 +17,253 @@ from .agents import (
     SafetyAgent,
     UsageAgent,
 )
-from .core import AgentRegistry, EventLoopOrchestrator, Message
+from .agents.planner_agent import PIPELINE_PLAN
+from .core import (
+    AgentRegistry,
+    ArtifactLifetimes,
+    AsyncEventLoopOrchestrator,
+    CheckpointStore,
+    ConcurrentEventLoopOrchestrator,
+    ContentCache,
+    EventLogConfig,
+    EventLoopOrchestrator,
+    EventSpill,
+    MemoryAccountant,
+    Message,
+    MetricsRegistry,
+    Tracer,
+    cache_collector,
+    make_policy,
+)
+from .core.event_log import LEVELS
+from .ingestion import IngestionReport, iter_catalog
+from .output_writer import OutputWriter, WriterStats, shard_dir
+from .sharded_runner import ShardedRunReport, iter_sharded
+
+_GOALS = ("faq.json", "product_page.json", "comparison_page.json", "graph.json")
+
+
+def build_registry(
+    cache: Optional[ContentCache] = None,
+    graph_latency: bool = False,
+    metrics: Optional[MetricsRegistry] = None,
+    lifetimes: Optional[ArtifactLifetimes] = None,
+) -> AgentRegistry:
+    registry = AgentRegistry(metrics=metrics)
+    registry.register(PlannerAgent(lifetimes=lifetimes))
+    registry.register(ParserAgent())
+    registry.register(BenefitsAgent(cache))
+    registry.register(UsageAgent(cache))
+    registry.register(IngredientsAgent(cache))
+    registry.register(SafetyAgent(cache))
+    registry.register(ComparisonAgent(cache))
+    registry.register(QuestionAgent())
+    registry.register(PageRenderAgent(cache))
+    registry.register(GraphAgent(latency=graph_latency))
+    return registry
+
+
+def run_catalog(
+    products: Iterable[Tuple[str, Dict[str, Any]]],
+    output_dir: Path,
+    goals: List[str],
+    cache: Optional[ContentCache] = None,
+    max_in_flight: int = 256,
+    writer: Optional[OutputWriter] = None,
+    shard_width: int = 2,
+    checkpoint_path: Optional[Path] = None,
+    checkpoint_interval: int = 10000,
+    scheduler: str = "round-robin",
+    max_queue_size: Optional[int] = None,
+    event_log: Optional[EventLogConfig] = None,
+    graph_view: str = "trace",
+    graph_latency: bool = False,
+    tracer: Optional[Tracer] = None,
+    metrics: Optional[MetricsRegistry] = None,
+    memory: Optional[MemoryAccountant] = None,
+    lifetimes: Optional[ArtifactLifetimes] = None,
+) -> None:
+    # One registry for the whole catalog: every product reuses the same
+    # TemplateEngine and QuestionAgent templates.
+    orchestrator = EventLoopOrchestrator(
+        build_registry(cache, graph_latency, metrics, lifetimes),
+        partial(make_policy, scheduler, PIPELINE_PLAN),
+        max_queue_size,
+        event_log,
+        graph_view,
+        tracer,
+        memory=memory,
+    )
+    initial_messages = (_start_message(trace_id, product_data, output_dir) for trace_id, product_data in products)
+
+    start = time.perf_counter()
+    completed = total = 0
+    writer = writer or OutputWriter()
+    checkpoint = None
+    if checkpoint_path is not None:
+        # Pages of products a checkpoint records as finished must be on disk first.
+        checkpoint = CheckpointStore(checkpoint_path, checkpoint_interval, on_save=writer.flush)
+        if checkpoint_path.exists():
+            print(f"Resuming from checkpoint {checkpoint_path}")
+    # Pages are queued for the writer thread as each product finishes and its
+    # board is dropped.
+    products_done = orchestrator.stream_catalog(initial_messages, goals, max_in_flight=max_in_flight, checkpoint=checkpoint)
+    for trace_id, bb in products_done:
+        total += 1
+        if not bb.goals_satisfied():
+            print(f"⚠ {trace_id}: goals not satisfied")
+            continue
+        completed += 1
+        product_dir = shard_dir(output_dir, trace_id, shard_width)
+        for filename in goals:
+            writer.write_json(product_dir / filename, bb.get(filename))
+    if orchestrator.graph is not None:
+        # The whole-run graph, complete now that every product has finished.
+        writer.write_json(output_dir / "graph.json", orchestrator.graph.to_json(latency=graph_latency))
+    writer.close()
+    elapsed = time.perf_counter() - start
+    _print_writer_stats(writer.stats)
+
+    rate = completed / elapsed if elapsed else float("inf")
+    print(f"\nProducts completed: {completed}/{total} in {elapsed:.3f}s ({rate:.1f} products/s)")
+    if checkpoint is not None:
+        share = checkpoint.seconds / elapsed if elapsed else 0.0
+        print(
+            f"Checkpoints: {checkpoint.saves} saved every {checkpoint.interval} messages, "
+            f"last {checkpoint.last_bytes / 1e3:.1f} KB, {checkpoint.seconds:.3f}s ({share:.1%} of run)"
+        )
+
+
+def run_catalog_sharded(
+    products: Iterable[Tuple[str, Dict[str, Any]]],
+    output_dir: Path,
+    goals: List[str],
+    workers: int,
+    chunk_size: int,
+    cache: Optional[ContentCache] = None,
+    writer: Optional[OutputWriter] = None,
+    shard_width: int = 2,
+    scheduler: str = "round-robin",
+) -> None:
+    # Workers open the cache's SQLite file; their lookup counts are merged
+    # back into ``cache`` so its stats cover the whole run.
+    report = ShardedRunReport(workers=workers)
+    writer = writer or OutputWriter()
+    cache_path = cache.path if cache is not None else None
+    start = time.perf_counter()
+    for result in iter_sharded(products, goals, workers, chunk_size, cache_path, scheduler=scheduler):
+        for trace_id in result.failed:
+            print(f"⚠ {trace_id}: goals not satisfied")
+        for trace_id, pages in result.pages.items():
+            product_dir = shard_dir(output_dir, trace_id, shard_width)
+            for filename, content in pages.items():
+                writer.write(product_dir / filename, content)
+        report.merge(result)
+    writer.close()
+    report.elapsed = time.perf_counter() - start
+    if cache is not None:
+        cache.merge_counts(report.cache_counts)
+
+    _print_writer_stats(writer.stats)
+    print("Events: " + ", ".join(f"{event}={count}" for event, count in sorted(report.event_counts.items())))
+    print(
+        f"Products completed: {report.completed}/{report.products} in {report.elapsed:.3f}s "
+        f"({report.products_per_second:.1f} products/s, {report.workers} workers, {report.chunks} chunks)"
+    )
+
+
+def _start_message(trace_id: str, product_data: Dict[str, Any], output_dir: Path) -> Message:
+    # An optional per-record "deadline" (any number, e.g. seconds from the
+    # start of the run) orders products under --scheduler edf; it is not
+    # product data.
+    deadline = None
+    if "deadline" in product_data:
+        product_data = dict(product_data)
+        deadline = product_data.pop("deadline")
+    payload: Dict[str, Any] = {"raw_product_data": product_data, "competitor_data": None, "output_dir": str(output_dir)}
+    if deadline not in (None, ""):
+        payload["deadline"] = float(deadline)
+    return Message(type="start", payload=payload, source="User", trace_id=trace_id)
+
 
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the multi-agent content generation pipeline.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--executor", choices=["thread", "process"], help="run independent block agents concurrently on this pool")
+    mode.add_argument("--asyncio", action="store_true", help="drive the message queue with AsyncEventLoopOrchestrator")
+    mode.add_argument("--catalog", type=Path, help="products to run interleaved in one event loop: JSON array, or streamed .jsonl/.csv")
+    parser.add_argument(
+        "--goals",
+        nargs="+",
+        choices=_GOALS,
+        default=list(_GOALS),
+        help="pages to build; artifacts no requested page depends on are skipped",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker count for --executor, or shard --catalog across this many processes")
+    parser.add_argument("--chunk-size", type=int, default=100, help="products per shard task with --catalog --workers")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="products admitted at once in --catalog mode")
+    parser.add_argument("--shard-width", type=int, default=2, help="hex digits of trace_id hash used to fan out catalog output directories (0 disables)")
+    parser.add_argument("--durable", action="store_true", help="fsync written pages and their directories")
+    parser.add_argument(
+        "--scheduler",
+        choices=["round-robin", "fifo", "priority", "goal-distance", "edf"],
+        default="round-robin",
+        help="message scheduling policy for --catalog runs; edf orders products by each record's optional \"deadline\" field",
+    )
+    parser.add_argument("--max-queue-size", type=int, help="stop admitting products while this many messages are queued")
+    parser.add_argument("--log-level", choices=list(LEVELS), default="debug", help="event log verbosity")
+    parser.add_argument("--log-max-entries", type=int, help="keep only the newest N event log entries per blackboard in memory")
+    parser.add_argument("--log-spill", type=Path, help="stream every event log entry to this NDJSON file")
+    parser.add_argument("--checkpoint", type=Path, help="checkpoint file for --catalog runs; resumes from it if present")
+    parser.add_argument("--checkpoint-interval", type=int, default=10000, help="messages processed between checkpoints")
+    parser.add_argument(
+        "--graph-view",
+        choices=["trace", "run"],
+        default="trace",
+        help="graph.json per product, or aggregated over every product of the run",
+    )
+    parser.add_argument("--graph-latency", action="store_true", help="add per-edge latency statistics to graph.json")
+    parser.add_argument(
+        "--trace", type=Path, help="write a Chrome trace (open in Perfetto) of every agent handle call; not for sharded runs"
+    )
+    parser.add_argument("--metrics", type=Path, help="write Prometheus text metrics to this file when the run ends")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on 127.0.0.1:PORT/metrics during the run")
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="trace allocations per agent and print which blackboard keys hold the most memory; slow, not for sharded or asyncio runs",
+    )
+    parser.add_argument(
+        "--release-intermediates",
+        action="store_true",
+        help="drop intermediate artifacts from each blackboard once no pending page needs them; not for sharded runs",
+    )
+    parser.add_argument("--pin", nargs="+", default=[], metavar="KEY", help="keep these artifacts with --release-intermediates")
+    parser.add_argument(
+        "--spill-artifacts", type=Path, help="with --release-intermediates, append released artifacts to this NDJSON file"
+    )
+    parser.add_argument("--cache", type=Path, help="SQLite file backing the content cache for blocks and rendered pages")
+    args = parser.parse_args(argv)
+    if args.catalog and args.workers:
+        # Sharded workers run their own registries and boards; these options
+        # only apply to the in-process event loop and would be ignored.
+        unsupported = {
+            "--trace": args.trace,
+            "--metrics": args.metrics,
+            "--metrics-port": args.metrics_port is not None,
+            "--memory-report": args.memory_report,
+            "--release-intermediates": args.release_intermediates,
+            "--checkpoint": args.checkpoint,
+            "--max-queue-size": args.max_queue_size is not None,
+            "--log-max-entries": args.log_max_entries is not None,
+            "--log-spill": args.log_spill,
+            "--graph-latency": args.graph_latency,
+            "--graph-view run": args.graph_view == "run",
+        }
+        rejected = [flag for flag, given in unsupported.items() if given]
+        if rejected:
+            parser.error(f"not supported with --catalog --workers: {', '.join(rejected)}")
 
-def main() -> None:
     product_data = {
         "Product Name": "GlowBoost Vitamin C Serum",
         "Concentration": "10% Vitamin C",
@@ -31,21 +278,91 @@ def main() -> None:
     output_dir = Path(__file__).parent / "outputs"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    registry = AgentRegistry()
-    registry.register(PlannerAgent())
-    registry.register(ParserAgent())
-    registry.register(BenefitsAgent())
-    registry.register(UsageAgent())
-    registry.register(IngredientsAgent())
-    registry.register(SafetyAgent())
-    registry.register(ComparisonAgent())
-    registry.register(QuestionAgent())
-    registry.register(PageRenderAgent())
-    registry.register(GraphAgent())
+    goals = args.goals
+    cache = ContentCache(path=args.cache) if args.cache else None
+    # A resumed catalog run keeps the spilled log of the run it continues.
+    resuming = args.catalog is not None and args.checkpoint is not None and args.checkpoint.exists()
+    event_log = EventLogConfig(args.log_level, args.log_max_entries, args.log_spill, spill_append=resuming)
+    tracer = Tracer() if args.trace else None
+    memory = MemoryAccountant() if args.memory_report else None
+    lifetimes = None
+    if args.release_intermediates:
+        spill = EventSpill(args.spill_artifacts) if args.spill_artifacts else None
+        lifetimes = ArtifactLifetimes(frozenset(args.pin), spill)
+    metrics = MetricsRegistry() if args.metrics or args.metrics_port is not None else None
+    if metrics is not None:
+        if cache is not None:
+            metrics.register_collector(cache_collector(cache))
+        if args.metrics_port is not None:
+            server = metrics.serve(args.metrics_port)
+            print(f"Serving metrics on http://{server.server_address[0]}:{server.server_address[1]}/metrics")
+
+    if args.catalog:
+        ingestion = IngestionReport()
+        products = iter_catalog(args.catalog, ingestion)
+        writer = OutputWriter(durable=args.durable)
+        if args.workers:
+            run_catalog_sharded(
+                products,
+                output_dir / "catalog",
+                goals,
+                args.workers,
+                args.chunk_size,
+                cache,
+                writer,
+                args.shard_width,
+                args.scheduler,
+            )
+            _print_cache_stats(cache)
+        else:
+            run_catalog(
+                products,
+                output_dir / "catalog",
+                goals,
+                cache,
+                args.max_in_flight,
+                writer,
+                args.shard_width,
+                args.checkpoint,
+                args.checkpoint_interval,
+                args.scheduler,
+                args.max_queue_size,
+                event_log,
+                args.graph_view,
+                args.graph_latency,
+                tracer,
+                metrics,
+                memory,
+                lifetimes,
+            )
+            _write_metrics(metrics, args.metrics)
+            _print_cache_stats(cache)
+            _write_trace(tracer, args.trace)
+            _print_memory_report(memory)
+        if ingestion.skipped:
+            print(f"Skipped {ingestion.skipped} of {ingestion.read} records:")
+            for skipped in ingestion.errors:
+                print(f"  line {skipped.line}: {skipped.reason}")
+        return
 
-    orchestrator = EventLoopOrchestrator(registry)
+    registry = build_registry(cache, args.graph_latency, metrics, lifetimes)
+    if args.executor:
+        orchestrator = ConcurrentEventLoopOrchestrator(
+            registry,
+            executor=args.executor,
+            max_workers=args.workers,
+            event_log=event_log,
+            graph_view=args.graph_view,
+            tracer=tracer,
+            memory=memory,
+        )
+    elif args.asyncio:
+        orchestrator = AsyncEventLoopOrchestrator(registry, tracer=tracer)
+    else:
+        orchestrator = EventLoopOrchestrator(
+            registry, event_log=event_log, graph_view=args.graph_view, tracer=tracer, memory=memory
+        )
 
-    goals = ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]
     initial_messages = [
         Message(
             type="start",
@@ -55,7 +372,10 @@ def main() -> None:
         )
     ]
 
-    bb = orchestrator.run(initial_messages=initial_messages, goals=goals)
+    if args.asyncio:
+        bb = asyncio.run(orchestrator.run(initial_messages=initial_messages, goals=goals))
+    else:
+        bb = orchestrator.run(initial_messages=initial_messages, goals=goals)
 
     # Show message flow
     print("\n=== MESSAGE FLOW ===")
@@ -64,6 +384,8 @@ def main() -> None:
             print(f"{i:2d}. {event['type']} from {event.get('source', 'Unknown')}")
         elif event.get("event") == "artifact_created":
             print(f"    → Artifact created: {event['key']} by {event['producer']}")
+        elif event.get("event") == "artifact_released":
+            print(f"    ← Artifact released: {event['key']}")
         elif event.get("event") == "unhandled":
             print(f"    ⚠ Unhandled message: {event['type']}")
 
@@ -71,11 +393,62 @@ def main() -> None:
     print(f"Total artifacts created: {len([e for e in bb.event_log if e.get('event') == 'artifact_created'])}")
 
     # Persist artifacts (schemas must match exactly)
-    for filename in ["faq.json", "product_page.json", "comparison_page.json", "graph.json"]:
-        content = bb.get(filename)
-        (output_dir / filename).write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding="utf-8")
-        print(f"✓ Created {filename}")
+    with OutputWriter(durable=args.durable) as writer:
+        for filename in goals:
+            writer.write_json(output_dir / filename, bb.get(filename))
+            print(f"✓ Created {filename}")
+    _write_metrics(metrics, args.metrics)
+    _print_cache_stats(cache)
+    _write_trace(tracer, args.trace)
+    _print_memory_report(memory)
+
+
+def _print_writer_stats(stats: WriterStats) -> None:
+    print(
+        f"\nWriter: {stats.files} files, {stats.bytes / 1e6:.1f} MB in {stats.elapsed:.3f}s "
+        f"({stats.files_per_second:.0f} files/s, {stats.megabytes_per_second:.1f} MB/s, "
+        f"{stats.fsyncs} fsyncs, max queue depth {stats.max_queue_depth})"
+    )
+
+
+def _print_cache_stats(cache: Optional[ContentCache]) -> None:
+    if cache is None:
+        return
+    stats = cache.stats()
+    print(
+        f"Cache: {stats['memory_hits']} memory hits, {stats['disk_hits']} disk hits, "
+        f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)"
+    )
+    cache.close()
+
+
+def _write_metrics(metrics: Optional[MetricsRegistry], path: Optional[Path]) -> None:
+    if metrics is not None and path is not None:
+        metrics.write(path)
+        print(f"Metrics written to {path}")
+
+
+def _write_trace(tracer: Optional[Tracer], path: Optional[Path]) -> None:
+    if tracer is None or path is None:
+        return
+    tracer.write(path)
+    print(f"\nTrace: {len(tracer.spans)} spans written to {path}")
+    print(f"{'agent':<20} {'calls':>7} {'total ms':>9} {'mean ms':>8} {'max ms':>8} {'wait ms':>8}")
+    for row in tracer.summary():
+        print(
+            f"{row['agent']:<20} {row['calls']:>7} {row['total'] * 1e3:>9.1f} {row['mean'] * 1e3:>8.3f} "
+            f"{row['max'] * 1e3:>8.3f} {row['queue_wait'] * 1e3:>8.3f}"
+        )
+
+
+def _print_memory_report(memory: Optional[MemoryAccountant]) -> None:
+    if memory is None:
+        return
+    memory.stop()
+    print("\n=== MEMORY ===")
+    print(memory.report.format())
 
 
 if __name__ == "__main__":
     main()
+
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .core import ContentCache, EventLoopOrchestrator, Message, encode_json, make_policy
+
+# Built once per worker process by _init_worker and reused for every chunk.
+_orchestrator: Optional[EventLoopOrchestrator] = None
+_cache: Optional[ContentCache] = None
+
+
+@dataclass
+class ShardResult:
+    pages: Dict[str, Dict[str, bytes]]
+    failed: List[str]
+    event_counts: Dict[str, int]
+    elapsed: float
+    pid: int
+    # This chunk's ContentCache lookups, as ContentCache.counts().
+    cache_counts: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+
+@dataclass
+class ShardedRunReport:
+    """Counts merged from every chunk; pages are not kept."""
+
+    completed: int = 0
+    failed: List[str] = field(default_factory=list)
+    event_counts: Dict[str, int] = field(default_factory=dict)
+    products: int = 0
+    chunks: int = 0
+    workers: int = 0
+    elapsed: float = 0.0
+    busy_seconds: float = 0.0
+    cache_counts: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    def merge(self, result: ShardResult) -> None:
+        self.chunks += 1
+        self.products += len(result.pages) + len(result.failed)
+        self.completed += len(result.pages)
+        self.failed.extend(result.failed)
+        self.busy_seconds += result.elapsed
+        for event, count in result.event_counts.items():
+            self.event_counts[event] = self.event_counts.get(event, 0) + count
+        self.cache_counts = tuple(a + b for a, b in zip(self.cache_counts, result.cache_counts))
+
+    @property
+    def products_per_second(self) -> float:
+        return self.products / self.elapsed if self.elapsed else 0.0
+
+
+def _init_worker(cache_path: Optional[str] = None, scheduler: str = "round-robin") -> None:
+    global _orchestrator, _cache
+    from .agents.planner_agent import PIPELINE_PLAN
+    from .run_pipeline import build_registry
+
+    _cache = ContentCache(path=cache_path) if cache_path else None
+    _orchestrator = EventLoopOrchestrator(build_registry(_cache), partial(make_policy, scheduler, PIPELINE_PLAN))
+
+
+def _run_chunk(chunk: List[Tuple[str, Dict[str, Any]]], goals: List[str]) -> ShardResult:
+    if _orchestrator is None:
+        _init_worker()
+
+    start = time.perf_counter()
+    counts_before = _cache.counts() if _cache is not None else (0, 0, 0, 0)
+    initial_messages = [
+        Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+        for trace_id, raw in chunk
+    ]
+    root = _orchestrator.run_catalog(initial_messages=initial_messages, goals=goals)
+
+    pages: Dict[str, Dict[str, bytes]] = {}
+    failed: List[str] = []
+    event_counts: Counter = Counter()
+    for trace_id, bb in root.scopes.items():
+        event_counts.update(entry.get("event") for entry in bb.event_log)
+        if not bb.goals_satisfied():
+            failed.append(trace_id)
+            continue
+        pages[trace_id] = {goal: encode_json(bb.get(goal), indent=2) for goal in goals}
+
+    cache_counts = _cache.counts() if _cache is not None else (0, 0, 0, 0)
+    cache_counts = tuple(after - before for after, before in zip(cache_counts, counts_before))
+    return ShardResult(pages, failed, dict(event_counts), time.perf_counter() - start, os.getpid(), cache_counts)
+
+
+def _chunks(products: Iterable[Tuple[str, Dict[str, Any]]], chunk_size: int) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+    it = iter(products)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_sharded(
+    products: Iterable[Tuple[str, Dict[str, Any]]],
+    goals: List[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 100,
+    cache_path: Optional[Union[str, Path]] = None,
+    max_pending: Optional[int] = None,
+    scheduler: str = "round-robin",
+) -> Iterator[ShardResult]:
+    """Run a catalog of ``(trace_id, raw_product_data)`` pairs on a process pool.
+
+    Each worker builds its registry once and runs whole chunks with
+    ``run_catalog``. Products are pulled lazily and at most ``max_pending``
+    chunks (default: twice the worker count) are in flight, so a streamed
+    catalog never sits in memory as a whole. Results are yielded in
+    submission order. With ``cache_path`` every worker opens the same
+    SQLite content cache. ``scheduler`` names the ``make_policy`` queue each
+    worker's catalog run uses.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+
+    initargs = (str(cache_path) if cache_path else None, scheduler)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in _chunks(products, chunk_size):
+            pending.append(pool.submit(_run_chunk, chunk, goals))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_sharded(
+    products: Iterable[Tuple[str, Dict[str, Any]]],
+    goals: List[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 100,
+    cache_path: Optional[Union[str, Path]] = None,
+    scheduler: str = "round-robin",
+) -> ShardedRunReport:
+    """Run a catalog with ``iter_sharded`` and merge its counts; pages are discarded."""
+    workers = workers or os.cpu_count() or 1
+    report = ShardedRunReport(workers=workers)
+    start = time.perf_counter()
+    for result in iter_sharded(products, goals, workers, chunk_size, cache_path, scheduler=scheduler):
+        report.merge(result)
+    report.elapsed = time.perf_counter() - start
+    return report
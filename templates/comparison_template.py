@@ -34,7 +34,7 @@ class ComparisonTemplate(BaseTemplate):
             "metadata": {
                 "last_updated": "2025-12-25",
                 "template": self.name,
-                "source_blocks": [b.block_type for b in content_blocks],
+                "source_blocks": self.source_blocks(content_blocks),
             },
         }
 
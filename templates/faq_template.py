@@ -1,10 +1,22 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from ..models import ContentBlock, GeneratedPage, ProductData, Question
 from .template_engine import BaseTemplate
 
 
+# ProductData fields each category's answers are built from.
+ANSWER_READS: Dict[str, FrozenSet[str]] = {
+    "informational": frozenset({"name", "concentration", "key_ingredients", "skin_types"}),
+    "usage": frozenset({"usage_instructions"}),
+    "safety": frozenset({"side_effects"}),
+    "purchase": frozenset({"price"}),
+    "comparison": frozenset({"name", "concentration", "key_ingredients", "benefits"}),
+}
+
+
 class FAQTemplate(BaseTemplate):
+    reads = frozenset().union(*ANSWER_READS.values())
+
     def __init__(self):
         super().__init__("faq")
 
@@ -13,6 +25,7 @@ class FAQTemplate(BaseTemplate):
         content_blocks: List[ContentBlock],
         questions: List[Question] = None,
         product_data: ProductData = None,
+        reuse_answers: Optional[Dict[Tuple[str, str], str]] = None,
         **kwargs,
     ) -> GeneratedPage:
         if questions is None:
@@ -21,13 +34,17 @@ class FAQTemplate(BaseTemplate):
         if product_data is None:
             raise ValueError("product_data is required for FAQ template")
 
+        # Answers carried over from a previous render, keyed by (category, question).
+        reuse_answers = reuse_answers or {}
+
         faq_items: List[Dict[str, Any]] = []
         for q in questions:
+            answer = reuse_answers.get((q.category.value, q.text))
             faq_items.append(
                 {
                     "id": 0,
                     "question": q.text,
-                    "answer": self._answer(q, product_data),
+                    "answer": answer if answer is not None else self._answer(q, product_data),
                     "category": q.category.value,
                     "priority": self._get_priority(q.category.value),
                 }
@@ -52,7 +69,7 @@ class FAQTemplate(BaseTemplate):
             "metadata": {
                 "last_updated": "2025-12-25",
                 "template": self.name,
-                "source_blocks": [b.block_type for b in content_blocks],
+                "source_blocks": self.source_blocks(content_blocks),
             },
         }
 
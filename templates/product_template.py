@@ -5,6 +5,8 @@ from .template_engine import BaseTemplate
 
 
 class ProductTemplate(BaseTemplate):
+    reads = frozenset({"name", "concentration", "skin_types", "price"})
+
     def __init__(self):
         super().__init__("product")
 
@@ -29,7 +31,7 @@ class ProductTemplate(BaseTemplate):
             "metadata": {
                 "last_updated": "2025-12-25",
                 "template": self.name,
-                "source_blocks": [b.block_type for b in content_blocks],
+                "source_blocks": self.source_blocks(content_blocks),
             },
         }
 
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 from ..models import ContentBlock, GeneratedPage
 
 
 class BaseTemplate(ABC):
+    # Bump when render() output changes for the same input; part of cache keys.
+    version = "2"
+    # ProductData fields render() reads directly (block contents aside).
+    reads: FrozenSet[str] = frozenset()
+
     def __init__(self, name: str):
         self.name = name
 
@@ -12,6 +17,11 @@ class BaseTemplate(ABC):
     def render(self, content_blocks: List[ContentBlock], **kwargs) -> GeneratedPage:
         raise NotImplementedError
 
+    @staticmethod
+    def source_blocks(content_blocks: List[ContentBlock]) -> List[str]:
+        """Block types the page was rendered from, for its metadata."""
+        return [b.block_type for b in content_blocks]
+
 
 class TemplateEngine:
     def __init__(self):
@@ -25,6 +35,11 @@ class TemplateEngine:
             "comparison": ComparisonTemplate(),
         }
 
+    def get_template(self, template_name: str) -> BaseTemplate:
+        if template_name not in self._templates:
+            raise ValueError(f"Unknown template: {template_name}")
+        return self._templates[template_name]
+
     def list_templates(self) -> List[str]:
         return sorted(self._templates.keys())
 
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from ..core import ConcurrentEventLoopOrchestrator, ContentCache, EventLoopOrchestrator, stable_hash, to_jsonable
+from ..run_pipeline import build_registry
+from .test_orchestrator import PAGES, _start
+
+
+def test_stable_hash_ignores_dict_order() -> None:
+    assert stable_hash("k", {"a": 1, "b": [1, 2]}) == stable_hash("k", {"b": [1, 2], "a": 1})
+    assert stable_hash("k", {"a": 1}) != stable_hash("k", {"a": 2})
+
+
+def test_memory_then_disk_hits(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    cache = ContentCache(path=path)
+    key = cache.key("kind", "1", {"x": 1})
+    assert cache.get_or_compute(key, lambda: {"v": 1}) == {"v": 1}
+    assert cache.get_or_compute(key, lambda: pytest.fail("recomputed")) == {"v": 1}
+    cache.close()
+    assert (cache.misses, cache.memory_hits) == (1, 1)
+
+    reopened = ContentCache(path=path)
+    assert reopened.get_or_compute(key, lambda: pytest.fail("recomputed")) == {"v": 1}
+    assert (reopened.disk_hits, reopened.misses) == (1, 0)
+    reopened.close()
+
+
+def test_lru_evicts_oldest_entry() -> None:
+    cache = ContentCache(max_entries=2)
+    for i in range(3):
+        cache.get_or_compute(str(i), lambda i=i: i)
+    assert cache.evictions == 1
+    cache.get_or_compute("0", lambda: "recomputed")
+    assert cache.misses == 4
+
+
+def test_pickled_copy_starts_empty_and_merges_back() -> None:
+    cache = ContentCache()
+    cache.get_or_compute("k", lambda: 1)
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.counts() == (0, 0, 0, 0)
+    copy.get_or_compute("k", lambda: 1)
+    cache.merge_counts(copy.counts())
+    assert cache.misses == 2
+
+
+def test_cached_pages_match_uncached(tmp_path: Path) -> None:
+    uncached = EventLoopOrchestrator(build_registry()).run(_start(), PAGES)
+    cache = ContentCache(path=tmp_path / "cache.db")
+    for _ in range(2):
+        bb = EventLoopOrchestrator(build_registry(cache)).run(_start(), PAGES)
+        assert {p: to_jsonable(bb.get(p)) for p in PAGES} == {p: to_jsonable(uncached.get(p)) for p in PAGES}
+    assert cache.memory_hits > 0
+    cache.close()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_runs_report_worker_cache_counts(tmp_path: Path, executor: str) -> None:
+    cache = ContentCache(path=tmp_path / "cache.db")
+    ConcurrentEventLoopOrchestrator(build_registry(cache), executor=executor, max_workers=2).run(_start(), PAGES)
+    first = cache.counts()
+    assert first[2] > 0
+    ConcurrentEventLoopOrchestrator(build_registry(cache), executor=executor, max_workers=2).run(_start(), PAGES)
+    memory_hits, disk_hits, misses, _ = cache.counts()
+    assert misses == first[2]
+    assert memory_hits + disk_hits - first[0] - first[1] >= first[2]
+    cache.close()
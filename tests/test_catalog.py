@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Dict, Iterator
+
+import pytest
+
+from ..agents.planner_agent import PIPELINE_PLAN
+from ..benchmarks.synthetic import synthetic_catalog
+from ..core import EventLoopOrchestrator, Message, make_policy, to_jsonable
+from ..run_pipeline import build_registry
+from .test_orchestrator import PAGES
+
+PRODUCTS = 12
+
+
+def _messages() -> Iterator[Message]:
+    for trace_id, raw in synthetic_catalog(PRODUCTS):
+        yield Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+
+
+def _single_product_pages() -> Dict[str, Any]:
+    pages: Dict[str, Any] = {}
+    for msg in _messages():
+        bb = EventLoopOrchestrator(build_registry()).run([msg], PAGES)
+        pages[msg.trace_id] = {page: to_jsonable(bb.get(page)) for page in PAGES}
+    return pages
+
+
+@pytest.mark.parametrize("scheduler", ["round-robin", "fifo", "priority", "goal-distance", "edf"])
+def test_interleaved_catalog_matches_one_run_per_product(scheduler: str) -> None:
+    orchestrator = EventLoopOrchestrator(build_registry(), partial(make_policy, scheduler, PIPELINE_PLAN))
+    finished: Dict[str, Any] = {}
+    for trace_id, bb in orchestrator.stream_catalog(_messages(), PAGES, max_in_flight=3):
+        assert bb.goals_satisfied()
+        assert trace_id not in finished
+        finished[trace_id] = {page: to_jsonable(bb.get(page)) for page in PAGES}
+    assert finished == _single_product_pages()
+
+
+def test_run_catalog_keeps_one_board_per_product() -> None:
+    root = EventLoopOrchestrator(build_registry()).run_catalog(_messages(), PAGES)
+    assert len(root.scopes) == PRODUCTS
+    assert len({id(bb) for bb in root.scopes.values()}) == PRODUCTS
+    names = {bb.get("product_data").name for bb in root.scopes.values()}
+    assert len(names) == PRODUCTS
+
+
+def test_max_in_flight_bounds_admitted_products() -> None:
+    admitted = []
+
+    def counting() -> Iterator[Message]:
+        for msg in _messages():
+            admitted.append(msg.trace_id)
+            yield msg
+
+    stream = EventLoopOrchestrator(build_registry()).stream_catalog(counting(), PAGES, max_in_flight=2)
+    next(stream)
+    assert len(admitted) <= 3
+    stream.close()
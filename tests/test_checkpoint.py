@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import pytest
+
+from ..agents.planner_agent import PIPELINE_PLAN
+from ..benchmarks.synthetic import synthetic_catalog
+from ..core import CheckpointStore, EventLoopOrchestrator, Message, make_policy, to_jsonable
+from ..run_pipeline import build_registry
+from .test_orchestrator import PAGES
+
+PRODUCTS = 20
+
+
+def _messages() -> Iterator[Message]:
+    for trace_id, raw in synthetic_catalog(PRODUCTS):
+        yield Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+
+
+def _pages(finished: Iterator[Any]) -> Dict[str, Any]:
+    return {trace_id: {page: to_jsonable(bb.get(page)) for page in PAGES} for trace_id, bb in finished}
+
+
+@pytest.mark.parametrize("scheduler", [None, "edf"])
+def test_resumed_run_finishes_every_product_with_the_same_pages(tmp_path: Path, scheduler: Optional[str]) -> None:
+    policy = partial(make_policy, scheduler, PIPELINE_PLAN) if scheduler else None
+    expected = _pages(EventLoopOrchestrator(build_registry(), policy).stream_catalog(_messages(), PAGES, max_in_flight=4))
+
+    store = CheckpointStore(tmp_path / "run.ckpt", interval=7)
+    first = EventLoopOrchestrator(build_registry(), policy).stream_catalog(_messages(), PAGES, 4, store)
+    before = _pages(islice(first, PRODUCTS // 2))
+    first.close()  # interrupted mid-run
+    assert store.path.exists()
+    checkpointed = store.load(build_registry()).completed
+    assert checkpointed and checkpointed <= set(before)
+
+    resumed = _pages(EventLoopOrchestrator(build_registry(), policy).stream_catalog(_messages(), PAGES, 4, store))
+    assert not checkpointed & set(resumed)
+    assert set(resumed) | checkpointed == set(expected)
+    for trace_id, pages in {**before, **resumed}.items():
+        assert pages == expected[trace_id]
+    assert not store.path.exists()  # cleared once the run finished
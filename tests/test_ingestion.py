@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from ..ingestion import IngestionReport, iter_catalog
+from .test_orchestrator import PRODUCT
+
+BAD = [{"Price": "₹1"}, "not a product", {**PRODUCT, "Benefits": {"nested": True}}]
+
+
+def _write(path: Path, records: List[Any]) -> Path:
+    if path.suffix == ".json":
+        path.write_text(json.dumps(records), encoding="utf-8")
+    else:
+        path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_bad_records_are_skipped_and_reported(tmp_path: Path, suffix: str) -> None:
+    path = _write(tmp_path / f"catalog{suffix}", [PRODUCT, *BAD, PRODUCT])
+    report = IngestionReport()
+    records = list(iter_catalog(path, report))
+    assert [trace_id for trace_id, _ in records] == ["product-1", "product-5"]
+    assert (report.read, report.accepted, report.skipped) == (5, 2, 3)
+    assert [error.line for error in report.errors] == [2, 3, 4]
+
+
+def test_csv_rows_are_validated(tmp_path: Path) -> None:
+    path = tmp_path / "catalog.csv"
+    columns = list(PRODUCT)
+    rows = [",".join(columns), ",".join(f'"{PRODUCT[c]}"' for c in columns), ",x,y"]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    report = IngestionReport()
+    assert [trace_id for trace_id, _ in iter_catalog(path, report)] == ["product-2"]
+    assert report.skipped == 1 and report.errors[0].reason == "missing Product Name"
+
+
+def test_json_catalog_must_be_an_array(tmp_path: Path) -> None:
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(PRODUCT), encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_catalog(path))
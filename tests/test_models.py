@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from ..agents.parser_agent import parse_product
+from ..core import Message
+from ..models import ContentBlock, GeneratedPage, ProductData, Question, QuestionCategory
+from .test_orchestrator import PRODUCT
+
+
+@pytest.mark.parametrize("model", [ProductData, Question, ContentBlock, GeneratedPage, Message])
+def test_models_are_slotted(model: type) -> None:
+    assert "__slots__" in vars(model)
+    assert "__dict__" not in dir(model)
+
+
+def test_parsed_list_values_are_interned() -> None:
+    first = parse_product(dict(PRODUCT))
+    second = parse_product({**PRODUCT, "Product Name": "Other", "Skin Type": "Combination, Dry"})
+    assert first.skin_types == ["Oily", "Combination"]
+    assert first.skin_types[1] is second.skin_types[0]
+    assert first.key_ingredients[0] is second.key_ingredients[0]
+
+
+def test_slotted_models_pickle_and_compare_by_value() -> None:
+    question = Question("What is it?", QuestionCategory.INFORMATIONAL)
+    product = parse_product(dict(PRODUCT))
+    for obj in (question, product, Message(type="start", payload={"k": 1}, source="User")):
+        assert pickle.loads(pickle.dumps(obj)) == obj
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from ..core import (
+    Agent,
+    AgentRegistry,
+    AsyncEventLoopOrchestrator,
+    Blackboard,
+    ConcurrentEventLoopOrchestrator,
+    EventLoopOrchestrator,
+    Message,
+    to_jsonable,
+)
+from ..run_pipeline import build_registry
+
+PAGES = ["faq.json", "product_page.json", "comparison_page.json"]
+
+PRODUCT = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699",
+}
+
+
+def _start() -> List[Message]:
+    payload = {"raw_product_data": PRODUCT, "competitor_data": None}
+    return [Message(type="start", payload=payload, source="User", trace_id="run-1")]
+
+
+def _pages(bb: Blackboard) -> Dict[str, Any]:
+    return {page: to_jsonable(bb.get(page)) for page in PAGES}
+
+
+def _sequential_pages() -> Dict[str, Any]:
+    bb = EventLoopOrchestrator(build_registry()).run(_start(), PAGES)
+    assert bb.goals_satisfied()
+    return _pages(bb)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_pages_match_sequential(executor: str) -> None:
+    orchestrator = ConcurrentEventLoopOrchestrator(build_registry(), executor=executor, max_workers=2)
+    bb = orchestrator.run(_start(), PAGES)
+    assert bb.goals_satisfied()
+    assert _pages(bb) == _sequential_pages()
+
+
+def test_concurrent_event_log_is_deterministic() -> None:
+    def events() -> List[Any]:
+        bb = ConcurrentEventLoopOrchestrator(build_registry(), max_workers=4).run(_start(), PAGES)
+        return [(e.get("event"), e.get("type"), e.get("key")) for e in bb.event_log]
+
+    assert events() == events()
+
+
+def test_async_pages_match_sequential() -> None:
+    bb = asyncio.run(AsyncEventLoopOrchestrator(build_registry()).run(_start(), PAGES))
+    assert bb.goals_satisfied()
+    assert _pages(bb) == _sequential_pages()
+
+
+class _Writer(Agent):
+    name = "Writer"
+    subscriptions = ("write",)
+    parallel_safe = True
+
+    def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
+        return message.type == "write"
+
+    def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+        blackboard.put("written", True, producer=self.name)
+        return []
+
+
+class _SlowReader(Agent):
+    name = "SlowReader"
+    subscriptions = ("read",)
+    parallel_safe = True
+
+    def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
+        return message.type == "read"
+
+    def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+        # Still running after the writer's result is back.
+        time.sleep(0.1)
+        blackboard.put("reader_saw_write", blackboard.has("written"), producer=self.name)
+        return []
+
+
+def test_wave_agents_do_not_see_each_others_writes() -> None:
+    registry = AgentRegistry()
+    registry.register(_Writer())
+    registry.register(_SlowReader())
+    orchestrator = ConcurrentEventLoopOrchestrator(registry, max_workers=2)
+    messages = [Message(type=t, payload={}, source="User", trace_id="run-1") for t in ("write", "read")]
+    bb = orchestrator.run(messages, ["written", "reader_saw_write"])
+    assert bb.get("written") is True
+    assert bb.get("reader_saw_write") is False
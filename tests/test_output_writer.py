@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import output_writer
+from ..output_writer import OutputWriter, shard_dir
+
+
+@pytest.mark.parametrize("durable", [False, True])
+def test_pages_are_written_whole_and_temp_files_removed(tmp_path: Path, durable: bool) -> None:
+    with OutputWriter(batch_size=4, durable=durable) as writer:
+        for i in range(10):
+            writer.write_json(shard_dir(tmp_path, f"product-{i}") / "page.json", {"i": i})
+    for i in range(10):
+        assert json.loads((shard_dir(tmp_path, f"product-{i}") / "page.json").read_text(encoding="utf-8")) == {"i": i}
+    assert not list(tmp_path.rglob("*.tmp"))
+    stats = writer.stats
+    assert stats.files == 10 and stats.batches >= 3
+    if durable:
+        directories = len({shard_dir(tmp_path, f"product-{i}") for i in range(10)})
+        assert stats.fsyncs == 10 + directories
+    else:
+        assert stats.fsyncs == 0
+
+
+def test_durable_batch_is_written_before_it_is_synced(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Non-empty temp files each time a file of the batch is synced.
+    written_at_sync: List[int] = []
+    monkeypatch.setattr(
+        output_writer, "_datasync", lambda fd: written_at_sync.append(sum(1 for p in tmp_path.glob("*.tmp") if p.stat().st_size))
+    )
+    writer = OutputWriter(durable=True)
+    writer._write_batch([(tmp_path / f"{i}.json", "{}") for i in range(4)])
+    writer.close()
+    assert written_at_sync == [4, 4, 4, 4]
+    assert len(list(tmp_path.glob("*.json"))) == 4
+
+
+def test_write_errors_surface_to_the_producer(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    writer = OutputWriter()
+    writer.write(blocker / "page.json", "{}")
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+
+def test_shard_dir_width() -> None:
+    root = Path("out")
+    assert shard_dir(root, "product-1", 0) == root / "product-1"
+    assert len(shard_dir(root, "product-1", 3).parent.name) == 3
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import List
+
+from ..core import Blackboard, EventLoopOrchestrator
+from ..run_pipeline import build_registry
+from .test_orchestrator import _start
+
+
+def _run(goals: List[str]) -> Blackboard:
+    return EventLoopOrchestrator(build_registry()).run(_start(), goals)
+
+
+def test_faq_only_run_builds_no_blocks() -> None:
+    bb = _run(["faq.json"])
+    assert bb.goals_satisfied()
+    assert not [key for key in bb.artifacts if key.startswith("block:")]
+    assert "product_page.json" not in bb.artifacts and "comparison_page.json" not in bb.artifacts
+    assert bb.get("faq.json")["metadata"]["source_blocks"] == []
+
+
+def test_comparison_only_run_builds_only_the_comparison_block() -> None:
+    bb = _run(["comparison_page.json"])
+    assert bb.goals_satisfied()
+    assert [key for key in bb.artifacts if key.startswith("block:")] == ["block:comparison"]
+    assert "questions" not in bb.artifacts
+    assert bb.get("comparison_page.json")["metadata"]["source_blocks"] == ["comparison"]
+
+
+def test_pruned_pages_match_a_full_run() -> None:
+    full = _run(["faq.json", "product_page.json", "comparison_page.json", "graph.json"])
+    for page in ("faq.json", "product_page.json", "comparison_page.json"):
+        assert _run([page]).get(page) == full.get(page)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import List
+
+from ..core import Agent, AgentRegistry, Blackboard, EventLoopOrchestrator, Message
+from ..run_pipeline import build_registry
+from .test_orchestrator import PAGES, _start
+
+
+class _Everything(Agent):
+    name = "Everything"
+
+    def can_handle(self, message: Message, blackboard: Blackboard) -> bool:
+        return True
+
+    def handle(self, message: Message, blackboard: Blackboard) -> List[Message]:
+        return []
+
+
+class _Prefix(_Everything):
+    name = "Prefix"
+    subscriptions = ("render_page:*",)
+
+
+class _Exact(_Everything):
+    name = "Exact"
+    subscriptions = ("parse_product",)
+
+
+def test_candidates_follow_subscriptions_in_registration_order() -> None:
+    registry = AgentRegistry([_Exact(), _Everything(), _Prefix()])
+    assert [a.name for a in registry.candidates("parse_product")] == ["Exact", "Everything"]
+    assert [a.name for a in registry.candidates("render_page:faq")] == ["Everything", "Prefix"]
+    assert [a.name for a in registry.candidates("other")] == ["Everything"]
+
+
+def test_indexed_routing_matches_full_scan_over_a_pipeline_run() -> None:
+    registry = build_registry()
+    routed = []
+    match = registry.match
+
+    def checked_match(message: Message, blackboard: Blackboard) -> List[Agent]:
+        handlers = match(message, blackboard)
+        assert handlers == [a for a in registry.agents if a.can_handle(message, blackboard)]
+        routed.append(message.type)
+        return handlers
+
+    registry.match = checked_match
+    bb = EventLoopOrchestrator(registry).run(_start(), PAGES)
+    assert bb.goals_satisfied()
+    assert "render_page:faq" in routed
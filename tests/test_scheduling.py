@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pickle
+from typing import List, Optional
+
+import pytest
+
+from ..core import EDFPolicy, FIFOPolicy, Message, PriorityPolicy, RoundRobinPolicy, SchedulingPolicy
+
+
+def _msg(trace_id: str, type: str = "work", deadline: Optional[float] = None) -> Message:
+    payload = {} if deadline is None else {"deadline": deadline}
+    return Message(type=type, payload=payload, source="test", trace_id=trace_id)
+
+
+def _drain(policy: SchedulingPolicy) -> List[str]:
+    return [policy.pop().trace_id for _ in range(len(policy))]
+
+
+def test_round_robin_alternates_products() -> None:
+    policy = RoundRobinPolicy()
+    for trace_id in "aaab":
+        policy.push(_msg(trace_id))
+    assert _drain(policy) == ["a", "b", "a", "a"]
+
+
+def test_edf_runs_earliest_deadline_first_and_unset_last() -> None:
+    policy = EDFPolicy()
+    policy.push(_msg("none"))
+    policy.push(_msg("late", deadline=5))
+    policy.push(_msg("early", deadline=1))
+    policy.push(_msg("late"))  # later messages keep the product's first deadline
+    assert _drain(policy) == ["early", "late", "late", "none"]
+
+
+@pytest.mark.parametrize("policy_type", [RoundRobinPolicy, PriorityPolicy, EDFPolicy])
+def test_drop_forgets_a_products_queued_messages(policy_type: type) -> None:
+    policy = policy_type()
+    for i in range(3):
+        for trace_id in "abc":
+            policy.push(_msg(trace_id, deadline=i))
+    policy.drop("b")
+    assert len(policy) == 6
+    policy.push(_msg("b", deadline=0))  # a product may be readmitted after a drop
+    assert len(policy) == 7
+    assert sorted(_drain(policy)) == ["a", "a", "a", "b", "c", "c", "c"]
+    assert len(policy) == 0
+
+
+def test_priority_drop_compacts_dead_entries() -> None:
+    policy = PriorityPolicy()
+    for trace_id in "abcd":
+        for _ in range(10):
+            policy.push(_msg(trace_id))
+    for trace_id in "abc":
+        policy.drop(trace_id)
+    assert len(policy) == 10
+    assert len(policy._heap) <= 2 * len(policy)
+    assert set(_drain(policy)) == {"d"}
+
+
+@pytest.mark.parametrize("policy_type", [FIFOPolicy, RoundRobinPolicy, PriorityPolicy, EDFPolicy])
+def test_policies_survive_a_checkpoint_round_trip(policy_type: type) -> None:
+    policy = policy_type()
+    for trace_id in "ab":
+        policy.push(_msg(trace_id, deadline=1))
+    policy.drop("a")
+    restored = pickle.loads(pickle.dumps(policy))
+    assert len(restored) == len(policy) and _drain(restored) == _drain(policy)
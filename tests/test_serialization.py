@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+import pytest
+
+from ..benchmarks.bench_serialization import _legacy_to_jsonable
+from ..benchmarks.synthetic import synthetic_catalog
+from ..core import EventLoopOrchestrator, Message, encode_json, to_jsonable
+from ..core.orchestrator import blackboard_to_artifacts
+from ..models import QuestionCategory
+from ..run_pipeline import build_registry
+from .test_orchestrator import PAGES
+
+
+def _boards() -> List[Any]:
+    messages = (
+        Message(type="start", payload={"raw_product_data": raw, "competitor_data": None}, source="User", trace_id=trace_id)
+        for trace_id, raw in synthetic_catalog(5)
+    )
+    return [bb for _, bb in EventLoopOrchestrator(build_registry()).stream_catalog(messages, PAGES)]
+
+
+@dataclass
+class _Odd:
+    pair: Tuple[int, str]
+    nested: Any = None
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_encode_json_matches_legacy_path_on_pipeline_artifacts(indent: Any, sort_keys: bool) -> None:
+    separators = (",", ":") if indent is None else None
+    for bb in _boards():
+        artifacts = dict(bb.artifacts)
+        legacy = _legacy_to_jsonable(artifacts)
+        assert to_jsonable(artifacts) == legacy
+        expected = json.dumps(legacy, ensure_ascii=False, indent=indent, sort_keys=sort_keys, separators=separators)
+        assert encode_json(artifacts, indent=indent, sort_keys=sort_keys) == expected.encode("utf-8")
+
+
+def test_to_jsonable_matches_legacy_on_edge_cases() -> None:
+    for obj in [_Odd((1, "a")), _Odd((2, "b"), [_Odd((3, "c"))]), {1: (1, 2)}, QuestionCategory.USAGE, 1.5, None]:
+        assert to_jsonable(obj) == _legacy_to_jsonable(obj)
+
+
+def test_blackboard_to_artifacts_encodes_every_artifact() -> None:
+    bb = _boards()[0]
+    assert blackboard_to_artifacts(bb) == _legacy_to_jsonable(dict(bb.artifacts))
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ..benchmarks.synthetic import synthetic_catalog
+from ..run_pipeline import main
+from ..sharded_runner import iter_sharded, run_sharded
+from .test_orchestrator import PAGES
+
+PRODUCTS = 10
+
+
+def test_report_counts_products_without_keeping_pages() -> None:
+    report = run_sharded(synthetic_catalog(PRODUCTS), PAGES, workers=2, chunk_size=3)
+    assert (report.products, report.completed, report.chunks) == (PRODUCTS, PRODUCTS, 4)
+    assert not report.failed
+    assert not hasattr(report, "pages")
+
+
+def test_worker_cache_counts_are_returned(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    first = run_sharded(synthetic_catalog(PRODUCTS), PAGES, workers=2, chunk_size=5, cache_path=path)
+    second = run_sharded(synthetic_catalog(PRODUCTS), PAGES, workers=2, chunk_size=5, cache_path=path)
+    assert first.cache_counts[2] > 0
+    assert second.cache_counts[2] == 0 and second.cache_counts[1] == first.cache_counts[2]
+
+
+def test_scheduler_reaches_workers() -> None:
+    results = list(iter_sharded(synthetic_catalog(4), PAGES, workers=1, chunk_size=4, scheduler="edf"))
+    assert [sorted(r.pages) for r in results] == [sorted(trace_id for trace_id, _ in synthetic_catalog(4))]
+
+
+@pytest.mark.parametrize("flag", [["--trace", "t.json"], ["--metrics", "m.prom"], ["--checkpoint", "c.ckpt"], ["--memory-report"]])
+def test_in_process_only_options_are_rejected(tmp_path: Path, flag: List[str], capsys: pytest.CaptureFixture) -> None:
+    with pytest.raises(SystemExit):
+        main(["--catalog", str(tmp_path / "catalog.json"), "--workers", "2", *flag])
+    assert "not supported with --catalog --workers" in capsys.readouterr().err